@@ -1 +1,25 @@
-from .wrappers import *
\ No newline at end of file
+# Public names are resolved on first access by the sub-package wrappers, which imports its 
+# submodules on demand (PEP 562).
+
+import importlib
+
+
+
+__all__ = importlib.import_module('.wrappers', __name__).__all__
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def __getattr__(p_name : str):
+    if p_name not in __all__:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(p_name))
+
+    value = getattr(importlib.import_module('.wrappers', __name__), p_name)
+    globals()[p_name] = value
+    return value
+
+
+## -------------------------------------------------------------------------------------------------
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
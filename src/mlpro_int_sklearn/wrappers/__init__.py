@@ -1,3 +1,47 @@
-from .basics import *
-from .streams import *
-from .anomalydetectors import *
\ No newline at end of file
+# Submodules are imported on first access of one of their public names (PEP 562), so that e.g. a 
+# process using the streams only does not import the anomaly detectors and the MLPro stream task
+# stack they depend on.
+
+import importlib
+
+
+
+# Public names of the submodules, which have to match their __all__ lists (checked by howto 
+# bf_streams_018)
+_exports = { 'basics'           : [ 'WrapperSklearn',
+                                    'LazyModuleSklearn' ],
+             'streams'          : [ 'WrStreamProviderSklearn',
+                                    'DatasetCacheSklearn',
+                                    'LazyFeatureSpaceSklearn',
+                                    'SparseElementSklearn',
+                                    'InstancePoolSklearn',
+                                    'WrStreamGeneratorSklearn',
+                                    'WrStreamSvmlightSklearn',
+                                    'WrStreamCompositeSklearn' ],
+             'anomalydetectors' : [ 'WrAnomalyDetectorSklearn2MLPro' ] }
+
+_submodules = { name : submodule for submodule, names in _exports.items() for name in names }
+
+__all__ = list(_submodules.keys())
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def __getattr__(p_name : str):
+    if p_name in _exports:
+        return importlib.import_module('.' + p_name, __name__)
+
+    try:
+        submodule = _submodules[p_name]
+    except KeyError:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(p_name))
+
+    value = getattr(importlib.import_module('.' + submodule, __name__), p_name)
+    globals()[p_name] = value
+    return value
+
+
+## -------------------------------------------------------------------------------------------------
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__) | set(_exports.keys()))
@@ -1 +1,2 @@
-from .basics import *
\ No newline at end of file
+from .basics import *
+from .basics import __all__
\ No newline at end of file
@@ -20,10 +20,19 @@
 ## -- 2025-06-12  2.3.0     DA/DS    - Alignment with MLPro 2.0.2
 ## --                                - Rework and optimization
 ## -- 2025-07-23  2.4.0     DA       Refactoring 
+## -- 2026-10-16  2.5.0     DA       New novelty engine with periodic refit and per-instance scoring
+## -- 2026-10-16  2.6.0     DA       Sliding window as mirrored ring buffer without shifting
+## -- 2026-10-16  2.7.0     DA       - Anomaly scores attached to raised point anomalies
+## --                                - New optional threshold on anomaly scores
+## -- 2026-10-16  2.8.0     DA       Asynchronous detection in a thread or process pool
+## -- 2026-10-16  2.9.0     DA       Instance buffer adopts the floating point type of the features
+## -- 2026-10-16  2.9.1     DA       Shutdown of the asynchronous detection pool by methods 
+## --                                flush_detections() and reset()
+## -- 2026-10-17  2.9.2     DA       Novelty engine fits on a snapshot of the instance buffer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.4.0 (2025-07-23)
+Ver. 2.9.2 (2026-10-17)
 
 This module provides wrapper root classes from Scikit-learn to MLPro, specifically for anomaly detectors. 
 
@@ -32,8 +41,11 @@ https://scikit-learn.org/stable/modules/outlier_detection.html
 
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 import numpy as np
-from sklearn.base import OutlierMixin
+from sklearn.base import OutlierMixin, clone
 
 from mlpro.bf import Log, ParamError
 from mlpro.bf.streams import StreamTask, Instance
@@ -55,8 +67,31 @@ __all__ = [ 'WrAnomalyDetectorSklearn2MLPro' ]
 class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
     """
     MLPro's wrapper for anomaly detectors of the scikit-learn project. The wrapper is limited to 
-    detectors of type 'OutlierMixin' providing the method fit_predict() for a mixed data 
-    training/prediction. 
+    detectors of type 'OutlierMixin'. Two detection engines are available:
+
+    - C_ENGINE_FIT_PREDICT: the method fit_predict() is applied to the instance buffer at each 
+      detection step for a mixed data training/prediction. 
+    - C_ENGINE_NOVELTY: the detector is fitted on the instance buffer periodically by method fit().
+      In between, each incoming instance is scored by method predict() of the recently fitted 
+      detector. This requires detectors supporting novelty detection, like LocalOutlierFactor with
+      novelty=True, IsolationForest or EllipticEnvelope.
+
+    Anomaly scores are determined in the same pass as the labels and follow the convention of the 
+    scikit-learn method decision_function(): negative values indicate outliers. They are taken from
+    decision_function() or, for LocalOutlierFactor in outlier detection mode, from the attribute
+    negative_outlier_factor_ shifted by offset_. Each raised point anomaly carries its score as
+    keyword argument 'p_score'. Optionally, anomalies can be determined by a custom threshold on 
+    the scores instead of the labels of the detector, which allows to tune the sensitivity without
+    refitting.
+
+    The fit_predict engine can optionally be executed asynchronously. Then, snapshots of the instance
+    buffer are submitted to a thread or process pool at each detection step and the related 
+    anomalies are raised in submission order as soon as the results are available. If the maximum
+    number of pending detections is reached, the next detection step waits for the oldest one 
+    (back-pressure). At the end of a stream, method flush_detections() needs to be called to wait
+    for all pending detections and to raise their anomalies. It shuts the pool down as well. A 
+    reset of the task (e.g. by its stream workflow) discards pending detections and shuts the pool
+    down. The pool is recreated on demand.
 
     Parameters
     ----------
@@ -78,6 +113,21 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
         Detection steprate in the interval [1,p_instance_buffer_size].
     p_group_anomaly_det : bool
         Paramter to activate group anomaly detection. Default is True.
+    p_engine : str
+        Detection engine. See constants C_ENGINE_*. Default is C_ENGINE_FIT_PREDICT.
+    p_refit_steprate : int
+        Number of instances between two fits of the novelty engine. Default = None (instance buffer
+        size).
+    p_score_threshold : float
+        Optional threshold on the anomaly scores. Instances with a score below the threshold are 
+        raised as anomalies. Default = None (labels of the scikit-learn detector, which is 
+        equivalent to threshold 0).
+    p_detection_range : int
+        Asynchronous execution of the fit_predict engine. Possible values are C_RANGE_NONE 
+        (synchronous), C_RANGE_THREAD (thread pool) and C_RANGE_PROCESS (process pool). 
+        Default = C_RANGE_NONE.
+    p_max_pending : int
+        Maximum number of pending asynchronous detections and number of pool workers. Default = 2.
 
     Notes
     -----
@@ -96,7 +146,10 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
         - GroupAnomaly
     """
 
-    C_TYPE = 'Anomaly Detector (scikit-learn)'
+    C_TYPE                  = 'Anomaly Detector (scikit-learn)'
+
+    C_ENGINE_FIT_PREDICT    = 'fit_predict'
+    C_ENGINE_NOVELTY        = 'novelty'
 
 ## -------------------------------------------------------------------------------------------------
     def __init__( self, 
@@ -109,6 +162,11 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
                   p_instance_buffer_size : int = 20,
                   p_detection_steprate : int = 1,
                   p_group_anomaly_det : bool = True, 
+                  p_engine : str = C_ENGINE_FIT_PREDICT,
+                  p_refit_steprate : int = None,
+                  p_score_threshold : float = None,
+                  p_detection_range : int = StreamTask.C_RANGE_NONE,
+                  p_max_pending : int = 2,
                   **p_kwargs ):
         
         WrapperSklearn.__init__( self, p_logging = p_logging )
@@ -127,19 +185,58 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
         
         if ( p_detection_steprate > p_instance_buffer_size ) or ( p_detection_steprate < 1 ):
             raise ParamError('Please set the parameter "p_detection_steprate" >= 1 and <= "p_instance_buffer_size"')
+
+        if p_engine == self.C_ENGINE_NOVELTY:
+            if not hasattr(p_algo_scikit_learn, 'predict'):
+                raise ParamError('The novelty engine requires a scikit-learn algorithm providing method predict() (e.g. LOF with novelty=True)')
+        elif p_engine != self.C_ENGINE_FIT_PREDICT:
+            raise ParamError('Invalid engine "' + str(p_engine) + '". See constants C_ENGINE_*')
+
+        if p_refit_steprate is None: p_refit_steprate = p_instance_buffer_size
+        if p_refit_steprate < 1:
+            raise ParamError('Please set the parameter "p_refit_steprate" >= 1')
+
+        if p_detection_range not in [ self.C_RANGE_NONE, self.C_RANGE_THREAD, self.C_RANGE_PROCESS ]:
+            raise ParamError('Invalid detection range ' + str(p_detection_range) + '. See constants C_RANGE_*')
+
+        if ( p_detection_range != self.C_RANGE_NONE ) and ( p_engine != self.C_ENGINE_FIT_PREDICT ):
+            raise ParamError('Asynchronous detection is supported by engine C_ENGINE_FIT_PREDICT only')
+
+        if p_max_pending < 1:
+            raise ParamError('Please set the parameter "p_max_pending" >= 1')
         
         self._algo_scikitlearn          = p_algo_scikit_learn
         self._inst_buffer_size          = p_instance_buffer_size
         self._detection_steprate        = p_detection_steprate
         self._inst_counter              = 0
 
+        self._engine                    = p_engine
+        self._refit_steprate            = p_refit_steprate
+        self._fitted                    = False
+        self._score_threshold           = p_score_threshold
+
+        self._detection_range           = p_detection_range
+        self._max_pending               = p_max_pending
+        self._executor                  = None
+        self._pending                   = deque()
+        self._raised_ids                = set()
+
+        self._block_mode = ( self._detection_steprate == self._inst_buffer_size )
+
+        # In sliding window mode, the buffers are mirrored ring buffers of double length. Each entry
+        # is stored at positions i and i + buffer size, so that the current window is always 
+        # available as a contiguous view without shifting the buffer content.
+        self._mirrored = ( self._engine == self.C_ENGINE_FIT_PREDICT ) and not self._block_mode
+        if self._mirrored:
+            self._inst_buffer_len = 2 * self._inst_buffer_size
+        else:
+            self._inst_buffer_len = self._inst_buffer_size
+
         self._inst_data_buffer : np.ndarray  = None
         self._inst_data_buffer_full : bool   = False
-        self._inst_ref_buffer : np.ndarray   = np.empty(self._inst_buffer_size, dtype = object)
+        self._inst_ref_buffer : np.ndarray   = np.empty(self._inst_buffer_len, dtype = object)
 
         self._inst_buffer_pos : int          = 0
-
-        self._block_mode = ( self._detection_steprate == self._inst_buffer_size )
         
 
 ## -------------------------------------------------------------------------------------------------
@@ -153,7 +250,15 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
 
         # 2 Preparation of instance data buffer
         if self._inst_data_buffer is None:
-            self._inst_data_buffer = np.empty((self._inst_buffer_size, num_features))
+            # Floating point features (e.g. float32) keep their type, all others become float64
+            dtype = np.asarray(feature_values).dtype
+            if not np.issubdtype(dtype, np.floating): dtype = np.float64
+            self._inst_data_buffer = np.empty((self._inst_buffer_len, num_features), dtype=dtype)
+
+        if self._engine == self.C_ENGINE_NOVELTY:
+            return self._detect_novelty(p_instance=p_instance, p_feature_values=feature_values)
+
+        if self._pending: self._collect_detections(p_wait=False)
 
 
         # 3 Update the instance buffer
@@ -165,47 +270,290 @@ class WrAnomalyDetectorSklearn2MLPro (AnomalyDetectorIBPG, WrapperSklearn):
             self._inst_buffer_pos = ( self._inst_buffer_pos + 1 ) % self._inst_buffer_size
             if self._inst_buffer_pos != 0: return
 
+            window_start = 0
+
         else:
-            # 3.2 Here, the buffer is used as a sliding window. Anomaly detection takes place,
-            #     once the buffer is filled and the given step rate has been reached.
+            # 3.2 Here, the buffer is used as a sliding window on a mirrored ring buffer. Anomaly 
+            #     detection takes place, once the buffer is filled and the given step rate has been
+            #     reached.
+            pos        = self._inst_buffer_pos
+            pos_mirror = pos + self._inst_buffer_size
+            self._inst_data_buffer[pos]        = feature_values
+            self._inst_data_buffer[pos_mirror] = feature_values
+            self._inst_ref_buffer[pos]         = p_instance
+            self._inst_ref_buffer[pos_mirror]  = p_instance
+            self._inst_buffer_pos = ( pos + 1 ) % self._inst_buffer_size
+
             if self._inst_data_buffer_full:
-                # 3.2.1 Buffer full -> inplace shift left and new entry on the right
-                self._inst_data_buffer[:-1] = self._inst_data_buffer[1:] 
-                self._inst_data_buffer[self._inst_buffer_size -1] = feature_values
-                self._inst_ref_buffer[:-1] = self._inst_ref_buffer[1:] 
-                self._inst_ref_buffer[self._inst_buffer_size -1] = p_instance
+                # 3.2.1 Buffer full -> detection according to the step rate
                 self._inst_counter = ( self._inst_counter + 1 ) % self._detection_steprate
-
                 if self._inst_counter != 0: return
 
             else:
                 # 3.2.2 Buffer to be filled
-                self._inst_data_buffer[self._inst_buffer_pos] = feature_values
-                self._inst_ref_buffer[self._inst_buffer_pos] = p_instance
-                self._inst_buffer_pos = ( self._inst_buffer_pos + 1 ) % self._inst_buffer_size
-
                 if self._inst_buffer_pos != 0: return
-
                 self._inst_data_buffer_full = True
 
+            # 3.2.3 The oldest entry of the window is located at the next write position
+            window_start = self._inst_buffer_pos
+
+
+        # 4 Anomaly detection on a contiguous view of the current window
+        window_end       = window_start + self._inst_buffer_size
+        window           = self._inst_data_buffer[window_start:window_end]
 
-        # 4 Anomaly detection
-        scores = self._algo_scikitlearn.fit_predict(self._inst_data_buffer)
+        if self._detection_range != self.C_RANGE_NONE:
+            return self._submit_detection( p_data = window.copy(), 
+                                           p_instances = self._inst_ref_buffer[window_start:window_end].copy() )
+
+        outliers, scores = self._fit_score(p_data=window)
         
         # 4.1 Check for anomalies in scores
-        for i in np.where(scores == -1)[0]:
-            related_instance = self._inst_ref_buffer[i]
+        for i in np.where(outliers)[0]:
+            pos              = window_start + i
+            related_instance = self._inst_ref_buffer[pos]
 
             if not self._block_mode:
                 # 4.1.1 In case of sliding window, multiple raise of anomalies for the same instance
                 #       needs to be avoided.
                 if related_instance is np.nan: continue
-                self._inst_ref_buffer[i] = np.nan
+                pos = pos % self._inst_buffer_size
+                self._inst_ref_buffer[pos] = np.nan
+                self._inst_ref_buffer[pos + self._inst_buffer_size] = np.nan
+
+            anomaly = PointAnomaly( p_status = True,
+                                    p_tstamp = related_instance.tstamp,
+                                    p_visualize = self.get_visualization(), 
+                                    p_raising_object = self,
+                                    p_instances = [related_instance],
+                                    p_score = None if scores is None else scores[i] )
+            
+            self._raise_anomaly_event( p_anomaly = anomaly, p_instance = p_instance )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect_novelty(self, p_instance : Instance, p_feature_values):
+        """
+        Detection engine C_ENGINE_NOVELTY. The instance buffer is used as an inplace ring buffer,
+        since the order of the buffered instances is irrelevant for fitting.
+        """
+
+        # 1 Update the instance buffer
+        pos = self._inst_buffer_pos
+        self._inst_data_buffer[pos] = p_feature_values
+        self._inst_buffer_pos = ( pos + 1 ) % self._inst_buffer_size
+
+
+        # 2 Scoring of the new instance by the recently fitted detector
+        if self._fitted:
+            outliers, scores = self._score(p_data=self._inst_data_buffer[pos:pos+1])
+
+            if outliers[0]:
+                anomaly = PointAnomaly( p_status = True,
+                                        p_tstamp = p_instance.tstamp,
+                                        p_visualize = self.get_visualization(), 
+                                        p_raising_object = self,
+                                        p_instances = [p_instance],
+                                        p_score = None if scores is None else scores[0] )
+                
+                self._raise_anomaly_event( p_anomaly = anomaly, p_instance = p_instance )
+
+
+        # 3 Periodic (re)fit of the detector on a snapshot of the buffer as soon as the buffer is 
+        #   filled (detectors like LOF keep their training data, which must not change until refit)
+        if not self._inst_data_buffer_full:
+            if self._inst_buffer_pos != 0: return
+            self._inst_data_buffer_full = True
+
+        elif self._fitted:
+            self._inst_counter = ( self._inst_counter + 1 ) % self._refit_steprate
+            if self._inst_counter != 0: return
+
+        self._algo_scikitlearn.fit(self._inst_data_buffer.copy())
+        self._fitted = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_outliers(self, p_labels : np.ndarray, p_scores : np.ndarray) -> np.ndarray:
+        if ( self._score_threshold is None ) or ( p_scores is None ): 
+            return p_labels == -1
+        
+        return p_scores < self._score_threshold
+
+
+## -------------------------------------------------------------------------------------------------
+    def _fit_score(self, p_data : np.ndarray):
+        """
+        Fits the detector on the given data and determines outliers and anomaly scores of the same
+        data in one pass.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Data to be fitted and scored.
+
+        Returns
+        -------
+        outliers : np.ndarray
+            Boolean array marking the outliers.
+        scores : np.ndarray
+            Anomaly scores or None, if the detector does not provide scores.
+        """
+
+        labels, scores = self._fit_score_algo(p_algo=self._algo_scikitlearn, p_data=p_data)
+        return self._get_outliers(p_labels=labels, p_scores=scores), scores
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _fit_score_algo(p_algo : OutlierMixin, p_data : np.ndarray):
+        """
+        Fits the given detector and determines labels and anomaly scores of the same data. It does 
+        not refer to the wrapper object and can thus be executed in a worker thread or process.
+        """
+
+        if hasattr(p_algo, 'decision_function'):
+            p_algo.fit(p_data)
+            scores = p_algo.decision_function(p_data)
+            labels = np.where(scores < 0, -1, 1)
+
+        else:
+            labels = p_algo.fit_predict(p_data)
+            try:
+                # LocalOutlierFactor in outlier detection mode
+                scores = p_algo.negative_outlier_factor_ - p_algo.offset_
+            except AttributeError:
+                scores = None
+
+        return labels, scores
+
+
+## -------------------------------------------------------------------------------------------------
+    def _submit_detection(self, p_data : np.ndarray, p_instances : np.ndarray):
+        """
+        Submits an asynchronous detection on a snapshot of the instance buffer.
+        """
+
+        if len(self._pending) >= self._max_pending:
+            # Back-pressure: the oldest pending detection needs to be finished first
+            self._process_detection(*self._pending.popleft())
+
+        if self._executor is None:
+            if self._detection_range == self.C_RANGE_THREAD:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_pending)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_pending)
+
+        # Each job fits its own unfitted copy of the detector
+        future = self._executor.submit( self._fit_score_algo, 
+                                        p_algo = clone(self._algo_scikitlearn), 
+                                        p_data = p_data )
+        
+        self._pending.append( (future, p_instances) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _collect_detections(self, p_wait : bool):
+        """
+        Raises the anomalies of finished asynchronous detections in submission order.
+
+        Parameters
+        ----------
+        p_wait : bool
+            If True, all pending detections are waited for. Otherwise, collection stops at the first
+            unfinished detection.
+        """
+
+        while self._pending:
+            if not ( p_wait or self._pending[0][0].done() ): return
+            self._process_detection(*self._pending.popleft())
+
+
+## -------------------------------------------------------------------------------------------------
+    def _process_detection(self, p_future, p_instances : np.ndarray):
+
+        labels, scores = p_future.result()
+        outliers       = self._get_outliers(p_labels=labels, p_scores=scores)
+
+        for i in np.where(outliers)[0]:
+            related_instance = p_instances[i]
+
+            if not self._block_mode:
+                # In case of sliding window, multiple raise of anomalies for the same instance
+                # needs to be avoided.
+                if related_instance.id in self._raised_ids: continue
+                self._raised_ids.add(related_instance.id)
 
             anomaly = PointAnomaly( p_status = True,
                                     p_tstamp = related_instance.tstamp,
                                     p_visualize = self.get_visualization(), 
                                     p_raising_object = self,
-                                    p_instances = [related_instance] )
+                                    p_instances = [related_instance],
+                                    p_score = None if scores is None else scores[i] )
             
-            self._raise_anomaly_event( p_anomaly = anomaly, p_instance = p_instance )
\ No newline at end of file
+            self._raise_anomaly_event( p_anomaly = anomaly, p_instance = related_instance )
+
+        if not self._block_mode:
+            # Instances older than the current window can not be part of later detections
+            id_oldest = p_instances[0].id
+            self._raised_ids = { inst_id for inst_id in self._raised_ids if inst_id >= id_oldest }
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush_detections(self):
+        """
+        Waits for all pending asynchronous detections and raises the related anomalies. Afterwards,
+        the thread or process pool is shut down. It is recreated by the next asynchronous detection.
+        """
+
+        self._collect_detections(p_wait=True)
+        self._shutdown_executor()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _shutdown_executor(self):
+        """
+        Shuts down the thread or process pool of the asynchronous detection.
+        """
+
+        if self._executor is None: return
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, **p_kwargs):
+        """
+        Resets the task. Pending asynchronous detections are discarded without raising anomalies
+        and the thread or process pool is shut down. Use method flush_detections() beforehand to 
+        keep their anomalies.
+        """
+
+        if self._pending:
+            self.log(self.C_LOG_TYPE_W, 'Reset discards', len(self._pending), 'pending detection(s)')
+            self._pending.clear()
+
+        self._shutdown_executor()
+        self._raised_ids.clear()
+
+        AnomalyDetectorIBPG.reset(self, **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _score(self, p_data : np.ndarray):
+        """
+        Determines outliers and anomaly scores of the given data by the recently fitted detector. 
+        See method _fit_score() for further details.
+        """
+
+        algo = self._algo_scikitlearn
+
+        if hasattr(algo, 'decision_function'):
+            scores = algo.decision_function(p_data)
+            labels = np.where(scores < 0, -1, 1)
+        else:
+            scores = None
+            labels = algo.predict(p_data)
+
+        return self._get_outliers(p_labels=labels, p_scores=scores), scores
@@ -9,25 +9,30 @@
 ## -- 2024-04-18  1.1.0     DA       Alignment ot MLPro 1.4.0
 ## -- 2025-03-05  1.2.0     DA       Update of minimum release of scikit-learn to 1.6.1
 ## -- 2025-07-23  1.3.0     DA       Refactoring 
+## -- 2026-10-16  1.4.0     DA       New class LazyModuleSklearn
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2025-07-23)
+Ver. 1.4.0 (2026-10-16)
 
-This module contains the abstract root class for all scikit-learn wrapper classes.
+This module contains the abstract root class for all scikit-learn wrapper classes and a placeholder
+for modules imported on first use.
 
 Learn more:
 https://scikit-learn.org
 
 """
 
+import importlib
+
 from mlpro.bf.various import ScientificObject
 from mlpro.wrappers import Wrapper
 
 
 
 # Export list for public API
-__all__ = [ 'WrapperSklearn' ]
+__all__ = [ 'WrapperSklearn',
+            'LazyModuleSklearn' ]
 
 
 
@@ -46,3 +51,40 @@ class WrapperSklearn (Wrapper):
     C_SCIREF_TYPE       = ScientificObject.C_SCIREF_TYPE_ONLINE
     C_SCIREF_AUTHOR     = 'scikit-learn community'
     C_SCIREF_URL        = 'https://scikit-learn.org'
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class LazyModuleSklearn:
+    """
+    Placeholder for a module that is imported on the first access of one of its attributes. Heavy
+    third-party modules like sklearn.datasets can be referenced at module level this way, while 
+    their import time is spent only if they are actually used.
+
+    Parameters
+    ----------
+    p_name : str
+        Absolute name of the module, e.g. 'sklearn.datasets'.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_name : str):
+        self._name   = p_name
+        self._module = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getattr__(self, p_attr : str):
+        # Called for attributes of the module only, since the own attributes exist
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+
+        return getattr(self._module, p_attr)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return '<lazy module ' + repr(self._name) + ( ' (imported)>' if self._module is not None else '>' )
@@ -19,10 +19,75 @@
 ## -- 2024-02-16  1.5.0     DA       Refactoring
 ## -- 2024-02-16  1.6.0     DA       Refactoring
 ## -- 2025-07-23  1.7.0     DA       Refactoring 
+## -- 2026-10-16  1.8.0     DA       Class WrStreamSklearn: new batch access by methods 
+## --                                get_next_batch(), iter_batches()
+## -- 2026-10-16  1.9.0     DA       New class DatasetCacheSklearn: persistent on-disk cache with
+## --                                memory-mapped replay of datasets
+## -- 2026-10-16  1.10.0    DA       - Class WrStreamProviderSklearn: loader registry instead of 
+## --                                  evaluated strings
+## --                                - Class WrStreamSklearn: single load per dataset, new method
+## --                                  get_metadata() with shapes, dtypes and load timings
+## -- 2026-10-16  1.11.0    DA       Class WrStreamProviderSklearn: 
+## --                                - stream objects are created once and kept in a dictionary
+## --                                - new method get_metadata_index()
+## -- 2026-10-16  1.12.0    DA       - Sparse streaming of rcv1 and 20newsgroups_vectorized
+## --                                - New classes LazyFeatureSpaceSklearn, SparseElementSklearn
+## -- 2026-10-16  1.13.0    DA       New class WrStreamGeneratorSklearn: unbounded synthetic streams
+## --                                based on the generators sklearn.datasets.make_*
+## -- 2026-10-16  1.14.0    DA       New class WrStreamSvmlightSklearn: chunked out-of-core stream of
+## --                                svmlight/libsvm files
+## -- 2026-10-16  1.15.0    DA       Class WrStreamSklearn: seeded shuffled replay via permutation
+## --                                index, new method set_shuffle()
+## -- 2026-10-16  1.16.0    DA       Class WrStreamSklearn: rate-controlled real-time replay, new 
+## --                                method set_replay_clock()
+## -- 2026-10-16  1.17.0    DA       Class WrStreamSklearn: background prefetching of instances or
+## --                                batches, new method set_prefetch()
+## -- 2026-10-16  1.18.0    DA       - Class WrStreamSklearn: sharded partitions, new method 
+## --                                  set_shard()
+## --                                - Class WrStreamProviderSklearn: parameterized streams are 
+## --                                  created as separate objects
+## -- 2026-10-16  1.19.0    DA       Class WrStreamSklearn: column projection and dtype cast by new
+## --                                parameters p_features, p_dtype
+## -- 2026-10-16  1.20.0    DA       Class WrStreamSklearn: export to pandas DataFrames and Arrow
+## --                                record batches
+## -- 2026-10-16  1.21.0    DA       - Class WrStreamSklearn: feature statistics and boundaries 
+## --                                  computed once at load time, new method 
+## --                                  get_feature_statistics()
+## --                                - Class DatasetCacheSklearn: caching of feature statistics
+## -- 2026-10-16  1.22.0    DA       Class WrStreamSklearn: random access by new method seek() and
+## --                                serializable replay cursor by new methods get_cursor(), 
+## --                                set_cursor()
+## -- 2026-10-16  1.23.0    DA       - New class InstancePoolSklearn: reuse of pre-allocated instances
+## --                                - Class WrStreamSklearn: new methods set_instance_pool(), 
+## --                                  release_instance()
+## -- 2026-10-16  1.24.0    DA       New class WrStreamCompositeSklearn: concatenated and interleaved
+## --                                mixtures of streams
+## -- 2026-10-16  1.25.0    DA       - Class WrStreamProviderSklearn: concurrent loading of datasets 
+## --                                  by new method prefetch(), new parameter p_data_home
+## --                                - Class WrStreamSklearn: new parameters p_data_home, p_dataset
+## -- 2026-10-16  1.26.0    DA       Import of scikit-learn on first use
+## -- 2026-10-16  1.27.0    DA       Class WrStreamSklearn: optional instrumentation counters, new
+## --                                parameter p_instrumentation and new methods 
+## --                                set_instrumentation(), get_instrumentation(), 
+## --                                reset_instrumentation()
+## -- 2026-10-16  1.27.1    DA       Bugfix: shuffled and sharded replay of list-valued datasets
+## -- 2026-10-16  1.27.2    DA       Class WrStreamSklearn: instrumentation without replacement of methods
+## -- 2026-10-16  1.27.3    DA       Class DatasetCacheSklearn: concurrent filling of the cache by several processes
+## -- 2026-10-16  1.27.4    DA       Class WrStreamGeneratorSklearn: class structure of 
+## --                                make_classification drawn once per stream
+## -- 2026-10-16  1.27.5    DA       Class WrStreamSklearn: projected and cast data arrays cached as
+## --                                separate memory-mapped cache entries
+## -- 2026-10-16  1.27.6    DA       Bugfix: replay clock of empty shards
+## -- 2026-10-16  1.27.7    DA       Export of sparse DataFrames by the public pandas API only
+## -- 2026-10-17  1.27.8    DA       Bugfix: replay clock of the first epoch started before loading
+## -- 2026-10-17  1.27.9    DA       Class DatasetCacheSklearn: valid entries kept by concurrent writers
+## -- 2026-10-17  1.27.10   DA       Class WrStreamGeneratorSklearn: generator set up on first use
+## -- 2026-10-17  1.27.11   DA       Class WrStreamSklearn: new parameter p_stats for derived streams
+## -- 2026-10-17  1.27.12   DA       Class WrStreamSvmlightSklearn: unsupported modes rejected by ParamError
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.7.0 (2025-07-23)
+Ver. 1.27.12 (2026-10-17)
 
 This module provides wrapper functionalities to incorporate public data sets of the scikit-learn ecosystem.
 
@@ -32,20 +97,46 @@ https://scikit-learn.org/stable/api/sklearn.datasets.html
 """
 
 
+import os
+import glob
+import collections
+import json
+import hashlib
+import shutil
+import time
+import queue
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Tuple
+
 import numpy
-from sklearn import datasets as sklearn_datasets
+from scipy import sparse
 
-from mlpro.bf import Log, Mode
+from mlpro.bf import Log, Mode, ParamError
 from mlpro.bf.various import ScientificObject
 from mlpro.bf.math import *
 from mlpro.bf.streams import *
 
-from mlpro_int_sklearn.wrappers import WrapperSklearn
+from mlpro_int_sklearn.wrappers.basics import WrapperSklearn, LazyModuleSklearn
+
+
+# scikit-learn is imported on first use, when a dataset is loaded or generated
+sklearn          = LazyModuleSklearn('sklearn')
+sklearn_datasets = LazyModuleSklearn('sklearn.datasets')
+sklearn_utils    = LazyModuleSklearn('sklearn.utils')
 
 
 
 # Export list for public API
-__all__ = [ 'WrStreamProviderSklearn' ]
+__all__ = [ 'WrStreamProviderSklearn',
+            'DatasetCacheSklearn',
+            'LazyFeatureSpaceSklearn',
+            'SparseElementSklearn',
+            'InstancePoolSklearn',
+            'WrStreamGeneratorSklearn',
+            'WrStreamSvmlightSklearn',
+            'WrStreamCompositeSklearn' ]
 
 
 
@@ -55,50 +146,158 @@ __all__ = [ 'WrStreamProviderSklearn' ]
 class WrStreamProviderSklearn (WrapperSklearn, StreamProvider):
     """
     Wrapper class for Sklearn as StreamProvider.
+
+    Parameters
+    ----------
+    p_cache_dir : str
+        Optional directory of a persistent dataset cache shared by all provided streams. See class
+        DatasetCacheSklearn for further details. Default = None (no caching).
+    p_data_home : str
+        Optional download and cache directory of the scikit-learn fetchers. Default = None 
+        (scikit-learn data home).
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+
+    Besides the datasets of scikit-learn, the synthetic generators sklearn.datasets.make_* are 
+    provided as unbounded streams named like the generator functions (e.g. 'make_blobs'). See class
+    WrStreamGeneratorSklearn for further details.
     """
 
     C_NAME              = 'scikit-learn'
 
-    _load_utils = [
-        "fetch_20newsgroups()",
-        "fetch_20newsgroups_vectorized(as_frame=True)",
-        "fetch_california_housing()",
-        "fetch_covtype()",
-        "fetch_rcv1()",
-        "fetch_kddcup99()",
-        "load_diabetes()",
-        "load_iris()",
-        "load_breast_cancer()",
-        "load_wine()",
-    ]
+    # Loader registry: dataset name -> (name of the loader function in sklearn.datasets, loader 
+    # parameters)
+    _loaders = {
+        "20newsgroups"              : ( 'fetch_20newsgroups', {} ),
+        "20newsgroups_vectorized"   : ( 'fetch_20newsgroups_vectorized', {} ),
+        "california_housing"        : ( 'fetch_california_housing', {} ),
+        "covtype"                   : ( 'fetch_covtype', {} ),
+        "rcv1"                      : ( 'fetch_rcv1', {} ),
+        "kddcup99"                  : ( 'fetch_kddcup99', {} ),
+        "diabetes"                  : ( 'load_diabetes', {} ),
+        "iris"                      : ( 'load_iris', {} ),
+        "breast_cancer"             : ( 'load_breast_cancer', {} ),
+        "wine"                      : ( 'load_wine', {} ),
+    }
+
     _data_utils = [
         "clear_data_home",
         "dump_svmlight_file"
     ]
 
-    _datasets = [
-        "20newsgroups",
-        "20newsgroups_vectorized",
-        "california_housing",
-        "covtype",
-        "rcv1",
-        "kddcup99",
-        "diabetes",
-        "iris",
-        "breast_cancer",
-        "wine",
-    ]
+    _datasets = list(_loaders.keys())
+
+    # Generator registry: stream name -> (name of the generator function in sklearn.datasets, 
+    # default generator parameters)
+    _generators = {
+        "make_blobs"                : ( 'make_blobs', { 'n_features' : 2, 'centers' : 3 } ),
+        "make_circles"              : ( 'make_circles', { 'noise' : 0.05 } ),
+        "make_classification"       : ( 'make_classification', {} ),
+        "make_friedman1"            : ( 'make_friedman1', {} ),
+        "make_gaussian_quantiles"   : ( 'make_gaussian_quantiles', {} ),
+        "make_moons"                : ( 'make_moons', { 'noise' : 0.05 } ),
+        "make_regression"           : ( 'make_regression', {} ),
+        "make_s_curve"              : ( 'make_s_curve', {} ),
+    }
+
+    _stream_names = _datasets + list(_generators.keys())
+
+    # Metadata index: dataset name -> number of instances, number of features, label cardinality 
+    # (None for regression targets) and local files relative to the scikit-learn data home. Local
+    # files of bundled datasets are relative to the data directory of the package sklearn.datasets.
+    _metadata_index = {
+        "20newsgroups"              : { 'num_instances' : 11314,  'num_features' : 1,      'num_labels' : 20,   'bundled' : False, 'files' : '20news-bydate*' },
+        "20newsgroups_vectorized"   : { 'num_instances' : 11314,  'num_features' : 130107, 'num_labels' : 20,   'bundled' : False, 'files' : '20newsgroup_vectorized*' },
+        "california_housing"        : { 'num_instances' : 20640,  'num_features' : 8,      'num_labels' : None, 'bundled' : False, 'files' : 'cal_housing*' },
+        "covtype"                   : { 'num_instances' : 581012, 'num_features' : 54,     'num_labels' : 7,    'bundled' : False, 'files' : 'covertype' },
+        "rcv1"                      : { 'num_instances' : 804414, 'num_features' : 47236,  'num_labels' : 103,  'bundled' : False, 'files' : 'RCV1' },
+        "kddcup99"                  : { 'num_instances' : 494021, 'num_features' : 41,     'num_labels' : 23,   'bundled' : False, 'files' : 'kddcup99_10*' },
+        "diabetes"                  : { 'num_instances' : 442,    'num_features' : 10,     'num_labels' : None, 'bundled' : True,  'files' : 'diabetes_*' },
+        "iris"                      : { 'num_instances' : 150,    'num_features' : 4,      'num_labels' : 3,    'bundled' : True,  'files' : 'iris.csv' },
+        "breast_cancer"             : { 'num_instances' : 569,    'num_features' : 30,     'num_labels' : 2,    'bundled' : True,  'files' : 'breast_cancer.csv' },
+        "wine"                      : { 'num_instances' : 178,    'num_features' : 13,     'num_labels' : 3,    'bundled' : True,  'files' : 'wine_data.csv' },
+    }
 
 ## -------------------------------------------------------------------------------------------------
-    def __init__(self, p_logging = Log.C_LOG_ALL):
+    def __init__(self, p_cache_dir : str = None, p_data_home : str = None, p_logging = Log.C_LOG_ALL):
 
         self.C_TYPE       = StreamProvider.C_TYPE
 
         WrapperSklearn.__init__(self, p_logging=p_logging)
         StreamProvider.__init__(self, p_logging=p_logging)
 
-        self._stream_list = []
-        self._stream_ids  = self._datasets
+        self._streams     = {}
+        self._cache_dir   = p_cache_dir
+        self._data_home   = p_data_home
+        if p_cache_dir is not None:
+            self._cache = DatasetCacheSklearn(p_cache_dir=p_cache_dir, p_logging=p_logging)
+        else:
+            self._cache = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream_object(self, p_name : str, p_mode = Mode.C_MODE_SIM, **p_kwargs) -> Stream:
+        """
+        Returns the stream object of the specified dataset or generator. It is created on first 
+        demand and kept in the internal stream dictionary afterwards. If further parameters are 
+        specified, a separate stream object is created on each call, so that differently 
+        parameterized streams (e.g. shards) of the same dataset can be used side by side.
+        """
+
+        if len(p_kwargs) == 0:
+            try:
+                return self._streams[p_name]
+            except KeyError:
+                pass
+
+        if p_name in self._loaders:
+            # Differently parameterized streams reuse the data of an already loaded stream
+            try:
+                stream_loaded = self._streams[p_name]
+            except KeyError:
+                stream_loaded = None
+
+            if ( stream_loaded is not None ) and stream_loaded._downloaded:
+                dataset = stream_loaded._dataset
+                stats   = stream_loaded._stats
+            else:
+                dataset = None
+                stats   = None
+
+            stream = WrStreamSklearn( p_id=p_name,
+                                      p_name=p_name,
+                                      p_mode=p_mode,
+                                      p_cache_dir=self._cache_dir,
+                                      p_data_home=self._data_home,
+                                      p_dataset=dataset,
+                                      p_stats=stats,
+                                      p_logging=Log.C_LOG_WE,
+                                      **p_kwargs )
+
+        elif p_name in self._generators:
+            generator, generator_params = self._generators[p_name]
+            generator_params = generator_params.copy()
+            stream_params    = {}
+
+            for key, value in p_kwargs.items():
+                if key.startswith('p_'):
+                    stream_params[key] = value
+                else:
+                    generator_params[key] = value
+
+            stream = WrStreamGeneratorSklearn( p_id=p_name,
+                                               p_name=p_name,
+                                               p_generator=generator,
+                                               p_generator_params=generator_params,
+                                               p_mode=p_mode,
+                                               p_logging=Log.C_LOG_WE,
+                                               **stream_params )
+
+        else:
+            raise ValueError('Stream with name "' + str(p_name) + '" not found')
+
+        if len(p_kwargs) == 0: self._streams[p_name] = stream
+        return stream
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -113,13 +312,7 @@ class WrStreamProviderSklearn (WrapperSklearn, StreamProvider):
 
         """
 
-        for i in range(len(self._datasets)):
-            self._stream_list.append(WrStreamSklearn( p_id=self._stream_ids[i],
-                                                      p_name=self._datasets[i], 
-                                                      p_mode=p_mode,
-                                                      p_logging=Log.C_LOG_WE))
-
-        return self._stream_list
+        return [ self._get_stream_object(p_name=name, p_mode=p_mode) for name in self._stream_names ]
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -138,7 +331,10 @@ class WrStreamProviderSklearn (WrapperSklearn, StreamProvider):
         p_logging
             Log level (see constants of class Log). Default: Log.C_LOG_ALL.
         p_kwargs : dict
-            Further stream specific parameters.
+            Further stream specific parameters. Dataset streams accept the parameters of class 
+            WrStreamSklearn, like p_shuffle or p_shard and p_num_shards. For generator streams, parameters with prefix 'p_' are passed to class 
+            WrStreamGeneratorSklearn (e.g. p_num_instances, p_chunk_size, p_seed) and all others 
+            to the generator function (e.g. n_features).
 
         Returns
         -------
@@ -146,19 +342,20 @@ class WrStreamProviderSklearn (WrapperSklearn, StreamProvider):
             Stream object or None in case of an error.
         """
 
-        self.get_stream_list(p_mode=p_mode, p_logging=p_logging, **p_kwargs)
-
         if p_id is not None:
-            try:
-                stream = self._stream_list[int(p_id)]
-            except ValueError:
-                raise ValueError('Stream with id', p_id, 'not found')
+            if p_id in self._stream_names:
+                name = p_id
+            else:
+                # Stream ids are the dataset names, but numerical ids are accepted as well
+                try:
+                    name = self._stream_names[int(p_id)]
+                except (ValueError, IndexError):
+                    raise ValueError('Stream with id', p_id, 'not found')
 
-        elif p_name is not None:
-            try:
-                stream = self._stream_list[self._stream_ids.index(p_name)]
-            except ValueError:
-                raise ValueError('Stream with name "' + p_name + '" not found')
+        else:
+            name = p_name
+
+        stream = self._get_stream_object(p_name=name, p_mode=p_mode, **p_kwargs)
 
         stream.set_mode(p_mode=p_mode)
         stream.switch_logging(p_logging=p_logging)
@@ -167,6 +364,127 @@ class WrStreamProviderSklearn (WrapperSklearn, StreamProvider):
         return stream
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_metadata_index(self, p_name : str = None) -> dict:
+        """
+        Returns precomputed metadata of the provided datasets without loading or downloading them.
+
+        Parameters
+        ----------
+        p_name : str
+            Optional name of a dataset. Default = None (all datasets).
+
+        Returns
+        -------
+        dict
+            Metadata of the specified dataset or dictionary of metadata per dataset name. Metadata 
+            consist of the entries 'num_instances', 'num_features', 'num_labels' (label 
+            cardinality, None for regression targets), 'size_on_disk' (bytes of the locally 
+            available scikit-learn files) and 'size_cached' (bytes of the cache entry).
+        """
+
+        if p_name is None:
+            return { name : self.get_metadata_index(p_name=name) for name in self._datasets }
+
+        try:
+            index = self._metadata_index[p_name]
+        except KeyError:
+            raise ValueError('Stream with name "' + str(p_name) + '" not found')
+
+        if index['bundled']:
+            root = os.path.dirname(sklearn_datasets.__file__) + os.sep + 'data'
+        else:
+            root = sklearn_datasets.get_data_home(data_home=self._data_home)
+
+        if ( self._cache is not None ) and self._cache.is_valid(p_name=p_name):
+            size_cached = self._get_size(p_path=self._cache.get_path(p_name=p_name))
+        else:
+            size_cached = 0
+
+        return { 'num_instances' : index['num_instances'],
+                 'num_features'  : index['num_features'],
+                 'num_labels'    : index['num_labels'],
+                 'size_on_disk'  : sum( self._get_size(p_path=path) for path in glob.glob(root + os.sep + index['files']) ),
+                 'size_cached'   : size_cached }
+
+
+## -------------------------------------------------------------------------------------------------
+    def prefetch(self, p_names : list, p_max_workers : int = 4) -> dict:
+        """
+        Loads the specified datasets concurrently in a thread pool, instead of one after another 
+        on the first access of each stream. The datasets are read from the scikit-learn data home
+        (see parameter p_data_home), downloaded if missing, or replayed from the dataset cache. 
+        Afterwards, method get_stream() provides streams with already loaded data. Differently 
+        parameterized streams of a dataset, e.g. shards, share the loaded data as well.
+
+        Parameters
+        ----------
+        p_names : list
+            Names of the datasets.
+        p_max_workers : int
+            Maximum number of datasets loaded at the same time. Default = 4.
+
+        Returns
+        -------
+        report : dict
+            Dictionary with an entry per dataset name, consisting of the entries 'duration' 
+            (seconds), 'load_source' ('scikit-learn', 'cache', 'preloaded' or None on failure) and
+            'error' (error message or None).
+        """
+
+        if p_max_workers < 1:
+            raise ParamError('Please set the parameter "p_max_workers" >= 1')
+
+        def load(p_stream):
+            tp_start = time.perf_counter()
+
+            try:
+                source = p_stream.get_metadata()['load_source']
+                error  = None
+            except Exception as e:
+                source = None
+                error  = type(e).__name__ + ': ' + str(e)
+
+            return { 'duration' : time.perf_counter() - tp_start, 'load_source' : source, 'error' : error }
+
+        report  = {}
+        futures = {}
+
+        self.log(self.C_LOG_TYPE_I, 'Prefetching', len(p_names), 'datasets with up to', p_max_workers, 'threads...')
+
+        with ThreadPoolExecutor(max_workers=p_max_workers) as executor:
+            for name in p_names:
+                if name not in self._loaders:
+                    report[name] = { 'duration' : 0.0, 'load_source' : None, 'error' : 'Dataset "' + str(name) + '" not found' }
+                elif name not in futures:
+                    futures[name] = executor.submit(load, self._get_stream_object(p_name=name))
+
+        for name, future in futures.items():
+            report[name] = future.result()
+
+            if report[name]['error'] is None:
+                self.log(self.C_LOG_TYPE_I, 'Dataset "' + name + '" loaded from', report[name]['load_source'], 'in', round(report[name]['duration'], 3), 'seconds')
+
+        for name, entry in report.items():
+            if entry['error'] is not None:
+                self.log(self.C_LOG_TYPE_W, 'Dataset "' + name + '" could not be loaded:', entry['error'])
+
+        return { name : report[name] for name in p_names }
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_size(p_path : str) -> int:
+        if os.path.isfile(p_path): return os.path.getsize(p_path)
+
+        size = 0
+        for root, dirs, files in os.walk(p_path):
+            for file in files:
+                size += os.path.getsize(root + os.sep + file)
+
+        return size
+
+
 
 
 
@@ -192,6 +510,45 @@ class WrStreamSklearn (Stream):
         Optional label space. Default = None.
     p_mode
         Operation mode. Valid values are stored in constant C_VALID_MODES.
+    p_cache_dir : str
+        Optional directory of a persistent dataset cache. If specified, the dataset is converted
+        once into a columnar .npy layout and replayed memory-mapped afterwards. See class 
+        DatasetCacheSklearn for further details. Default = None (no caching).
+    p_shuffle : bool
+        If True, the instances are replayed in shuffled order. See method set_shuffle() for 
+        further details. Default = False.
+    p_shuffle_seed : int
+        Seed of the shuffled replay. Default = None (random seed).
+    p_shuffle_block_size : int
+        Number of consecutive instances shuffled as a block. Default = 1 (instance-wise).
+    p_shard : int
+        Index of the shard provided by the stream. See method set_shard() for further details. 
+        Default = 0.
+    p_num_shards : int
+        Number of shards. Default = 1 (complete dataset).
+    p_shard_mode : str
+        Partitioning of the dataset into shards. Default = C_SHARD_RANGE.
+    p_features : list
+        Optional subset of features, specified by names or column indices. Default = None (all 
+        features).
+    p_dtype
+        Optional data type of the feature values, e.g. numpy.float32. Default = None (data type of
+        the dataset). With a dataset cache, the projected and cast data array is cached as a 
+        separate entry and replayed memory-mapped, so that all shards and processes with the same
+        projection share its pages.
+    p_data_home : str
+        Optional download and cache directory of the scikit-learn fetchers. Default = None 
+        (scikit-learn data home).
+    p_dataset : Bunch
+        Optional dataset already loaded, e.g. by another stream of the same dataset. It is not 
+        modified by the stream. Default = None (the dataset is loaded on demand).
+    p_stats : dict
+        Optional feature statistics of the complete dataset passed by parameter p_dataset, as 
+        computed by another stream of the same dataset without feature subset. They are not 
+        modified by the stream. Default = None (the statistics are computed on demand).
+    p_instrumentation : bool
+        If True, counters and timers of the replay are recorded. See method set_instrumentation()
+        for further details. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL.
     p_kwargs : dict
@@ -201,6 +558,24 @@ class WrStreamSklearn (Stream):
     C_NAME              = 'scikit-learn stream'
     C_SCIREF_TYPE       = ScientificObject.C_SCIREF_TYPE_ONLINE
 
+    # Remaining waiting time (seconds) of the replay clock that is spent busy-waiting instead of 
+    # sleeping, to compensate the wake-up latency of the operating system
+    C_CLOCK_SPIN_TIME   = 0.002
+
+    # Interval (seconds) in which a blocked prefetching thread checks for its shutdown
+    C_PREFETCH_TIMEOUT  = 0.1
+
+    # Partitioning modes of shards
+    C_SHARD_RANGE       = 'range'
+    C_SHARD_STRIDE      = 'stride'
+    C_SHARD_HASH        = 'hash'
+
+    # Number of rows processed at once by the computation of the feature statistics
+    C_STATS_BLOCK_SIZE  = 2**16
+
+    # Methods timed by the instrumentation
+    C_INSTR_METHODS     = [ '_get_next', '_download', '_reset' ]
+
 ## -------------------------------------------------------------------------------------------------
     def __init__( self, 
                   p_id, 
@@ -209,12 +584,56 @@ class WrStreamSklearn (Stream):
                   p_version : str = '', 
                   p_logging = Log.C_LOG_ALL, 
                   p_mode= Mode.C_MODE_SIM, 
+                  p_cache_dir : str = None,
+                  p_shuffle : bool = False,
+                  p_shuffle_seed : int = None,
+                  p_shuffle_block_size : int = 1,
+                  p_shard : int = 0,
+                  p_num_shards : int = 1,
+                  p_shard_mode : str = C_SHARD_RANGE,
+                  p_features : list = None,
+                  p_dtype = None,
+                  p_data_home : str = None,
+                  p_dataset : dict = None,
+                  p_stats : dict = None,
+                  p_instrumentation : bool = False,
                   **p_kwargs ):
 
         self._downloaded = False
+        self._data_home  = p_data_home
+        self._preloaded  = p_dataset
+        self._pre_stats  = p_stats
+        self._metadata   = None
+        self._sparse     = False
+        self._index      = None
+        self._perm       = None
+        self._clock      = None
+        self._schedule   = None
+        self._prefetch   = ( 0, None )
+        self._producer   = None
+        self._pool_param = ( 0, False )
+        self._pool       = None
+        self._offset     = 0
+        self._features   = None if p_features is None else list(p_features)
+        self._columns    = None
+        self._dtype_data = p_dtype
+        self._stats      = None
+        self._instr      = None
+        self.set_instrumentation(p_enabled=p_instrumentation)
+        self.set_shard( p_shard=p_shard, 
+                        p_num_shards=p_num_shards, 
+                        p_mode=p_shard_mode )
+        self.set_shuffle( p_shuffle=p_shuffle, 
+                          p_seed=p_shuffle_seed, 
+                          p_block_size=p_shuffle_block_size )
         self.C_ID = self._id = p_id
         self._name = p_name
 
+        if p_cache_dir is not None:
+            self._cache = DatasetCacheSklearn(p_cache_dir=p_cache_dir, p_logging=p_logging)
+        else:
+            self._cache = None
+
         Stream.__init__( self,
                          p_id=p_id,
                          p_name=self.C_NAME + ' "' + p_name + '"',
@@ -238,87 +657,3037 @@ class WrStreamSklearn (Stream):
         Custom reset method to download and reset an Sklearn stream.
         """
 
+        instr = self._instr
+        if instr is not None: tp_start = time.perf_counter()
+
+        self._stop_prefetch()
+
         self.get_feature_space()
         self.get_label_space()
 
         self._index = 0
 
+        if self._shard_rows is None:
+            self._shard_rows = self._get_shard_rows()
+
+        if isinstance(self._shard_rows, slice):
+            self._offset        = self._shard_rows.start
+            self._num_instances = self._shard_rows.stop - self._shard_rows.start
+        else:
+            self._offset        = 0
+            self._num_instances = len(self._shard_rows)
+
+        if self._shuffle:
+            self._perm   = self._get_permutation(p_epoch=self._epoch)
+            self._epoch += 1
+
+            if isinstance(self._shard_rows, slice):
+                self._perm += self._offset
+            else:
+                self._perm = self._shard_rows[self._perm]
+
+        elif not isinstance(self._shard_rows, slice):
+            self._perm = self._shard_rows
+
+        if self._clock is not None:
+            self._schedule = self._get_schedule()
+
+        if ( self._pool_param[0] > 0 ) and ( self._pool is None ):
+            self._pool = self._create_pool()
+
+        if self._clock is not None:
+            # The replay clock starts after loading the dataset, so that the loading time does not
+            # count against the schedule of the first epoch
+            self._perf_counter0 = time.perf_counter()
+
+        if self._prefetch[0] > 0:
+            self._start_prefetch()
+
+        if instr is not None: self._record(p_instr=instr, p_method='_reset', p_tp_start=tp_start)
+
 
 ## --------------------------------------------------------------------------------------------------
-    def _setup_feature_space(self)-> MSpace:
-        if not self._downloaded:
-            self._downloaded = self._download()
-            if not self._downloaded: return None       
+    def set_shuffle(self, p_shuffle : bool = True, p_seed : int = None, p_block_size : int = 1):
+        """
+        Turns the shuffled replay on or off. Instead of rearranging the data, a permutation index 
+        is computed on each reset and the rows are read through it. Each reset starts a new epoch
+        with its own permutation, derived from the seed and the epoch number, so that shuffled
+        replays are reproducible. The change takes effect on the next reset.
 
-        feature_space = MSpace()
+        Parameters
+        ----------
+        p_shuffle : bool
+            Shuffled (True) or stored (False) order. Default = True.
+        p_seed : int
+            Seed of the permutations. Default = None (random seed).
+        p_block_size : int
+            Number of consecutive instances forming a block. The order of blocks and the order of
+            instances within each block are shuffled. Instances of a block remain adjacent in the
+            replay, which keeps memory access local for large or memory-mapped datasets. Default =
+            1 (instance-wise shuffling).
+        """
 
-        try:
-            features = self._dataset.feature_names
+        if p_block_size < 1:
+            raise ParamError('Please set the parameter "p_block_size" >= 1')
 
-        except:
-            if not isinstance(self._dataset['data'], list):
-                features = self._dataset['feature_names']
-            else:
-                features = ['Attr_1']
+        self._shuffle            = p_shuffle
+        self._shuffle_seed       = numpy.random.SeedSequence(p_seed).entropy
+        self._shuffle_block_size = p_block_size
+        self._epoch              = 0
+        self._perm               = None
 
-        for feature in features:
-            feature_space.add_dim(Feature(p_name_short=str(feature)))
 
-        return feature_space
+## --------------------------------------------------------------------------------------------------
+    def set_shard(self, p_shard : int = 0, p_num_shards : int = 1, p_mode : str = C_SHARD_RANGE):
+        """
+        Restricts the stream to one of p_num_shards disjoint partitions of the dataset, so that 
+        several consumers, e.g. worker processes, can share a dataset. The shards are index sets on
+        the same data; shuffled replay and replay clock apply within the shard. Combined with a
+        dataset cache (parameter p_cache_dir), the data are memory-mapped, so that the shards of 
+        all processes share the same pages. The change takes effect on the next reset.
+
+        Parameters
+        ----------
+        p_shard : int
+            Index of the shard in [0, p_num_shards). Default = 0.
+        p_num_shards : int
+            Number of shards. Default = 1 (complete dataset).
+        p_mode : str
+            Partitioning mode. Possible values are C_SHARD_RANGE (contiguous index ranges), 
+            C_SHARD_STRIDE (every p_num_shards-th instance) and C_SHARD_HASH (by a hash of the
+            instance index, independent of the process). Default = C_SHARD_RANGE.
+        """
+
+        if p_num_shards < 1:
+            raise ParamError('Please set the parameter "p_num_shards" >= 1')
+
+        if ( p_shard < 0 ) or ( p_shard >= p_num_shards ):
+            raise ParamError('Please set the parameter "p_shard" in [0, p_num_shards)')
+
+        if p_mode not in [ self.C_SHARD_RANGE, self.C_SHARD_STRIDE, self.C_SHARD_HASH ]:
+            raise ParamError('Unknown shard mode "' + str(p_mode) + '"')
+
+        self._shard      = ( p_shard, p_num_shards, p_mode )
+        self._shard_rows = None
+        self._perm       = None
 
 
 ## --------------------------------------------------------------------------------------------------
-    def _setup_label_space(self) -> MSpace:
-        if not self._downloaded:
-            self._downloaded = self._download()
-            if not self._downloaded: return None       
+    def _get_shard_rows(self):
+        """
+        Determines the rows of the shard as a slice (contiguous range) or as an index array.
+        """
 
-        label_space = MSpace()
+        shard, num_shards, mode = self._shard
+        num_rows                = self._metadata['num_instances']
 
-        try:
-            for label in self._dataset['target_names']:
-                label_space.add_dim(Label(p_name_short=str(label)))
-        except KeyError:
-            pass
+        if ( num_shards == 1 ) or ( mode == self.C_SHARD_RANGE ):
+            return slice(shard * num_rows // num_shards, (shard + 1) * num_rows // num_shards)
 
-        return label_space
+        if mode == self.C_SHARD_STRIDE:
+            return numpy.arange(shard, num_rows, num_shards)
+
+        # Multiplicative hashing (Fibonacci hashing) of the 64 bit row indices
+        hashes = numpy.arange(num_rows, dtype=numpy.uint64) * numpy.uint64(0x9E3779B97F4A7C15)
+        hashes = hashes >> numpy.uint64(32)
+        return numpy.flatnonzero(hashes % numpy.uint64(num_shards) == shard)
 
 
 ## --------------------------------------------------------------------------------------------------
-    def _download(self):
+    def _get_permutation(self, p_epoch : int) -> numpy.ndarray:
         """
-        Custom download class that assigns the related sklearn dataset and its functionalities to _dataset attribute
+        Computes the permutation index of the specified epoch.
         """
 
-        self._dataset = eval("sklearn_datasets."
-                         + WrStreamProviderSklearn._load_utils[WrStreamProviderSklearn._datasets.index(self.C_ID)])
+        rng = numpy.random.default_rng(numpy.random.SeedSequence(entropy=self._shuffle_seed, spawn_key=(p_epoch,)))
 
-        self._num_instances = len(self._dataset.data)
-        self.C_SCIREF_ABSTRACT = eval("len(sklearn_datasets."
-                                 + WrStreamProviderSklearn._load_utils[WrStreamProviderSklearn._datasets.index(self.C_ID)]
-                                 + ".DESCR)")
+        if self._shuffle_block_size == 1:
+            return rng.permutation(self._num_instances)
 
-        return True
+        num_blocks = -(-self._num_instances // self._shuffle_block_size)
+        block_rank = numpy.empty(num_blocks, dtype=numpy.intp)
+        block_rank[rng.permutation(num_blocks)] = numpy.arange(num_blocks)
+        block_ids  = numpy.arange(self._num_instances) // self._shuffle_block_size
+
+        return numpy.lexsort( ( rng.random(self._num_instances), block_rank[block_ids] ) )
 
 
 ## --------------------------------------------------------------------------------------------------
-    def _get_next(self) -> Instance:
+    def set_replay_clock(self, p_rate : float = None, p_tstamp_feature = None, p_speed : float = 1.0):
         """
-        Custom method to get the instances one after another sequentially in the Sklearn stream
+        Sets up a replay clock for the real operation mode (Mode.C_MODE_REAL). Instances are then
+        emitted at a target rate or according to the values of a time stamp feature, instead of as
+        fast as possible. The emission times are precomputed on each reset as offsets to the start
+        of the replay. The stream waits for the absolute deadline of each instance by sleeping and
+        busy-waiting for the final C_CLOCK_SPIN_TIME seconds. Since deadlines do not depend on 
+        previous waiting times, delays do not accumulate; a delayed stream catches up by emitting
+        without waiting. The deadlines are assigned as time stamps to the instances. Without
+        parameters, the replay clock is turned off. The change takes effect on the next reset.
+
+        Parameters
+        ----------
+        p_rate : float
+            Target rate in instances per second. Default = None.
+        p_tstamp_feature
+            Index or name of a feature with time stamps in seconds. Default = None.
+        p_speed : float
+            Speed-up factor applied to the time stamps of p_tstamp_feature. Default = 1.0.
+        """
+
+        if ( p_rate is not None ) and ( p_tstamp_feature is not None ):
+            raise ParamError('Please specify either the parameter "p_rate" or "p_tstamp_feature"')
+
+        if ( p_rate is not None ) and ( p_rate <= 0 ):
+            raise ParamError('Please set the parameter "p_rate" > 0')
+
+        if p_speed <= 0:
+            raise ParamError('Please set the parameter "p_speed" > 0')
+
+        if ( p_rate is None ) and ( p_tstamp_feature is None ):
+            self._clock = None
+        else:
+            self._clock = ( p_rate, p_tstamp_feature, p_speed )
+
+        self._schedule = None
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_schedule(self) -> numpy.ndarray:
+        """
+        Computes the emission times of all instances in replay order as offsets in seconds to the
+        start of the replay.
+        """
+
+        rate, tstamp_feature, speed = self._clock
+
+        if rate is not None:
+            return numpy.arange(self._num_instances, dtype=numpy.float64) / rate
+
+        if isinstance(tstamp_feature, str):
+            try:
+                feature_names = list(self._dataset['feature_names'])
+            except KeyError:
+                feature_names = []
+
+            try:
+                tstamp_feature = feature_names.index(tstamp_feature)
+            except ValueError:
+                raise ParamError('Feature "' + tstamp_feature + '" not found')
+
+        tstamps = self._dataset['data'][:, tstamp_feature]
+        if sparse.issparse(tstamps): tstamps = tstamps.toarray().ravel()
+        tstamps = numpy.asarray(tstamps, dtype=numpy.float64)
+
+        if self._perm is not None: 
+            tstamps = tstamps[self._perm]
+        else:
+            tstamps = tstamps[self._offset:self._offset + self._num_instances]
+
+        # Empty shard
+        if self._num_instances == 0: return tstamps
+
+        return ( tstamps - tstamps[0] ) / speed
+
+
+## --------------------------------------------------------------------------------------------------
+    def _wait_for_deadline(self, p_index : int) -> float:
+        """
+        Waits for the emission time of the instance with the specified replay index.
 
         Returns
         -------
-        instance:
-            Next instance in the Sklearn stream object (None after the last instance in the dataset).
+        float
+            Emission time in seconds since the start of the replay.
         """
 
-        if self._index >= self._num_instances: raise StopIteration
+        tstamp   = float(self._schedule[p_index])
+        deadline = self._perf_counter0 + tstamp
+        wait     = deadline - time.perf_counter()
 
-        feature_data = Element(self._feature_space)
-        label_data = Element(self._label_space)
-        feature_data.set_values(self._dataset['data'][self._index])
-        label_data.set_values(numpy.asarray([self._dataset['target'][self._index]]))
+        if wait > self.C_CLOCK_SPIN_TIME:
+            time.sleep(wait - self.C_CLOCK_SPIN_TIME)
 
-        self._index += 1
+        while time.perf_counter() < deadline: pass
+
+        return tstamp
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_prefetch(self, p_depth : int = 0, p_batch_size : int = None):
+        """
+        Turns the background prefetching on or off. A producer thread creates the next instances
+        or batches in advance and puts them into a bounded queue, while the consumer processes the
+        current ones. Reading data and creating objects this way overlaps with the processing in
+        the consumer thread. The producer thread is shut down and restarted on each reset. The 
+        change takes effect on the next reset.
+
+        Parameters
+        ----------
+        p_depth : int
+            Maximum number of prefetched instances or batches. Default = 0 (no prefetching).
+        p_batch_size : int
+            If specified, batches of this size are prefetched for method get_next_batch(). 
+            Otherwise, instances are prefetched for the per-instance iteration. Default = None.
+        """
+
+        if p_depth < 0:
+            raise ParamError('Please set the parameter "p_depth" >= 0')
+
+        if ( p_batch_size is not None ) and ( p_batch_size < 1 ):
+            raise ParamError('Please set the parameter "p_batch_size" >= 1')
+
+        self._prefetch = ( p_depth, p_batch_size )
+        self._pool     = None
+
+
+## --------------------------------------------------------------------------------------------------
+    def _start_prefetch(self):
+        """
+        Starts the producer thread at the current replay index.
+        """
+
+        depth, batch_size   = self._prefetch
+        self._prefetch_queue = queue.Queue(maxsize=depth)
+        self._prefetch_stop  = threading.Event()
+        self._prefetch_done  = False
+        self._producer       = threading.Thread( target=self._produce, 
+                                                 args=(self._prefetch_queue, self._prefetch_stop, self._index, batch_size),
+                                                 daemon=True )
+        self._producer.start()
+
+
+## --------------------------------------------------------------------------------------------------
+    def _stop_prefetch(self):
+        """
+        Shuts down a running producer thread and discards the prefetched items.
+        """
+
+        if self._producer is None: return
+
+        self._prefetch_stop.set()
+        self._producer.join()
+        self._producer = None
+
+
+## --------------------------------------------------------------------------------------------------
+    def _produce(self, p_queue : queue.Queue, p_stop : threading.Event, p_index : int, p_batch_size : int):
+        """
+        Body of the producer thread. The end of the stream is signaled by None, errors are passed
+        to the consumer as exception objects.
+        """
+
+        def put(p_item) -> bool:
+            while not p_stop.is_set():
+                try:
+                    p_queue.put(p_item, timeout=self.C_PREFETCH_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+
+            return False
+
+        index = p_index
+
+        try:
+            while index < self._num_instances:
+                if p_batch_size is None:
+                    item   = self._create_instance(p_index=index)
+                    index += 1
+                else:
+                    item   = self._create_batch(p_index=index, p_batch_size=p_batch_size)
+                    index += item[0].get_values().shape[0]
+
+                if not put(item): return
+
+            put(None)
+
+        except Exception as e:
+            put(e)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_prefetched(self, p_batch_size : int = None):
+        """
+        Takes the next prefetched instance or batch from the queue.
+        """
+
+        if p_batch_size != self._prefetch[1]:
+            if self._prefetch[1] is None:
+                raise RuntimeError('Instances are prefetched, batch access is not possible')
+            elif p_batch_size is None:
+                raise RuntimeError('Batches are prefetched, per-instance access is not possible')
+            else:
+                raise ParamError('Batches of size ' + str(self._prefetch[1]) + ' are prefetched')
+
+        if self._prefetch_done: raise StopIteration
+
+        item = self._prefetch_queue.get()
+
+        if item is None:
+            self._prefetch_done = True
+            raise StopIteration
+
+        if isinstance(item, Exception):
+            self._prefetch_done = True
+            raise item
+
+        return item
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_instance_pool(self, p_size : int = 0, p_explicit_release : bool = False):
+        """
+        Turns the reuse of pre-allocated instances on or off. Instead of creating new instance and
+        element objects for each row, the stream then takes the instances from a pool of type 
+        InstancePoolSklearn and overwrites their data. This reduces the allocations per instance 
+        and thus the load of the garbage collector at high throughput. Batch access is not 
+        affected. The change takes effect on the next reset.
+
+        Parameters
+        ----------
+        p_size : int
+            Number of pooled instances. In ring mode, an instance is overwritten by the p_size-th 
+            next instance, e.g. by the next instance for p_size = 1. Instances held by a 
+            prefetching thread are added to the ring. Default = 0 (no pooling).
+        p_explicit_release : bool
+            If True, instances are reused only after they were returned by method 
+            release_instance(). Default = False (ring mode).
+        """
+
+        if p_size < 0:
+            raise ParamError('Please set the parameter "p_size" >= 0')
+
+        self._pool_param = ( p_size, p_explicit_release )
+        self._pool       = None
+
+
+## --------------------------------------------------------------------------------------------------
+    def release_instance(self, p_instance : Instance):
+        """
+        Returns an instance to the instance pool in explicit release mode. The instance must not be 
+        used by the consumer afterwards. See method set_instance_pool() for further details.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance emitted by this stream.
+        """
+
+        if self._pool is not None: self._pool.release(p_instance=p_instance)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _create_pool(self):
+        """
+        Creates the instance pool for the current feature and label spaces.
+        """
+
+        size, explicit_release = self._pool_param
+        target                 = self._dataset['target']
+
+        if sparse.issparse(target):
+            label_shape = ( target.shape[1], )
+            label_dtype = numpy.float64
+        else:
+            label_shape = ( 1, ) + numpy.shape(target)[1:]
+            label_dtype = numpy.asarray(target[0:1]).dtype
+
+        # The prefetching thread keeps the queued instances and the one waiting for the queue
+        if ( not explicit_release ) and ( self._prefetch[0] > 0 ): size += self._prefetch[0] + 1
+
+        return InstancePoolSklearn( p_feature_space=self._feature_space,
+                                    p_label_space=self._label_space,
+                                    p_size=size,
+                                    p_explicit_release=explicit_release,
+                                    p_sparse=self._sparse,
+                                    p_label_shape=label_shape,
+                                    p_label_dtype=label_dtype )
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_instrumentation(self, p_enabled : bool = True):
+        """
+        Turns the instrumentation of the replay on or off. While it is turned on, the stream counts
+        the emitted instances and batches and the bytes of their feature and label values, and 
+        measures the number of calls and the time spent in the methods _get_next(), _download() and
+        _reset() on the monotonic clock time.perf_counter(). The time of method _get_next() 
+        includes the waiting time of a replay clock. Instances created in advance by a prefetching
+        thread are counted when they are emitted.
+
+        While the instrumentation is turned off, it costs one check per call of the timed methods.
+
+        Parameters
+        ----------
+        p_enabled : bool
+            If True, the instrumentation is turned on. The recorded values of a previous period are
+            kept. Otherwise, it is turned off and the recorded values are discarded. Default = True.
+        """
+
+        if not p_enabled:
+            self._instr = None
+        elif self._instr is None:
+            self._instr = {}
+            self.reset_instrumentation()
+
+
+## --------------------------------------------------------------------------------------------------
+    def _record(self, p_instr : dict, p_method : str, p_tp_start : float, p_instance : Instance = None):
+        """
+        Records a call of one of the timed methods and, if specified, the emitted instance.
+        """
+
+        p_instr[p_method + '_calls']    += 1
+        p_instr[p_method + '_duration'] += time.perf_counter() - p_tp_start
+
+        if p_instance is not None:
+            p_instr['instances'] += 1
+            p_instr['bytes']     += self._get_nbytes(p_instance=p_instance)
+
+
+## --------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_nbytes(p_instance : Instance = None, p_values = None) -> int:
+        """
+        Returns the number of bytes of the feature and label values of an instance or of a dense 
+        or sparse array of values.
+        """
+
+        if p_instance is not None:
+            feature_data = p_instance.get_feature_data()
+
+            if isinstance(feature_data, SparseElementSklearn):
+                indices, data = feature_data.get_nonzero()
+                nbytes        = indices.nbytes + data.nbytes
+            else:
+                nbytes        = WrStreamSklearn._get_nbytes(p_values=feature_data.get_values())
+
+            return nbytes + WrStreamSklearn._get_nbytes(p_values=p_instance.get_label_data().get_values())
+
+        if sparse.issparse(p_values):
+            return p_values.data.nbytes + p_values.indices.nbytes + p_values.indptr.nbytes
+
+        return numpy.asarray(p_values).nbytes
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_instrumentation(self) -> dict:
+        """
+        Returns a snapshot of the values recorded by the instrumentation. See method 
+        set_instrumentation() for further details.
+
+        Returns
+        -------
+        instrumentation : dict
+            None, if the instrumentation is turned off. Otherwise a dictionary with the entries 
+            'instances' (emitted instances, including those of batches), 'batches', 'bytes' 
+            (feature and label values), 'elapsed' (seconds since the start or the last reset of the
+            recording), and '<method>_calls' and '<method>_duration' (seconds) for the timed 
+            methods _get_next, _download and _reset.
+        """
+
+        if self._instr is None: return None
+
+        snapshot            = self._instr.copy()
+        snapshot['elapsed'] = time.perf_counter() - snapshot.pop('tp_start')
+        return snapshot
+
+
+## --------------------------------------------------------------------------------------------------
+    def reset_instrumentation(self):
+        """
+        Sets all values recorded by the instrumentation to zero and restarts its period. This has
+        no effect on a stream without instrumentation.
+        """
+
+        if self._instr is None: return
+
+        self._instr = { 'instances' : 0, 'batches' : 0, 'bytes' : 0, 'tp_start' : time.perf_counter() }
+
+        for name in self.C_INSTR_METHODS:
+            self._instr[name + '_calls']    = 0
+            self._instr[name + '_duration'] = 0.0
+
+
+## --------------------------------------------------------------------------------------------------
+    def seek(self, p_index : int):
+        """
+        Moves the stream to the specified replay index in constant time, so that the next instance
+        or batch starts there. Instance ids continue at the new position. A running prefetching 
+        thread is restarted at the new position. With a replay clock, the emission times continue
+        from the schedule of the new position without waiting for the skipped instances. The stream
+        is reset on demand.
+
+        Parameters
+        ----------
+        p_index : int
+            Replay index in [0, number of instances]. The number of instances positions the stream
+            at its end.
+        """
+
+        if self._index is None: iter(self)
+
+        if ( p_index < 0 ) or ( p_index > self._num_instances ):
+            raise ParamError('Please set the parameter "p_index" in [0, ' + str(self._num_instances) + ']')
+
+        self._stop_prefetch()
+
+        self._index        = int(p_index)
+        self._next_inst_id = int(p_index)
+
+        if ( self._schedule is not None ) and ( p_index < self._num_instances ):
+            self._perf_counter0 = time.perf_counter() - float(self._schedule[p_index])
+
+        if self._prefetch[0] > 0:
+            self._start_prefetch()
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_cursor(self) -> dict:
+        """
+        Returns the current replay position as a cursor. The cursor consists of plain values only,
+        so that it can be stored as JSON and passed to method set_cursor() of a newly created 
+        stream, e.g. to resume an interrupted replay. Since permutations are derived from the seed
+        and the epoch, a shuffled replay is resumed without storing its permutation.
+
+        Returns
+        -------
+        cursor : dict
+            Dictionary with the entries 'id' (stream id), 'index' (replay index of the next 
+            instance), 'shuffle', 'seed', 'block_size' and 'epoch' (settings of the shuffled 
+            replay) and 'shard' (shard, number of shards and partitioning mode).
+        """
+
+        return { 'id'         : self._id,
+                 'index'      : 0 if self._index is None else int(self._index),
+                 'shuffle'    : self._shuffle,
+                 'seed'       : int(self._shuffle_seed),
+                 'block_size' : self._shuffle_block_size,
+                 'epoch'      : max(0, self._epoch - 1) if self._shuffle else 0,
+                 'shard'      : list(self._shard) }
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_cursor(self, p_cursor : dict):
+        """
+        Restores a replay position returned by method get_cursor(). The stream is reset with the 
+        shuffle and shard settings of the cursor and moved to its replay index, so that the replay 
+        can be continued by next() or get_next_batch().
+
+        Parameters
+        ----------
+        p_cursor : dict
+            Replay cursor as returned by method get_cursor().
+        """
+
+        if p_cursor['id'] != self._id:
+            raise ParamError('Cursor of stream "' + str(p_cursor['id']) + '" does not belong to stream "' + str(self._id) + '"')
+
+        self.set_shuffle( p_shuffle=p_cursor['shuffle'], 
+                          p_seed=p_cursor['seed'], 
+                          p_block_size=p_cursor['block_size'] )
+        self.set_shard( p_shard=p_cursor['shard'][0],
+                        p_num_shards=p_cursor['shard'][1],
+                        p_mode=p_cursor['shard'][2] )
+
+        self._epoch = p_cursor['epoch']
+        iter(self)
+        self.seek(p_index=p_cursor['index'])
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_feature_space(self)-> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+            if not self._downloaded: return None       
+
+        if self._sparse:
+            # High-dimensional sparse data: dimensions are created on first demand only
+            try:
+                features = self._dataset['feature_names']
+            except KeyError:
+                features = None
+
+            return LazyFeatureSpaceSklearn( p_num_dim=self._dataset['data'].shape[1], 
+                                            p_feature_names=features,
+                                            p_feature_boundaries=self._get_boundaries() )
+
+        feature_space = MSpace()
+
+        try:
+            features = self._dataset.feature_names
+
+        except:
+            if numpy.ndim(self._dataset['data']) > 1:
+                features = self._dataset['feature_names']
+            else:
+                features = ['Attr_1']
+
+        boundaries = self._get_boundaries()
+
+        for i, feature in enumerate(features):
+            if ( boundaries is None ) or not numpy.isfinite(boundaries[0][i]):
+                feature_space.add_dim(Feature(p_name_short=str(feature)))
+            else:
+                feature_space.add_dim(Feature( p_name_short=str(feature), 
+                                               p_boundaries=[ float(boundaries[0][i]), float(boundaries[1][i]) ] ))
+
+        return feature_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_boundaries(self):
+        """
+        Returns the lower and upper boundaries of all features as a pair of arrays or None, if no 
+        feature statistics are available.
+        """
+
+        if ( self._stats is None ) or ( self._stats['min'] is None ): return None
+        return self._stats['min'], self._stats['max']
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_label_space(self) -> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+            if not self._downloaded: return None       
+
+        label_space = MSpace()
+
+        try:
+            for label in self._dataset['target_names']:
+                label_space.add_dim(Label(p_name_short=str(label)))
+        except KeyError:
+            pass
+
+        return label_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _download(self):
+        """
+        Custom download class that assigns the related sklearn dataset and its functionalities to _dataset attribute.
+        If a dataset cache is assigned, a valid cache entry is replayed memory-mapped instead. The loader
+        is called exactly once and all metadata are derived from its result.
+        """
+
+        tp_start = time.perf_counter()
+
+        stats   = None
+        dataset = None
+
+        if self._preloaded is not None:
+            # Shallow copy, so that projections do not affect the owner of the dataset
+            dataset         = sklearn_utils.Bunch(**self._preloaded)
+            self._preloaded = None
+            source          = 'preloaded'
+
+            if self._pre_stats is not None:
+                # Shallow copy, so that the projection does not affect the owner of the statistics
+                stats           = dict(self._pre_stats)
+                self._pre_stats = None
+            elif ( self._cache is not None ) and self._cache.is_valid(p_name=self._name):
+                stats = self._cache.load_statistics(p_name=self._name)
+
+        elif ( self._cache is not None ) and self._cache.is_valid(p_name=self._name):
+            # None, if the cache entry has vanished in the meantime
+            dataset = self._cache.load(p_name=self._name)
+            stats   = self._cache.load_statistics(p_name=self._name)
+            source  = 'cache'
+
+        if dataset is None:
+            loader, loader_kwargs = WrStreamProviderSklearn._loaders[self._name]
+            loader                = getattr(sklearn_datasets, loader)
+
+            if ( self._data_home is not None ) and ( 'data_home' in inspect.signature(loader).parameters ):
+                loader_kwargs = dict(loader_kwargs, data_home=self._data_home)
+
+            dataset = loader(**loader_kwargs)
+            stats   = None
+            source  = 'scikit-learn'
+
+            if ( self._cache is not None ) and self._cache.store(p_name=self._name, p_dataset=dataset):
+                # Replay from the cache to release the in-memory copy
+                dataset_cached = self._cache.load(p_name=self._name)
+                if dataset_cached is not None: dataset = dataset_cached
+
+        self._dataset = dataset
+
+        duration = time.perf_counter() - tp_start
+
+        for key in [ 'data', 'target' ]:
+            if isinstance(self._dataset.get(key), list):
+                # Lists (like the raw texts of 20newsgroups) are converted once into object arrays,
+                # so that shuffled or sharded rows can be gathered by index arrays
+                array                 = numpy.empty(len(self._dataset[key]), dtype=object)
+                array[:]              = self._dataset[key]
+                self._dataset[key]    = array
+
+        if sparse.issparse(self._dataset['data']):
+            # Sparse data are streamed row by row from the CSR format without densifying
+            self._sparse = True
+            self._dataset['data'] = sparse.csr_matrix(self._dataset['data'])
+
+        if sparse.issparse(self._dataset['target']):
+            self._dataset['target'] = sparse.csr_matrix(self._dataset['target'])
+
+        if stats is None:
+            stats = self._compute_statistics(p_data=self._dataset['data'], p_target=self._dataset['target'])
+            if self._cache is not None: self._cache.store_statistics(p_name=self._name, p_stats=stats)
+
+        if ( self._features is not None ) or ( self._dtype_data is not None ):
+            data, feature_names = self._load_projection( p_data=self._dataset['data'], 
+                                                         p_feature_names=self._dataset.get('feature_names') )
+            self._dataset['data'] = data
+            if feature_names is not None: self._dataset['feature_names'] = feature_names
+
+            if ( self._columns is not None ) and ( stats['min'] is not None ):
+                for key in [ 'min', 'max', 'mean', 'std' ]: stats[key] = stats[key][self._columns]
+
+        self._stats    = stats
+        self._metadata = self._setup_metadata()
+        self._metadata['num_labels']    = stats['num_labels']
+        self._metadata['load_source']   = source
+        self._metadata['load_duration'] = duration
+
+        self._num_instances    = self._metadata['num_instances']
+        self.C_SCIREF_ABSTRACT = self._metadata['descr']
+
+        self.log(self.C_LOG_TYPE_I, 'Dataset loaded from', source, 'in', round(duration, 3), 'seconds')
+
+        if self._instr is not None: self._record(p_instr=self._instr, p_method='_download', p_tp_start=tp_start)
+
+        return True
+
+
+## --------------------------------------------------------------------------------------------------
+    def _load_projection(self, p_data, p_feature_names = None):
+        """
+        Provides the data array projected to the feature subset and cast to the data type of the 
+        stream. With a dataset cache, the projection is computed once, stored as separate cache 
+        entry and replayed memory-mapped afterwards. Otherwise, it is computed in memory by method
+        _project_features().
+        """
+
+        if self._cache is None:
+            return self._project_features(p_data=p_data, p_feature_names=p_feature_names)
+
+        names   = None if p_feature_names is None else [ str(name) for name in p_feature_names ]
+        columns = self._get_columns(p_feature_names=names)
+        dtype   = None if self._dtype_data is None else numpy.dtype(self._dtype_data).str
+        key     = hashlib.sha1(json.dumps([ columns, dtype ]).encode()).hexdigest()[0:12]
+        name    = self._name + '.' + key
+
+        projection = None
+
+        if self._cache.is_valid(p_name=name):
+            # None, if the cache entry has vanished in the meantime
+            projection = self._cache.load(p_name=name)
+
+        if projection is not None:
+            self._columns = columns
+        else:
+            data, feature_names = self._project_features(p_data=p_data, p_feature_names=p_feature_names)
+            projection          = { 'data' : data, 'feature_names' : feature_names }
+
+            if self._cache.store(p_name=name, p_dataset=projection):
+                # Replay from the cache to release the in-memory copy
+                projection_cached = self._cache.load(p_name=name)
+                if projection_cached is not None: projection = projection_cached
+
+        return projection['data'], projection.get('feature_names')
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_columns(self, p_feature_names : list = None) -> list:
+        """
+        Determines the column indices of the feature subset or None, if no subset is specified.
+        """
+
+        if self._features is None: return None
+
+        columns = []
+
+        for feature in self._features:
+            if isinstance(feature, str):
+                try:
+                    columns.append(p_feature_names.index(feature))
+                except (AttributeError, ValueError):
+                    raise ParamError('Feature "' + feature + '" not found')
+            else:
+                columns.append(int(feature))
+
+        return columns
+
+
+## --------------------------------------------------------------------------------------------------
+    def _project_features(self, p_data, p_feature_names = None):
+        """
+        Applies the feature subset and the data type of the stream to the complete data array at 
+        once. The result is a compact copy in memory, also for memory-mapped datasets.
+
+        Parameters
+        ----------
+        p_data
+            Dense or sparse data array.
+        p_feature_names
+            Optional feature names of the data array. Default = None.
+
+        Returns
+        -------
+        data
+            Projected and cast data array.
+        feature_names : list
+            Names of the selected features or None, if no subset is specified.
+        """
+
+        if not ( isinstance(p_data, numpy.ndarray) or sparse.issparse(p_data) ):
+            raise ParamError('Projection and data type are not supported for non-numeric data')
+
+        feature_names = None
+
+        if self._features is not None:
+            names   = None if p_feature_names is None else [ str(name) for name in p_feature_names ]
+            columns = self._get_columns(p_feature_names=names)
+
+            self._columns = columns
+            p_data        = p_data[:, columns]
+            feature_names = [ 'Attr_' + str(col + 1) if names is None else names[col] for col in columns ]
+
+        if self._dtype_data is not None:
+            p_data = p_data.astype(self._dtype_data, copy=False)
+
+        return p_data, feature_names
+
+
+## --------------------------------------------------------------------------------------------------
+    def _compute_statistics(self, p_data, p_target) -> dict:
+        """
+        Computes the per-feature minimum, maximum, mean and standard deviation of the complete data
+        array in one vectorized pass, together with the label cardinality. Dense arrays are 
+        processed in blocks of C_STATS_BLOCK_SIZE rows, so that memory-mapped datasets are not 
+        loaded completely. NaN values are ignored. Sparse arrays include their implicit zeros.
+
+        Parameters
+        ----------
+        p_data
+            Dense or sparse data array.
+        p_target
+            Dense or sparse target array.
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with the entries 'min', 'max', 'mean', 'std' (arrays with one value per 
+            feature, None for non-numeric data) and 'num_labels' (number of distinct labels or 
+            label columns, None for regression targets).
+        """
+
+        stats = { 'min' : None, 'max' : None, 'mean' : None, 'std' : None }
+
+        # 1 Feature statistics
+        if sparse.issparse(p_data):
+            num_rows        = p_data.shape[0]
+            col_sum         = numpy.bincount(p_data.indices, weights=p_data.data, minlength=p_data.shape[1])
+            col_sum_sq      = numpy.bincount(p_data.indices, weights=numpy.square(p_data.data, dtype=numpy.float64), minlength=p_data.shape[1])
+            stats['min']    = p_data.min(axis=0).toarray().ravel().astype(numpy.float64)
+            stats['max']    = p_data.max(axis=0).toarray().ravel().astype(numpy.float64)
+            stats['mean']   = col_sum / max(1, num_rows)
+            stats['std']    = numpy.sqrt(numpy.maximum(col_sum_sq / max(1, num_rows) - stats['mean'] ** 2, 0))
+
+        elif isinstance(p_data, numpy.ndarray) and ( p_data.dtype.kind in 'biuf' ) and ( p_data.ndim == 2 ):
+            num_cols = p_data.shape[1]
+            col_min  = numpy.full(num_cols, numpy.inf)
+            col_max  = numpy.full(num_cols, -numpy.inf)
+            col_mean = numpy.zeros(num_cols)
+            col_m2   = numpy.zeros(num_cols)
+            count    = numpy.zeros(num_cols)
+
+            for start in range(0, p_data.shape[0], self.C_STATS_BLOCK_SIZE):
+                block      = numpy.asarray(p_data[start:start + self.C_STATS_BLOCK_SIZE], dtype=numpy.float64)
+                valid      = ~numpy.isnan(block)
+                count_b    = valid.sum(axis=0)
+                col_min    = numpy.minimum(col_min, numpy.where(valid, block, numpy.inf).min(axis=0))
+                col_max    = numpy.maximum(col_max, numpy.where(valid, block, -numpy.inf).max(axis=0))
+                mean_b     = numpy.where(valid, block, 0).sum(axis=0) / numpy.maximum(count_b, 1)
+                m2_b       = numpy.square(numpy.where(valid, block - mean_b, 0)).sum(axis=0)
+
+                # Pairwise combination of the block moments (Chan et al.)
+                count_new  = count + count_b
+                delta      = mean_b - col_mean
+                col_mean  += delta * count_b / numpy.maximum(count_new, 1)
+                col_m2    += m2_b + delta ** 2 * count * count_b / numpy.maximum(count_new, 1)
+                count      = count_new
+
+            empty        = ( count == 0 )
+            stats['min']    = numpy.where(empty, numpy.nan, col_min)
+            stats['max']    = numpy.where(empty, numpy.nan, col_max)
+            stats['mean']   = numpy.where(empty, numpy.nan, col_mean)
+            stats['std']    = numpy.where(empty, numpy.nan, numpy.sqrt(col_m2 / numpy.maximum(count, 1)))
+
+        # 2 Label cardinality
+        if sparse.issparse(p_target) or ( numpy.ndim(p_target) == 2 ):
+            stats['num_labels'] = int(p_target.shape[1])
+        elif numpy.asarray(p_target).dtype.kind in 'biuUSO':
+            stats['num_labels'] = int(numpy.unique(numpy.asarray(p_target)).size)
+        else:
+            stats['num_labels'] = None
+
+        return stats
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_feature_statistics(self) -> dict:
+        """
+        Returns the feature statistics of the dataset, which are computed once at load time and 
+        stored together with a cached dataset. The minimum and maximum values are also set as 
+        boundaries of the features in the feature space, so that consumers like normalizers do not
+        need a warm-up pass over the data. The dataset is loaded on demand.
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with the entries 'min', 'max', 'mean', 'std' (arrays with one value per 
+            feature of the stream, None for non-numeric data) and 'num_labels' (number of distinct 
+            labels or label columns, None for regression targets). Streams of svmlight files 
+            provide no statistics (None).
+        """
+
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        return self._stats
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_metadata(self) -> dict:
+        """
+        Derives the metadata of the loaded dataset.
+        """
+
+        metadata = {}
+
+        for key in [ 'data', 'target' ]:
+            try:
+                value = self._dataset[key]
+            except KeyError:
+                metadata[key + '_shape'] = None
+                metadata[key + '_dtype'] = None
+                continue
+
+            try:
+                metadata[key + '_shape'] = tuple(value.shape)
+            except AttributeError:
+                metadata[key + '_shape'] = ( len(value), )
+
+            try:
+                metadata[key + '_dtype'] = str(value.dtype)
+            except AttributeError:
+                metadata[key + '_dtype'] = type(value).__name__
+
+        metadata['num_instances'] = metadata['data_shape'][0]
+        metadata['descr']         = self._dataset.get('DESCR', '')
+
+        return metadata
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_metadata(self) -> dict:
+        """
+        Returns the metadata of the dataset. The dataset is loaded on demand.
+
+        Returns
+        -------
+        metadata : dict
+            Dictionary with the entries 'data_shape', 'data_dtype', 'target_shape', 'target_dtype',
+            'num_instances', 'num_labels', 'descr', 'load_source' ('scikit-learn', 'cache' or 
+            'preloaded') and 'load_duration' (seconds).
+        """
+
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        return self._metadata
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+        """
+        Custom method to get the instances one after another sequentially in the Sklearn stream
+
+        Returns
+        -------
+        instance:
+            Next instance in the Sklearn stream object (None after the last instance in the dataset).
+        """
+
+        instr = self._instr
+        if instr is not None: tp_start = time.perf_counter()
+
+        if self._producer is not None:
+            instance = self._get_prefetched()
+        else:
+            if self._index >= self._num_instances: raise StopIteration
+            instance = self._create_instance(p_index=self._index)
+
+        if ( self._schedule is not None ) and ( self.get_mode() == Mode.C_MODE_REAL ):
+            instance.tstamp = self._wait_for_deadline(p_index=self._index)
+
+        self._index += 1
+
+        if instr is not None: self._record(p_instr=instr, p_method='_get_next', p_tp_start=tp_start, p_instance=instance)
+
+        return instance
+
+
+## --------------------------------------------------------------------------------------------------
+    def _create_instance(self, p_index : int) -> Instance:
+        """
+        Creates the instance with the specified replay index.
+        """
+
+        if self._perm is None:
+            return self._get_instance(p_pos=self._offset + p_index)
+        else:
+            return self._get_instance(p_pos=self._perm[p_index])
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_instance(self, p_pos : int) -> Instance:
+        """
+        Creates an instance from the specified row of the loaded data and target arrays. With an
+        instance pool, a pooled instance is overwritten instead.
+        """
+
+        target = self._dataset['target']
+
+        if self._pool is not None:
+            instance     = self._pool.acquire()
+            feature_data = instance.get_feature_data()
+            label_data   = instance.get_label_data()
+        else:
+            instance     = None
+            feature_data = SparseElementSklearn(self._feature_space) if self._sparse else Element(self._feature_space)
+            label_data   = Element(self._label_space)
+
+        if self._sparse:
+            # Non-zero entries of the CSR row as zero-copy views
+            data         = self._dataset['data']
+            pos_start    = data.indptr[p_pos]
+            pos_end      = data.indptr[p_pos + 1]
+            feature_data.set_nonzero( p_indices=data.indices[pos_start:pos_end], 
+                                      p_data=data.data[pos_start:pos_end] )
+        else:
+            feature_data.set_values(self._dataset['data'][p_pos])
+
+        if sparse.issparse(target):
+            # Multi-label targets (like rcv1) are provided as dense indicator vector
+            if instance is None:
+                label_values = numpy.zeros(target.shape[1])
+            else:
+                label_values = label_data.get_values()
+                label_values.fill(0)
+
+            pos_start    = target.indptr[p_pos]
+            pos_end      = target.indptr[p_pos + 1]
+            label_values[target.indices[pos_start:pos_end]] = target.data[pos_start:pos_end]
+            label_data.set_values(label_values)
+        elif instance is None:
+            label_data.set_values(numpy.asarray([target[p_pos]]))
+        else:
+            label_data.get_values()[0] = target[p_pos]
+
+        if instance is None: return Instance(feature_data, label_data)
+        return instance
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_next_batch(self, p_batch_size : int) -> Tuple[BatchElement, BatchElement]:
+        """
+        Returns the next block of up to p_batch_size instances as a pair of batch elements. Their
+        values are zero-copy views of the related slices of the underlying data and target arrays.
+        The per-instance creation of elements and instances is avoided this way. Batch and 
+        per-instance access can be mixed and share the same stream position. In shuffled replay,
+        the batch values are gathered through the permutation index and hence are copies.
+
+        Parameters
+        ----------
+        p_batch_size : int
+            Maximum number of instances in the batch. The last batch may be smaller.
+
+        Returns
+        -------
+        feature_batch : BatchElement
+            Feature data of the batch, related to the feature space of the stream.
+        label_batch : BatchElement
+            Label data of the batch, related to the label space of the stream.
+        """
+
+        if p_batch_size < 1:
+            raise ParamError('Please set the parameter "p_batch_size" >= 1')
+
+        if self._producer is not None:
+            feature_batch, label_batch = self._get_prefetched(p_batch_size=p_batch_size)
+        else:
+            if self._index >= self._num_instances: raise StopIteration
+            feature_batch, label_batch = self._create_batch(p_index=self._index, p_batch_size=p_batch_size)
+
+        num_inst = feature_batch.get_values().shape[0]
+
+        if ( self._schedule is not None ) and ( self.get_mode() == Mode.C_MODE_REAL ):
+            # A batch is emitted at the emission time of its last instance
+            self._wait_for_deadline(p_index=self._index + num_inst - 1)
+
+        self._index        += num_inst
+        self._next_inst_id += num_inst
+
+        if self._instr is not None:
+            self._instr['instances'] += num_inst
+            self._instr['batches']   += 1
+            self._instr['bytes']     += self._get_nbytes(p_values=feature_batch.get_values()) + self._get_nbytes(p_values=label_batch.get_values())
+
+        return feature_batch, label_batch
+
+
+## --------------------------------------------------------------------------------------------------
+    def _create_batch(self, p_index : int, p_batch_size : int) -> Tuple[BatchElement, BatchElement]:
+        """
+        Creates the batch of up to p_batch_size instances starting at the specified replay index.
+        """
+
+        idx_end = min(p_index + p_batch_size, self._num_instances)
+
+        if self._perm is None:
+            rows = slice(self._offset + p_index, self._offset + idx_end)
+        else:
+            rows = self._perm[p_index:idx_end]
+
+        feature_batch = BatchElement(self._feature_space)
+        label_batch   = BatchElement(self._label_space)
+        feature_batch.set_values(self._dataset['data'][rows])
+        label_batch.set_values(self._dataset['target'][rows])
+
+        return feature_batch, label_batch
+
+
+## --------------------------------------------------------------------------------------------------
+    def iter_batches(self, p_batch_size : int) -> Iterator[Tuple[BatchElement, BatchElement]]:
+        """
+        Resets the stream and iterates it in blocks of p_batch_size instances. See method 
+        get_next_batch() for further details.
+
+        Parameters
+        ----------
+        p_batch_size : int
+            Maximum number of instances per batch.
+
+        Returns
+        -------
+        Iterator
+            Generator of pairs (feature_batch, label_batch).
+        """
+
+        iter(self)
+
+        while True:
+            try:
+                yield self.get_next_batch(p_batch_size=p_batch_size)
+            except StopIteration:
+                return
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_column_names(self) -> list:
+        """
+        Returns the feature names as column names for the export to tables.
+        """
+
+        return [ dim.get_name_short() for dim in self._feature_space.get_dims() ]
+
+
+## --------------------------------------------------------------------------------------------------
+    def _to_dataframe(self, p_data, p_target):
+        """
+        Converts data and target arrays to a pandas DataFrame. Dense arrays are wrapped without
+        copying.
+        """
+
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError('The export to DataFrames requires the package pandas')
+
+        if sparse.issparse(p_data):
+            frame = self._sparse_to_dataframe(p_data=p_data, p_columns=self._get_column_names())
+        else:
+            frame = pandas.DataFrame(p_data, columns=self._get_column_names(), copy=False)
+
+        if sparse.issparse(p_target):
+            label_names = [ 'target_' + dim.get_name_short() for dim in self._label_space.get_dims() ]
+            targets     = self._sparse_to_dataframe(p_data=p_target, p_columns=label_names)
+            for name in label_names: frame[name] = targets[name]
+        else:
+            frame['target'] = p_target
+
+        return frame
+
+
+## --------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _sparse_to_dataframe(p_data, p_columns : list):
+        """
+        Converts a sparse matrix to a DataFrame of sparse columns with fill value 0. The fill value
+        is set explicitly, since the one of DataFrame.sparse.from_spmatrix() depends on the pandas
+        version. Without method DataFrame.sparse.from_spmatrix(), the columns are converted one by
+        one.
+        """
+
+        import pandas
+
+        dtype = pandas.SparseDtype(p_data.dtype, fill_value=0)
+
+        try:
+            frame = pandas.DataFrame.sparse.from_spmatrix(p_data, columns=p_columns)
+        except AttributeError:
+            data  = sparse.csc_matrix(p_data)
+            frame = pandas.DataFrame( { column : pandas.arrays.SparseArray.from_spmatrix(data[:, i]) 
+                                        for i, column in enumerate(p_columns) } )
+
+        return frame.astype(dtype)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _to_record_batch(self, p_data, p_target):
+        """
+        Converts data and target arrays to a pyarrow RecordBatch with one column per feature.
+        """
+
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError('The export to Arrow requires the package pyarrow')
+
+        if sparse.issparse(p_data): p_data = p_data.toarray()
+        if sparse.issparse(p_target): p_target = p_target.toarray()
+
+        names  = self._get_column_names()
+        arrays = [ pyarrow.array(p_data[:, i]) for i in range(p_data.shape[1]) ]
+
+        if p_target.ndim == 1:
+            names.append('target')
+            arrays.append(pyarrow.array(p_target))
+        else:
+            for i, dim in enumerate(self._label_space.get_dims()):
+                names.append('target_' + dim.get_name_short())
+                arrays.append(pyarrow.array(p_target[:, i]))
+
+        return pyarrow.RecordBatch.from_arrays(arrays, names=names)
+
+
+## --------------------------------------------------------------------------------------------------
+    def to_dataframe(self, p_start : int = 0, p_stop : int = None):
+        """
+        Exports a window of instances in replay order (considering shard and shuffling) to a pandas
+        DataFrame with one column per feature and the target column(s). For contiguous windows of
+        dense data, the feature columns share the memory of the underlying data array. Shuffled 
+        windows are gathered into a new array. The stream position is not changed; a stream that
+        has not been reset yet is reset first. The package pandas is required (extra "export").
+
+        Parameters
+        ----------
+        p_start : int
+            Replay index of the first instance. Default = 0.
+        p_stop : int
+            Replay index after the last instance. Default = None (end of the stream).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Exported window.
+        """
+
+        if self._shard_rows is None: iter(self)
+
+        if p_stop is None: p_stop = self._num_instances
+
+        if ( p_start < 0 ) or ( p_stop > self._num_instances ) or ( p_start > p_stop ):
+            raise ParamError('Please specify a window within [0, ' + str(self._num_instances) + ']')
+
+        if self._perm is None:
+            rows = slice(self._offset + p_start, self._offset + p_stop)
+        else:
+            rows = self._perm[p_start:p_stop]
+
+        return self._to_dataframe(p_data=self._dataset['data'][rows], p_target=self._dataset['target'][rows])
+
+
+## --------------------------------------------------------------------------------------------------
+    def iter_dataframes(self, p_batch_size : int):
+        """
+        Resets the stream and iterates it in pandas DataFrames of up to p_batch_size instances.
+        Their feature columns share the memory of the batches provided by method get_next_batch().
+
+        Parameters
+        ----------
+        p_batch_size : int
+            Maximum number of instances per DataFrame.
+
+        Returns
+        -------
+        Iterator
+            Generator of pandas DataFrames.
+        """
+
+        for feature_batch, label_batch in self.iter_batches(p_batch_size=p_batch_size):
+            yield self._to_dataframe(p_data=feature_batch.get_values(), p_target=label_batch.get_values())
+
+
+## --------------------------------------------------------------------------------------------------
+    def iter_record_batches(self, p_batch_size : int):
+        """
+        Resets the stream and iterates it in Arrow record batches of up to p_batch_size instances,
+        with one column per feature and the target column(s). Feature columns of column-major 
+        arrays are shared with Arrow, those of row-major arrays are copied column by column. 
+        Sparse batches are densified. Requires the package pyarrow.
+
+        Parameters
+        ----------
+        p_batch_size : int
+            Maximum number of instances per record batch.
+
+        Returns
+        -------
+        Iterator
+            Generator of pyarrow.RecordBatch objects.
+        """
+
+        for feature_batch, label_batch in self.iter_batches(p_batch_size=p_batch_size):
+            yield self._to_record_batch(p_data=feature_batch.get_values(), p_target=label_batch.get_values())
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStreamGeneratorSklearn (Stream):
+    """
+    Wrapper class for unbounded synthetic streams based on the generators sklearn.datasets.make_*.
+    Instances are generated chunk-wise, so that only one chunk is kept in memory independent of 
+    the length of the stream. Each chunk is generated with its own random seed, derived from the 
+    stream seed and the chunk index. Replaying the stream after a reset provides the same 
+    instances.
+
+    The latent structure of make_blobs (cluster centers), make_regression (coefficients) and 
+    make_classification (hypercube vertices, cluster covariances, redundant and repeated features,
+    shift, scale and feature order) is drawn once from the stream seed and kept for all chunks, so
+    that all instances follow the same distribution. It is drawn on first use (reset or access to 
+    the feature/label space), so that creating the stream neither imports scikit-learn nor runs 
+    the generator. The samples of make_classification are drawn
+    by the stream following the algorithm of scikit-learn, with clusters assigned randomly per 
+    instance according to the class weights.
+
+    Parameters
+    ----------
+    p_id
+        Id of the stream.
+    p_name : str
+        Name of the stream. 
+    p_generator
+        Generator function of scikit-learn (e.g. sklearn.datasets.make_blobs) or its name in 
+        sklearn.datasets (e.g. 'make_blobs').
+    p_generator_params : dict
+        Parameters of the generator function except n_samples and random_state. Default = None.
+    p_num_instances : int
+        Number of instances in the stream. Default = 0 (unbounded).
+    p_chunk_size : int
+        Number of instances generated at once. Default = C_CHUNK_SIZE.
+    p_seed : int
+        Seed of the stream. Default = 0.
+    p_version : str
+        Version of the stream. Default = ''.
+    p_mode
+        Operation mode. Valid values are stored in constant C_VALID_MODES.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters.
+    """
+
+    C_NAME              = 'scikit-learn generator stream'
+    C_SCIREF_TYPE       = ScientificObject.C_SCIREF_TYPE_ONLINE
+
+    C_CHUNK_SIZE        = 1000
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_id, 
+                  p_name, 
+                  p_generator,
+                  p_generator_params : dict = None,
+                  p_num_instances : int = 0, 
+                  p_chunk_size : int = C_CHUNK_SIZE,
+                  p_seed : int = 0,
+                  p_version : str = '', 
+                  p_logging = Log.C_LOG_ALL, 
+                  p_mode = Mode.C_MODE_SIM, 
+                  **p_kwargs ):
+
+        if p_chunk_size < 1:
+            raise ParamError('Please set the parameter "p_chunk_size" >= 1')
+
+        self.C_ID = self._id = p_id
+        self._name              = p_name
+        self._generator         = p_generator
+        self._generator_params  = {} if p_generator_params is None else p_generator_params.copy()
+        self._chunk_size        = p_chunk_size
+        self._seed              = p_seed
+        self._chunk_id          = None
+        self._chunk_data        = None
+        self._chunk_target      = None
+        self._chunk_start       = 0
+        self._index             = 0
+        self._coef              = None
+        self._classification    = None
+        self._structure_ready   = False
+
+        for key in [ 'n_samples', 'random_state' ]:
+            if key in self._generator_params:
+                raise ParamError('Generator parameter "' + key + '" is controlled by the stream')
+
+        Stream.__init__( self,
+                         p_id=p_id,
+                         p_name=self.C_NAME + ' "' + p_name + '"',
+                         p_num_instances=p_num_instances,
+                         p_version=p_version,
+                         p_feature_space=None,
+                         p_label_space=None,
+                         p_mode=p_mode,
+                         p_logging=p_logging,
+                         **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return str(dict(id=str(self._id), name=self._name))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_chunk_seed(self, p_chunk_id : int) -> int:
+        """
+        Derives the random seed of a chunk from the stream seed and the chunk index. Any chunk can
+        be regenerated this way without generating its predecessors.
+        """
+
+        seed_seq = numpy.random.SeedSequence(entropy=self._seed, spawn_key=(p_chunk_id,))
+        return int(seed_seq.generate_state(1)[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_structure(self):
+        """
+        Resolves the generator and draws its latent structure that has to be kept for all chunks.
+        """
+
+        if isinstance(self._generator, str):
+            self._generator = getattr(sklearn_datasets, self._generator)
+
+        self.C_SCIREF_ABSTRACT = self._generator.__doc__
+        self._coef             = None
+        self._classification   = None
+
+        if self._generator is sklearn_datasets.make_blobs:
+            centers = self._generator_params.get('centers')
+            if ( centers is None ) or numpy.isscalar(centers):
+                # Cluster centers are drawn once from the stream seed
+                params  = self._generator_params.copy()
+                params['return_centers'] = True
+                self._generator_params['centers'] = self._generator( n_samples=1, 
+                                                                     random_state=self._seed, 
+                                                                     **params )[2]
+
+        elif self._generator is sklearn_datasets.make_regression:
+            # Regression coefficients are drawn once from the stream seed
+            params         = self._generator_params.copy()
+            params['coef'] = True
+            self._coef     = self._generator( n_samples=1, random_state=self._seed, **params )[2]
+
+        elif self._generator is sklearn_datasets.make_classification:
+            self._classification = self._setup_classification()
+
+        self._structure_ready = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_classification(self) -> dict:
+        """
+        Draws the class structure of make_classification once from the stream seed, following the
+        algorithm of scikit-learn.
+        """
+
+        params = { key : param.default for key, param in inspect.signature(self._generator).parameters.items() }
+        params.update(self._generator_params)
+
+        # Validation of the parameters by scikit-learn itself
+        n_classes  = params['n_classes']
+        n_clusters = n_classes * params['n_clusters_per_class']
+        self._generator(n_samples=max(n_clusters, 2), random_state=self._seed, **self._generator_params)
+
+        rng           = numpy.random.default_rng(self._seed)
+        n_features    = params['n_features']
+        n_informative = params['n_informative']
+        n_redundant   = params['n_redundant']
+        n_repeated    = params['n_repeated']
+        class_sep     = params['class_sep']
+
+        # 1 Cluster centroids on distinct vertices of a hypercube
+        if n_informative <= 30:
+            vertices  = rng.choice(2**n_informative, size=n_clusters, replace=False)
+            centroids = ( vertices[:, None] >> numpy.arange(n_informative) ) & 1
+        else:
+            centroids = rng.integers(2, size=(n_clusters, n_informative))
+
+        centroids = centroids.astype(numpy.float64) * 2 * class_sep - class_sep
+
+        if not params['hypercube']:
+            centroids *= rng.uniform(size=(n_clusters, 1))
+            centroids *= rng.uniform(size=(1, n_informative))
+
+        # 2 Cluster weights derived from the class weights
+        weights = params['weights']
+        if weights is None:
+            weights = [ 1.0 / n_classes ] * n_classes
+        elif len(weights) == ( n_classes - 1 ):
+            weights = list(weights) + [ 1.0 - sum(weights) ]
+
+        cluster_weights = numpy.asarray([ weights[k % n_classes] for k in range(n_clusters) ], dtype=numpy.float64)
+
+        # 3 Covariances, redundant and repeated features, shift, scale and feature order
+        n_dependent = n_informative + n_redundant
+        shift       = params['shift']
+        scale       = params['scale']
+
+        return { 'centroids'   : centroids,
+                 'covariances' : 2 * rng.uniform(size=(n_clusters, n_informative, n_informative)) - 1,
+                 'redundant'   : 2 * rng.uniform(size=(n_informative, n_redundant)) - 1,
+                 'repeated'    : ( ( n_dependent - 1 ) * rng.uniform(size=n_repeated) + 0.5 ).astype(numpy.intp),
+                 'weights'     : cluster_weights / cluster_weights.sum(),
+                 'shift'       : ( 2 * rng.uniform(size=n_features) - 1 ) * class_sep if shift is None else shift,
+                 'scale'       : 1 + 100 * rng.uniform(size=n_features) if scale is None else scale,
+                 'order'       : rng.permutation(n_features) if params['shuffle'] else None,
+                 'n_features'  : n_features,
+                 'n_classes'   : n_classes,
+                 'flip_y'      : params['flip_y'] }
+
+
+## -------------------------------------------------------------------------------------------------
+    def _sample_classification(self, p_num_samples : int, p_seed : int):
+        """
+        Draws samples from the class structure of make_classification.
+        """
+
+        structure     = self._classification
+        rng           = numpy.random.default_rng(p_seed)
+        centroids     = structure['centroids']
+        n_informative = centroids.shape[1]
+        n_redundant   = structure['redundant'].shape[1]
+        n_repeated    = structure['repeated'].shape[0]
+        n_useless     = structure['n_features'] - n_informative - n_redundant - n_repeated
+
+        clusters      = rng.choice(centroids.shape[0], size=p_num_samples, p=structure['weights'])
+        target        = clusters % structure['n_classes']
+        informative   = numpy.einsum('ni,nij->nj', 
+                                     rng.standard_normal(size=(p_num_samples, n_informative)), 
+                                     structure['covariances'][clusters]) + centroids[clusters]
+
+        data = numpy.hstack([ informative,
+                              informative @ structure['redundant'],
+                              numpy.hstack([ informative, informative @ structure['redundant'] ])[:, structure['repeated']],
+                              rng.standard_normal(size=(p_num_samples, n_useless)) ])
+
+        if structure['flip_y'] > 0:
+            flip_mask         = rng.uniform(size=p_num_samples) < structure['flip_y']
+            target[flip_mask] = rng.integers(structure['n_classes'], size=int(flip_mask.sum()))
+
+        data = ( data + structure['shift'] ) * structure['scale']
+
+        if structure['order'] is not None: data = data[:, structure['order']]
+
+        return data, target
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate_chunk(self, p_chunk_id : int):
+        """
+        Generates the chunk with the specified index and makes it the current chunk.
+        """
+
+        if not self._structure_ready: self._setup_structure()
+
+        chunk_start = p_chunk_id * self._chunk_size
+        chunk_size  = self._chunk_size
+
+        if self._num_instances > 0:
+            chunk_size = min(chunk_size, self._num_instances - chunk_start)
+
+        if self._classification is not None:
+            data, target = self._sample_classification( p_num_samples=chunk_size, 
+                                                        p_seed=self._get_chunk_seed(p_chunk_id=p_chunk_id) )
+            result       = None
+        else:
+            params = self._generator_params.copy()
+            if self._coef is not None: params['coef'] = True
+
+            result = self._generator( n_samples=chunk_size, 
+                                      random_state=self._get_chunk_seed(p_chunk_id=p_chunk_id), 
+                                      **params )
+
+            data, target = result[0], result[1]
+
+        if self._coef is not None:
+            # Replace the chunk coefficients by the stream coefficients, keeping bias and noise
+            target = target + data @ ( self._coef - result[2] )
+
+        self._chunk_id     = p_chunk_id
+        self._chunk_start  = chunk_start
+        self._chunk_data   = data
+        self._chunk_target = target
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+        """
+        Custom reset method for a generator stream.
+        """
+
+        self.get_feature_space()
+        self.get_label_space()
+
+        self._index = 0
+        if self._chunk_id != 0: self._generate_chunk(p_chunk_id=0)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_feature_space(self) -> MSpace:
+        if self._chunk_id is None: self._generate_chunk(p_chunk_id=0)
+
+        feature_space = MSpace()
+
+        for i in range(self._chunk_data.shape[1]):
+            feature_space.add_dim(Feature(p_name_short='Attr_' + str(i + 1)))
+
+        return feature_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_label_space(self) -> MSpace:
+        if self._chunk_id is None: self._generate_chunk(p_chunk_id=0)
+
+        label_space = MSpace()
+
+        if self._chunk_target.ndim == 1:
+            label_space.add_dim(Label(p_name_short='Target'))
+        else:
+            for i in range(self._chunk_target.shape[1]):
+                label_space.add_dim(Label(p_name_short='Target_' + str(i + 1)))
+
+        return label_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+        """
+        Custom method to get the instances one after another sequentially. The next chunk is 
+        generated on demand.
+
+        Returns
+        -------
+        instance:
+            Next instance of the generator stream.
+        """
+
+        if ( self._num_instances > 0 ) and ( self._index >= self._num_instances ): raise StopIteration
+
+        pos = self._index - self._chunk_start
+        if pos >= self._chunk_data.shape[0]:
+            self._generate_chunk(p_chunk_id=self._chunk_id + 1)
+            pos = 0
+
+        feature_data = Element(self._feature_space)
+        label_data   = Element(self._label_space)
+        feature_data.set_values(self._chunk_data[pos])
+        label_data.set_values(numpy.atleast_1d(self._chunk_target[pos]))
+
+        self._index += 1
+
+        return Instance(feature_data, label_data)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStreamSvmlightSklearn (WrStreamSklearn):
+    """
+    Stream of a local file in svmlight/libsvm format, as written by sklearn.datasets.
+    dump_svmlight_file(). In contrast to sklearn.datasets.load_svmlight_file(), the file is never 
+    loaded completely. Instead, it is read in chunks of a fixed number of bytes, so that the memory
+    consumption is bounded by the chunk size, independent of the file size.
+
+    On first access, the file is scanned once sequentially to build a chunk index with the number
+    of instances per chunk. It provides the number of instances and features of the stream and 
+    allows to locate the chunk of any instance without reading its predecessors.
+
+    Since chunks are read in file order and the file is not kept in memory, the following modes of
+    WrStreamSklearn are not supported and rejected with a ParamError:
+
+    - shuffled replay (method set_shuffle())
+    - replay clocks based on time stamp features (method set_replay_clock())
+    - shards in other modes than C_SHARD_RANGE (method set_shard())
+    - export of windows to DataFrames by method to_dataframe() (method iter_dataframes() is 
+      supported instead)
+
+    Parameters
+    ----------
+    p_path : str
+        Path of the svmlight/libsvm file.
+    p_id
+        Optional id of the stream. Default = None (path of the file).
+    p_name : str
+        Optional name of the stream. Default = None (file name).
+    p_chunk_bytes : int
+        Number of bytes read at once. Default = C_CHUNK_BYTES.
+    p_num_features : int
+        Optional number of features. Default = None (derived from the file).
+    p_zero_based
+        Specifies whether feature indices are zero-based (True) or one-based (False). Default = 
+        'auto' (zero-based, if index 0 occurs in the file).
+    p_dense : bool
+        If True, instances are provided as dense elements. Otherwise, sparse elements of type 
+        SparseElementSklearn are provided. Default = False.
+    p_dtype
+        Data type of the feature values. Default = numpy.float64.
+    p_version : str
+        Version of the stream. Default = ''.
+    p_mode
+        Operation mode. Valid values are stored in constant C_VALID_MODES.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters.
+    """
+
+    C_NAME              = 'svmlight stream'
+
+    C_CHUNK_BYTES       = 2**24
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_path : str,
+                  p_id = None, 
+                  p_name : str = None, 
+                  p_chunk_bytes : int = C_CHUNK_BYTES,
+                  p_num_features : int = None,
+                  p_zero_based = 'auto',
+                  p_dense : bool = False,
+                  p_dtype = numpy.float64,
+                  p_version : str = '', 
+                  p_logging = Log.C_LOG_ALL, 
+                  p_mode = Mode.C_MODE_SIM, 
+                  **p_kwargs ):
+
+        if p_chunk_bytes < 1:
+            raise ParamError('Please set the parameter "p_chunk_bytes" >= 1')
+
+        if p_zero_based not in [ True, False, 'auto' ]:
+            raise ParamError('Please set the parameter "p_zero_based" to True, False or "auto"')
+
+        self._path          = p_path
+        self._chunk_bytes   = p_chunk_bytes
+        self._num_features  = p_num_features
+        self._zero_based    = p_zero_based
+        self._dense         = p_dense
+        self._dtype         = p_dtype
+        self._chunk_id      = None
+        self._chunk_start   = 0
+        self._chunk_len     = 0
+        self._chunk_ends    = None
+        self._feature_names = None
+
+        WrStreamSklearn.__init__( self,
+                                  p_id = p_path if p_id is None else p_id,
+                                  p_name = os.path.basename(p_path) if p_name is None else p_name,
+                                  p_version = p_version,
+                                  p_logging = p_logging,
+                                  p_mode = p_mode,
+                                  **p_kwargs )
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_shuffle(self, p_shuffle : bool = True, p_seed : int = None, p_block_size : int = 1):
+        """
+        Shuffled replay is not supported, since chunks are read in file order.
+        """
+
+        if p_shuffle:
+            raise ParamError('Please set the parameter "p_shuffle" to False, since shuffled replay of svmlight files is not supported')
+
+        WrStreamSklearn.set_shuffle(self, p_shuffle=p_shuffle, p_seed=p_seed, p_block_size=p_block_size)
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_replay_clock(self, p_rate : float = None, p_tstamp_feature = None, p_speed : float = 1.0):
+        """
+        Sets up a replay clock at a target rate. Time stamp features are not supported, since the 
+        file is not kept in memory. See method WrStreamSklearn.set_replay_clock() for further 
+        details.
+        """
+
+        if p_tstamp_feature is not None:
+            raise ParamError('Please set the parameter "p_tstamp_feature" to None, since time stamp features are not supported for svmlight files')
+
+        WrStreamSklearn.set_replay_clock(self, p_rate=p_rate, p_speed=p_speed)
+
+
+## --------------------------------------------------------------------------------------------------
+    def set_shard(self, p_shard : int = 0, p_num_shards : int = 1, p_mode : str = WrStreamSklearn.C_SHARD_RANGE):
+        """
+        Restricts the stream to a contiguous range of instances. Other partitioning modes are not 
+        supported, since chunks are read in file order. See method WrStreamSklearn.set_shard() for
+        further details.
+        """
+
+        if ( p_num_shards > 1 ) and ( p_mode != self.C_SHARD_RANGE ):
+            raise ParamError('Please set the parameter "p_mode" to C_SHARD_RANGE, since only contiguous shards of svmlight files are supported')
+
+        WrStreamSklearn.set_shard(self, p_shard=p_shard, p_num_shards=p_num_shards, p_mode=p_mode)
+
+
+## --------------------------------------------------------------------------------------------------
+    def to_dataframe(self, p_start : int = 0, p_stop : int = None):
+        """
+        Windows are not supported, since the file is not kept in memory. Please use method 
+        iter_dataframes() instead.
+        """
+
+        raise ParamError('Windows of svmlight files are not supported, please use method iter_dataframes() instead')
+
+
+## --------------------------------------------------------------------------------------------------
+    def _scan(self) -> numpy.ndarray:
+        """
+        Scans the file once sequentially and determines the number of instances per chunk, the 
+        number of features and the index base. Memory consumption is independent of the file size.
+
+        Returns
+        -------
+        chunk_counts : numpy.ndarray
+            Number of instances per chunk.
+        """
+
+        file_size    = os.path.getsize(self._path)
+        chunk_counts = numpy.zeros(max(1, -(-file_size // self._chunk_bytes)), dtype=numpy.int64)
+        idx_min      = None
+        idx_max      = -1
+        pos          = 0
+
+        with open(self._path, 'rb') as file:
+            for line in file:
+                line_start = pos
+                pos       += len(line)
+
+                parts = line.split(b'#', 1)[0].split()
+                if len(parts) == 0: continue
+
+                # A line belongs to the chunk that contains its first byte, except for lines 
+                # starting exactly on a chunk border (see load_svmlight_file(), parameter offset)
+                chunk_counts[max(0, (line_start - 1) // self._chunk_bytes)] += 1
+
+                features = parts[1:]
+                if ( len(features) > 0 ) and features[0].startswith(b'qid:'): features = features[1:]
+                if len(features) == 0: continue
+
+                idx_first = int(features[0].split(b':', 1)[0])
+                idx_last  = int(features[-1].split(b':', 1)[0])
+                if ( idx_min is None ) or ( idx_first < idx_min ): idx_min = idx_first
+                if idx_last > idx_max: idx_max = idx_last
+
+        if self._zero_based == 'auto':
+            self._zero_based = ( idx_min == 0 )
+
+        num_features = idx_max + 1 if self._zero_based else idx_max
+        if ( self._num_features is None ) or ( self._num_features < num_features ):
+            self._num_features = max(0, num_features)
+
+        return chunk_counts
+
+
+## --------------------------------------------------------------------------------------------------
+    def _load_chunk(self, p_chunk_id : int):
+        """
+        Reads the chunk with the specified index and makes it the current dataset.
+        """
+
+        data, target = sklearn_datasets.load_svmlight_file( self._path,
+                                                            n_features=self._num_features,
+                                                            dtype=self._dtype,
+                                                            zero_based=self._zero_based,
+                                                            offset=p_chunk_id * self._chunk_bytes,
+                                                            length=self._chunk_bytes )
+
+        if self._features is not None:
+            data, self._feature_names = self._project_features(p_data=data)
+
+        if self._dense: data = data.toarray()
+
+        self._dataset     = sklearn_utils.Bunch(data=data, target=target)
+        self._chunk_id    = p_chunk_id
+        self._chunk_len   = data.shape[0]
+        self._chunk_start = int(self._chunk_ends[p_chunk_id]) - self._chunk_len
+
+
+## --------------------------------------------------------------------------------------------------
+    def _load_chunk_of(self, p_index : int):
+        """
+        Reads the chunk containing the instance with the specified index. Empty chunks are skipped.
+        """
+
+        self._load_chunk(p_chunk_id=int(numpy.searchsorted(self._chunk_ends, p_index, side='right')))
+
+
+## --------------------------------------------------------------------------------------------------
+    def _download(self):
+        """
+        Scans the file and reads its first chunk.
+        """
+
+        tp_start = time.perf_counter()
+
+        chunk_counts     = self._scan()
+        self._chunk_ends = numpy.cumsum(chunk_counts)
+        self._sparse     = not self._dense
+        self._load_chunk_of(p_index=0)
+
+        duration = time.perf_counter() - tp_start
+
+        self._num_instances = int(self._chunk_ends[-1])
+        self._metadata      = { 'data_shape'    : ( self._num_instances, self._dataset['data'].shape[1] ),
+                                'data_dtype'    : str(numpy.dtype(self._dtype)),
+                                'target_shape'  : ( self._num_instances, ),
+                                'target_dtype'  : str(self._dataset['target'].dtype),
+                                'num_instances' : self._num_instances,
+                                'descr'         : self._path,
+                                'num_chunks'    : len(chunk_counts),
+                                'load_source'   : 'svmlight',
+                                'load_duration' : duration }
+
+        self.C_SCIREF_ABSTRACT = self._path
+
+        self.log(self.C_LOG_TYPE_I, 'File scanned in', round(duration, 3), 'seconds:', self._num_instances, 'instances in', len(chunk_counts), 'chunks')
+
+        if self._instr is not None: self._record(p_instr=self._instr, p_method='_download', p_tp_start=tp_start)
+
+        return True
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_feature_space(self) -> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        num_features = self._dataset['data'].shape[1]
+
+        if self._sparse: 
+            return LazyFeatureSpaceSklearn(p_num_dim=num_features, p_feature_names=self._feature_names)
+
+        feature_space = MSpace()
+
+        for i in range(num_features):
+            if self._feature_names is None:
+                feature_space.add_dim(Feature(p_name_short='Attr_' + str(i + 1)))
+            else:
+                feature_space.add_dim(Feature(p_name_short=self._feature_names[i]))
+
+        return feature_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_label_space(self) -> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        label_space = MSpace()
+        label_space.add_dim(Label(p_name_short='Target'))
+
+        return label_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _create_instance(self, p_index : int) -> Instance:
+        """
+        Creates the instance with the specified index. The related chunk is read on demand.
+        """
+
+        p_index += self._offset
+        pos      = p_index - self._chunk_start
+        if ( pos < 0 ) or ( pos >= self._chunk_len ):
+            self._load_chunk_of(p_index=p_index)
+            pos = p_index - self._chunk_start
+
+        return self._get_instance(p_pos=pos)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _create_batch(self, p_index : int, p_batch_size : int) -> Tuple[BatchElement, BatchElement]:
+        """
+        Creates the batch of up to p_batch_size instances starting at the specified index. Batches
+        do not exceed the related chunk, so that the last batch of each chunk may be smaller.
+        """
+
+        p_index += self._offset
+        pos      = p_index - self._chunk_start
+        if ( pos < 0 ) or ( pos >= self._chunk_len ):
+            self._load_chunk_of(p_index=p_index)
+            pos = p_index - self._chunk_start
+
+        pos_end = min(pos + p_batch_size, self._chunk_len, self._offset + self._num_instances - self._chunk_start)
+
+        feature_batch = BatchElement(self._feature_space)
+        label_batch   = BatchElement(self._label_space)
+        feature_batch.set_values(self._dataset['data'][pos:pos_end])
+        label_batch.set_values(self._dataset['target'][pos:pos_end])
+
+        return feature_batch, label_batch
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStreamCompositeSklearn (Stream):
+    """
+    Composite stream that mixes the instances of several bounded streams, e.g. of different 
+    scikit-learn datasets. The source streams are either concatenated or interleaved. On each 
+    reset, the order of the sources is precomputed as an index array with one entry per instance 
+    (see method get_schedule()), so that the replay just follows this array.
+
+    The instances of all sources are mapped to a common feature space. Without the parameter 
+    p_features, all sources need the same number of features and the feature names of the first
+    source are used. Otherwise, the specified features are selected from each source by name or 
+    position. Feature boundaries of the sources, like the ones of WrStreamSklearn, are merged.
+    Label data are taken over from the source instances. Sources with sparse feature data are not
+    supported.
+
+    Parameters
+    ----------
+    p_streams : list
+        Bounded source streams.
+    p_mix : str
+        Mixing mode. Possible values are C_MIX_CONCAT (sources one after another), 
+        C_MIX_ROUND_ROBIN (one instance per source in turn) and C_MIX_WEIGHTED (random 
+        interleaving with rates according to p_weights). Exhausted sources are skipped. Default =
+        C_MIX_CONCAT.
+    p_weights : list
+        Relative rates of the sources in mixing mode C_MIX_WEIGHTED. Default = None (equal rates).
+    p_seed : int
+        Seed of the random interleaving in mixing mode C_MIX_WEIGHTED. Default = 0.
+    p_features : list
+        Optional features selected from each source, specified by names or positions. Default = 
+        None (all features).
+    p_id
+        Optional id of the stream. Default = None (ids of the sources).
+    p_name : str
+        Optional name of the stream. Default = None (ids of the sources).
+    p_version : str
+        Version of the stream. Default = ''.
+    p_mode
+        Operation mode. Valid values are stored in constant C_VALID_MODES.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters.
+    """
+
+    C_NAME              = 'composite stream'
+
+    C_MIX_CONCAT        = 'concat'
+    C_MIX_ROUND_ROBIN   = 'round_robin'
+    C_MIX_WEIGHTED      = 'weighted'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_streams : list,
+                  p_mix : str = C_MIX_CONCAT,
+                  p_weights : list = None,
+                  p_seed : int = 0,
+                  p_features : list = None,
+                  p_id = None, 
+                  p_name : str = None, 
+                  p_version : str = '', 
+                  p_logging = Log.C_LOG_ALL, 
+                  p_mode = Mode.C_MODE_SIM, 
+                  **p_kwargs ):
+
+        if len(p_streams) == 0:
+            raise ParamError('Please specify at least one source stream')
+
+        if p_mix not in [ self.C_MIX_CONCAT, self.C_MIX_ROUND_ROBIN, self.C_MIX_WEIGHTED ]:
+            raise ParamError('Unknown mixing mode "' + str(p_mix) + '"')
+
+        if p_weights is None:
+            p_weights = [ 1 ] * len(p_streams)
+        elif ( len(p_weights) != len(p_streams) ) or ( min(p_weights) <= 0 ):
+            raise ParamError('Please specify one weight > 0 per source stream')
+
+        sources_ids = ', '.join( str(stream.get_id()) for stream in p_streams )
+
+        self.C_ID = self._id = sources_ids if p_id is None else p_id
+        self._name           = sources_ids if p_name is None else p_name
+        self._streams        = list(p_streams)
+        self._mix            = p_mix
+        self._weights        = numpy.asarray(p_weights, dtype=numpy.float64)
+        self._seed           = p_seed
+        self._features       = None if p_features is None else list(p_features)
+        self._columns        = None
+        self._schedule       = None
+        self._index          = 0
+
+        Stream.__init__( self,
+                         p_id=self._id,
+                         p_name=self.C_NAME + ' "' + self._name + '"',
+                         p_num_instances=0,
+                         p_version=p_version,
+                         p_feature_space=None,
+                         p_label_space=None,
+                         p_mode=p_mode,
+                         p_logging=p_logging,
+                         **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def __repr__(self):
+        return str(dict(id=str(self._id), name=self._name))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_columns(self, p_feature_space : MSpace):
+        """
+        Determines the positions of the selected features in the feature space of a source.
+        """
+
+        if self._features is None: return slice(None)
+
+        names   = [ dim.get_name_short() for dim in p_feature_space.get_dims() ]
+        columns = []
+
+        for feature in self._features:
+            if isinstance(feature, str):
+                try:
+                    columns.append(names.index(feature))
+                except ValueError:
+                    raise ParamError('Feature "' + feature + '" not found')
+            else:
+                columns.append(int(feature))
+
+        return numpy.asarray(columns, dtype=numpy.intp)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_feature_space(self) -> MSpace:
+        self._columns = []
+        dims          = None
+        boundaries    = None
+
+        for stream in self._streams:
+            source_space = stream.get_feature_space()
+
+            if getattr(stream, '_sparse', False):
+                raise ParamError('Source stream "' + str(stream.get_id()) + '" with sparse data is not supported')
+
+            columns       = self._get_columns(p_feature_space=source_space)
+            source_dims   = [ source_space.get_dims()[pos] for pos in numpy.arange(source_space.get_num_dim())[columns] ]
+            source_bounds = [ dim.get_boundaries() for dim in source_dims ]
+            self._columns.append(columns)
+
+            if dims is None:
+                dims       = source_dims
+                boundaries = source_bounds
+            elif len(source_dims) != len(dims):
+                raise ParamError('Source stream "' + str(stream.get_id()) + '" provides ' + str(len(source_dims)) + ' instead of ' + str(len(dims)) + ' features')
+
+            for i, bounds in enumerate(source_bounds):
+                if ( len(bounds) == 2 ) and ( len(boundaries[i]) == 2 ):
+                    boundaries[i] = [ min(boundaries[i][0], bounds[0]), max(boundaries[i][1], bounds[1]) ]
+                else:
+                    boundaries[i] = []
+
+        feature_space = MSpace()
+
+        for dim, bounds in zip(dims, boundaries):
+            feature_space.add_dim(Feature(p_name_short=dim.get_name_short(), p_boundaries=bounds))
+
+        return feature_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_label_space(self) -> MSpace:
+        return self._streams[0].get_label_space()
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_schedule(self, p_num_instances : numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the source index of each instance in replay order.
+        """
+
+        sources = numpy.repeat(numpy.arange(len(self._streams), dtype=numpy.int32), p_num_instances)
+
+        if self._mix == self.C_MIX_CONCAT: return sources
+
+        if self._mix == self.C_MIX_ROUND_ROBIN:
+            # k-th instance of each source takes turn k
+            keys = numpy.concatenate([ numpy.arange(num) for num in p_num_instances ])
+        else:
+            # Merge of independent arrival processes with rates according to the weights
+            rng  = numpy.random.default_rng(self._seed)
+            keys = numpy.concatenate([ numpy.cumsum(rng.exponential(1 / weight, size=num)) for weight, num in zip(self._weights, p_num_instances) ])
+
+        return sources[numpy.argsort(keys, kind='stable')]
+
+
+## --------------------------------------------------------------------------------------------------
+    def get_schedule(self) -> numpy.ndarray:
+        """
+        Returns the index of the source stream for each instance in replay order. The schedule is 
+        computed on each reset.
+
+        Returns
+        -------
+        numpy.ndarray
+            Source indices, or None before the first reset.
+        """
+
+        return self._schedule
+
+
+## --------------------------------------------------------------------------------------------------
+    def _reset(self):
+        """
+        Custom reset method for a composite stream. All source streams are reset.
+        """
+
+        self.get_feature_space()
+        self.get_label_space()
+
+        num_instances = numpy.zeros(len(self._streams), dtype=numpy.int64)
+
+        for i, stream in enumerate(self._streams):
+            iter(stream)
+            num_instances[i] = stream.get_num_instances()
+
+            if num_instances[i] <= 0:
+                raise ParamError('Source stream "' + str(stream.get_id()) + '" is unbounded')
+
+        self._schedule      = self._get_schedule(p_num_instances=num_instances)
+        self._sources       = list(zip(self._streams, self._columns))
+        self._num_instances = len(self._schedule)
+        self._index         = 0
+
+
+## --------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+        """
+        Custom method to get the next instance of the source stream given by the schedule.
+
+        Returns
+        -------
+        instance:
+            Next instance of the composite stream.
+        """
+
+        if self._index >= self._num_instances: raise StopIteration
+
+        stream, columns = self._sources[self._schedule[self._index]]
+        instance        = next(stream)
+        feature_data    = Element(self._feature_space)
+        feature_data.set_values(instance.get_feature_data().get_values()[columns])
+
+        self._index += 1
+
+        return Instance(feature_data, instance.get_label_data())
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class LazyFeatureSpaceSklearn (MSpace):
+    """
+    Feature space for high-dimensional datasets like rcv1 or 20newsgroups_vectorized. The number of
+    dimensions is known from the start, but the feature objects are created on first access of 
+    the dimensions only. Features are named by the given vocabulary or by their position.
+
+    Parameters
+    ----------
+    p_num_dim : int
+        Number of dimensions.
+    p_feature_names : list
+        Optional feature names. Default = None (names 'Attr_1', 'Attr_2', ...).
+    p_feature_boundaries : tuple
+        Optional pair of arrays with the lower and upper boundaries of the features. Default = None.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_num_dim : int = 0, p_feature_names : list = None, p_feature_boundaries : tuple = None):
+
+        MSpace.__init__(self)
+        self._lazy_num_dim      = p_num_dim
+        self._lazy_names        = p_feature_names
+        self._lazy_boundaries   = p_feature_boundaries
+        self._materialized      = ( p_num_dim == 0 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _materialize(self):
+        if self._materialized: return
+        self._materialized = True
+
+        for i in range(self._lazy_num_dim):
+            if self._lazy_names is not None:
+                name = str(self._lazy_names[i])
+            else:
+                name = 'Attr_' + str(i + 1)
+
+            if ( self._lazy_boundaries is not None ) and numpy.isfinite(self._lazy_boundaries[0][i]):
+                boundaries = [ float(self._lazy_boundaries[0][i]), float(self._lazy_boundaries[1][i]) ]
+            else:
+                boundaries = []
+
+            MSpace.add_dim(self, p_dim=Feature(p_name_short=name, p_boundaries=boundaries), p_ignore_duplicates=True)
+
+        self._lazy_names      = None
+        self._lazy_boundaries = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_dim(self, p_dim : Dimension, p_ignore_duplicates : bool = False):
+        self._materialize()
+        MSpace.add_dim(self, p_dim=p_dim, p_ignore_duplicates=p_ignore_duplicates)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dim(self, p_id) -> Dimension:
+        self._materialize()
+        return MSpace.get_dim(self, p_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dim_by_name(self, p_name) -> Dimension:
+        self._materialize()
+        return MSpace.get_dim_by_name(self, p_name)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dims(self) -> list:
+        self._materialize()
+        return MSpace.get_dims(self)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_dim(self):
+        if not self._materialized: return self._lazy_num_dim
+        return len(self._dim_by_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dim_ids(self):
+        self._materialize()
+        return MSpace.get_dim_ids(self)
+
+
+## -------------------------------------------------------------------------------------------------
+    def spawn(self, p_id_list : list):
+        self._materialize()
+        return MSpace.spawn(self, p_id_list)
+
+
+## -------------------------------------------------------------------------------------------------
+    def copy(self, p_new_dim_ids : bool = True):
+        self._materialize()
+        return MSpace.copy(self, p_new_dim_ids=p_new_dim_ids)
+
+
+## -------------------------------------------------------------------------------------------------
+    def append(self, p_set, p_new_dim_ids : bool = True, p_ignore_duplicates : bool = False):
+        self._materialize()
+        MSpace.append(self, p_set, p_new_dim_ids=p_new_dim_ids, p_ignore_duplicates=p_ignore_duplicates)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SparseElementSklearn (Element):
+    """
+    Element of a high-dimensional set that stores the non-zero entries only, typically as zero-copy
+    views of a row of a CSR matrix. Method get_nonzero() provides the index/value pairs. Method 
+    get_values() provides a CSR matrix with one row that is created on first demand.
+
+    Parameters
+    ----------
+    p_set : Set
+        Underlying set.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_set : Set):
+
+        self.set_related_set(p_set=p_set)
+        self._indices = numpy.empty(0, dtype=numpy.int32)
+        self._data    = numpy.empty(0)
+        self._values  = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_nonzero(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the indices and the values of the non-zero entries.
+        """
+
+        return self._indices, self._data
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_nonzero(self, p_indices : numpy.ndarray, p_data : numpy.ndarray):
+        """
+        Sets the indices and the values of the non-zero entries.
+
+        Parameters
+        ----------
+        p_indices : numpy.ndarray
+            Sorted dimension indices of the non-zero entries.
+        p_data : numpy.ndarray
+            Values of the non-zero entries.
+        """
+
+        self._indices = p_indices
+        self._data    = p_data
+        self._values  = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self) -> sparse.csr_matrix:
+        if self._values is None:
+            self._values = sparse.csr_matrix( ( self._data, self._indices, numpy.array([0, len(self._indices)]) ),
+                                              shape=(1, self._set.get_num_dim()),
+                                              copy=False )
+
+        return self._values
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_values(self, p_values):
+        """
+        Overwrites the values of all components of the element.
+
+        Parameters
+        ----------
+        p_values
+            Sparse matrix with one row or something iterable with same length as number of 
+            element dimensions.
+        """
+
+        row = sparse.csr_matrix(p_values)
+        self.set_nonzero(p_indices=row.indices, p_data=row.data)
+        self._values = row
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_value(self, p_dim_id):
+        idx = self._set.get_dim_ids().index(p_dim_id)
+        pos = numpy.searchsorted(self._indices, idx)
+
+        if ( pos < len(self._indices) ) and ( self._indices[pos] == idx ): return self._data[pos]
+
+        return 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_value(self, p_dim_id, p_value):
+        values = self.get_values().tolil()
+        values[0, self._set.get_dim_ids().index(p_dim_id)] = p_value
+        self.set_values(values)
+
+
+## -------------------------------------------------------------------------------------------------
+    def copy(self):
+        duplicate = self.__class__(p_set=self._set)
+        duplicate.set_nonzero(p_indices=self._indices.copy(), p_data=self._data.copy())
+        return duplicate
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class InstancePoolSklearn:
+    """
+    Pool of pre-allocated instances with feature and label elements, which are overwritten by a 
+    stream instead of creating new objects for each row. Two reuse policies are supported:
+
+    - Ring mode: the instances are handed out in a fixed cyclic order, so that an instance is 
+      reused by the p_size-th next call of method acquire(). Consumers that keep references for a
+      longer time need to copy the instance (method Instance.copy()).
+    - Explicit release: an instance is reused only after it was returned by method release(). If
+      no returned instance is available, a new one is created.
+
+    Parameters
+    ----------
+    p_feature_space : MSpace
+        Feature space of the instances.
+    p_label_space : MSpace
+        Label space of the instances.
+    p_size : int
+        Number of instances in ring mode or maximum number of returned instances kept for reuse in
+        explicit release mode.
+    p_explicit_release : bool
+        Explicit release mode (True) or ring mode (False). Default = False.
+    p_sparse : bool
+        If True, the feature data are stored in elements of type SparseElementSklearn. Default = 
+        False.
+    p_label_shape : tuple
+        Shape of the label values of an instance. Default = (1,).
+    p_label_dtype
+        Data type of the label values. Default = numpy.float64.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_feature_space : MSpace, 
+                  p_label_space : MSpace, 
+                  p_size : int, 
+                  p_explicit_release : bool = False,
+                  p_sparse : bool = False,
+                  p_label_shape : tuple = ( 1, ),
+                  p_label_dtype = numpy.float64 ):
+
+        if p_size < 1:
+            raise ParamError('Please set the parameter "p_size" >= 1')
+
+        self._feature_space    = p_feature_space
+        self._label_space      = p_label_space
+        self._size             = p_size
+        self._explicit_release = p_explicit_release
+        self._sparse           = p_sparse
+        self._label_shape      = p_label_shape
+        self._label_dtype      = p_label_dtype
+        self._pos              = 0
+
+        if p_explicit_release:
+            # Thread-safe stack of returned instances
+            self._instances = collections.deque()
+        else:
+            self._instances = [ self._create_instance() for i in range(p_size) ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_instance(self) -> Instance:
+        if self._sparse:
+            feature_data = SparseElementSklearn(self._feature_space)
+        else:
+            feature_data = Element(self._feature_space)
+
+        label_data = Element(self._label_space)
+        label_data.set_values(numpy.zeros(self._label_shape, dtype=self._label_dtype))
+
+        return Instance(feature_data, label_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def acquire(self) -> Instance:
+        """
+        Takes an instance from the pool. Its time stamp and keyword parameters are cleared, while 
+        feature and label data are to be overwritten by the caller.
+
+        Returns
+        -------
+        Instance
+            Pooled instance.
+        """
+
+        if self._explicit_release:
+            try:
+                instance = self._instances.pop()
+            except IndexError:
+                return self._create_instance()
+        else:
+            instance  = self._instances[self._pos]
+            self._pos = ( self._pos + 1 ) % self._size
+
+        instance.tstamp = None
+        if len(instance._kwargs) > 0: instance._kwargs.clear()
+
+        return instance
+
+
+## -------------------------------------------------------------------------------------------------
+    def release(self, p_instance : Instance):
+        """
+        Returns an instance to the pool in explicit release mode. In ring mode, nothing happens.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance taken from this pool.
+        """
+
+        if self._explicit_release and ( len(self._instances) < self._size ):
+            self._instances.append(p_instance)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class DatasetCacheSklearn (Log):
+    """
+    Persistent on-disk cache for scikit-learn datasets. Each dataset is converted once into a 
+    columnar layout of .npy files in a sub-directory of the cache directory:
+
+    - dense numeric arrays are stored as <key>.npy
+    - SciPy sparse matrices are stored as <key>.data.npy, <key>.indices.npy, <key>.indptr.npy 
+      in CSR format
+    - all further entries (names, descriptions, ...) are stored in meta.json
+    - feature statistics computed by the streams are stored in stats.npz
+
+    Feature subsets and data types of streams are cached as separate entries <name>.<key> of the 
+    projected data array, where the key is derived from the selected columns and the data type.
+
+    Cached datasets are loaded memory-mapped in read-only mode, so that a replay starts in 
+    milliseconds and pages are shared across processes. A cache entry is invalidated whenever the 
+    scikit-learn version, the dataset name or the cache format differs. Datasets containing 
+    non-numeric arrays (like the raw texts of 20newsgroups or the mixed columns of kddcup99) 
+    cannot be memory-mapped and are not cached.
+
+    Parameters
+    ----------
+    p_cache_dir : str
+        Root directory of the cache. It is created if not yet existing.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE              = 'Dataset Cache'
+    C_NAME              = 'scikit-learn'
+
+    C_FORMAT            = 1
+    C_FILE_META         = 'meta.json'
+    C_FILE_STATS        = 'stats.npz'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_cache_dir : str, p_logging = Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+        self._cache_dir = p_cache_dir
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_path(self, p_name : str) -> str:
+        """
+        Returns the cache directory of the specified dataset.
+        """
+
+        return self._cache_dir + os.sep + p_name
+
+
+## -------------------------------------------------------------------------------------------------
+    def _load_meta(self, p_name : str) -> dict:
+        try:
+            with open(self.get_path(p_name=p_name) + os.sep + self.C_FILE_META, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def is_valid(self, p_name : str) -> bool:
+        """
+        Checks whether a valid cache entry for the specified dataset exists.
+
+        Parameters
+        ----------
+        p_name : str
+            Name of the dataset.
+
+        Returns
+        -------
+        bool
+            True, if the dataset is cached for the installed scikit-learn version. False otherwise.
+        """
+
+        return self._check_meta(p_meta=self._load_meta(p_name=p_name), p_name=p_name)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _check_meta(self, p_meta : dict, p_name : str) -> bool:
+        if p_meta is None: return False
+
+        return ( p_meta.get('format') == self.C_FORMAT ) and \
+               ( p_meta.get('name') == p_name ) and \
+               ( p_meta.get('sklearn_version') == sklearn.__version__ )
+
+
+## -------------------------------------------------------------------------------------------------
+    def store(self, p_name : str, p_dataset : dict) -> bool:
+        """
+        Converts the given dataset into the columnar cache layout. The files are written to a 
+        temporary directory first, which is installed as cache entry afterwards. A valid entry is
+        never removed: if another process has cached the dataset in the meantime, its entry is 
+        kept instead. An invalid previous entry is moved aside atomically before the installation.
+
+        Parameters
+        ----------
+        p_name : str
+            Name of the dataset.
+        p_dataset : Bunch
+            Dataset as returned by the related load/fetch function of scikit-learn.
+
+        Returns
+        -------
+        bool
+            True, if the dataset has been cached. False otherwise.
+        """
+
+        # 1 Classification of the dataset entries
+        arrays     = {}
+        attrs      = {}
+        key_failed = None
+
+        for key, value in p_dataset.items():
+            if sparse.issparse(value):
+                arrays[key] = sparse.csr_matrix(value)
+            elif isinstance(value, numpy.ndarray) and ( value.dtype.kind in 'biufc' ):
+                arrays[key] = value
+            elif isinstance(value, numpy.ndarray) and ( value.dtype.kind in 'USO' ) and ( value.ndim == 1 ) and ( key != 'data' ):
+                attrs[key] = [ str(v) for v in value ]
+            elif ( value is None ) or isinstance(value, (str, int, float, bool)):
+                attrs[key] = value
+            elif isinstance(value, list) and ( key != 'data' ) and all(isinstance(v, str) for v in value):
+                attrs[key] = value
+            else:
+                key_failed = key
+                break
+
+        if key_failed is not None:
+            self.log(self.C_LOG_TYPE_W, 'Dataset "' + p_name + '" can not be cached due to entry "' + key_failed + '"')
+            return False
+
+
+        # 2 Conversion into the columnar layout
+
+        self.log(self.C_LOG_TYPE_I, 'Caching dataset "' + p_name + '"...')
+
+        path     = self.get_path(p_name=p_name)
+        path_tmp = path + '.tmp-' + str(os.getpid())
+        sparse_shapes = {}
+
+        shutil.rmtree(path_tmp, ignore_errors=True)
+        os.makedirs(path_tmp)
+
+        for key, value in arrays.items():
+            if sparse.issparse(value):
+                numpy.save(path_tmp + os.sep + key + '.data.npy', value.data)
+                numpy.save(path_tmp + os.sep + key + '.indices.npy', value.indices)
+                numpy.save(path_tmp + os.sep + key + '.indptr.npy', value.indptr)
+                sparse_shapes[key] = list(value.shape)
+            else:
+                numpy.save(path_tmp + os.sep + key + '.npy', value)
+
+        # 3 Replacement of a previous cache entry
+        meta = { 'format'          : self.C_FORMAT,
+                 'name'            : p_name,
+                 'sklearn_version' : sklearn.__version__,
+                 'dense'           : [ key for key in arrays if key not in sparse_shapes ],
+                 'sparse'          : sparse_shapes,
+                 'attrs'           : attrs }
+
+        with open(path_tmp + os.sep + self.C_FILE_META, 'w') as file:
+            json.dump(meta, file)
+
+        if not self.is_valid(p_name=p_name):
+            self._remove_stale(p_name=p_name)
+
+            try:
+                # Unlike os.replace(), the rename fails if another process has installed a 
+                # non-empty entry in the meantime
+                os.rename(path_tmp, path)
+                return True
+            except OSError:
+                pass
+
+        # Another process has cached the dataset in the meantime or the previous entry could not
+        # be moved aside (e.g. memory-mapped files on Windows)
+        shutil.rmtree(path_tmp, ignore_errors=True)
+
+        if not self.is_valid(p_name=p_name):
+            self.log(self.C_LOG_TYPE_W, 'Dataset "' + p_name + '" can not be cached due to a previous cache entry')
+            return False
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_stale(self, p_name : str):
+        """
+        Moves an invalid cache entry atomically to a unique stale name and removes it there. If the
+        moved entry turns out to be valid, since another process has installed it concurrently, it
+        is moved back.
+        """
+
+        path = self.get_path(p_name=p_name)
+        if not os.path.exists(path): return
+
+        name_stale = p_name + '.stale-' + str(os.getpid()) + '-' + str(time.time_ns())
+        path_stale = self.get_path(p_name=name_stale)
+
+        try:
+            os.replace(path, path_stale)
+        except OSError:
+            return
+
+        meta = self._load_meta(p_name=name_stale)
+
+        if self._check_meta(p_meta=meta, p_name=p_name):
+            try:
+                os.rename(path_stale, path)
+                return
+            except OSError:
+                # Meanwhile replaced by another valid entry
+                pass
+
+        shutil.rmtree(path_stale, ignore_errors=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    def load(self, p_name : str) -> dict:
+        """
+        Loads a cached dataset memory-mapped in read-only mode.
+
+        Parameters
+        ----------
+        p_name : str
+            Name of the dataset.
+
+        Returns
+        -------
+        Bunch
+            Dataset with the same entries as provided by scikit-learn or None, if the cache entry 
+            has vanished in the meantime (e.g. replaced by another process).
+        """
+
+        self.log(self.C_LOG_TYPE_I, 'Loading dataset "' + p_name + '" from cache...')
+
+        path = self.get_path(p_name=p_name)
+        meta = self._load_meta(p_name=p_name)
+        if meta is None: return None
+
+        dataset = sklearn_utils.Bunch(**meta['attrs'])
+
+        try:
+            for key in meta['dense']:
+                dataset[key] = numpy.load(path + os.sep + key + '.npy', mmap_mode='r')
+
+            for key, shape in meta['sparse'].items():
+                dataset[key] = sparse.csr_matrix( ( numpy.load(path + os.sep + key + '.data.npy', mmap_mode='r'),
+                                                    numpy.load(path + os.sep + key + '.indices.npy', mmap_mode='r'),
+                                                    numpy.load(path + os.sep + key + '.indptr.npy', mmap_mode='r') ),
+                                                  shape=tuple(shape),
+                                                  copy=False )
+        except OSError:
+            return None
+
+        return dataset
+
+
+## -------------------------------------------------------------------------------------------------
+    def invalidate(self, p_name : str):
+        """
+        Removes the cache entry of the specified dataset together with the entries of its 
+        projections.
+        """
+
+        path = self.get_path(p_name=p_name)
+
+        for path_entry in [ path ] + glob.glob(glob.escape(path) + '.*'):
+            shutil.rmtree(path_entry, ignore_errors=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    def store_statistics(self, p_name : str, p_stats : dict) -> bool:
+        """
+        Stores feature statistics next to a cached dataset. They are removed together with the 
+        cache entry.
+
+        Parameters
+        ----------
+        p_name : str
+            Name of the dataset.
+        p_stats : dict
+            Feature statistics as computed by WrStreamSklearn.
+
+        Returns
+        -------
+        bool
+            True, if the statistics have been stored. False, if the dataset is not cached.
+        """
+
+        if not self.is_valid(p_name=p_name): return False
+
+        arrays = { key : value for key, value in p_stats.items() if isinstance(value, numpy.ndarray) }
+        arrays['num_labels'] = numpy.asarray(-1 if p_stats['num_labels'] is None else p_stats['num_labels'])
+
+        path     = self.get_path(p_name=p_name) + os.sep + self.C_FILE_STATS
+        path_tmp = path + '.tmp-' + str(os.getpid()) + '.npz'
+        numpy.savez(path_tmp, **arrays)
+
+        try:
+            os.replace(path_tmp, path)
+        except OSError:
+            # Statistics file in use by another process
+            os.remove(path_tmp)
+            return False
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def load_statistics(self, p_name : str) -> dict:
+        """
+        Loads the feature statistics of a cached dataset.
+
+        Parameters
+        ----------
+        p_name : str
+            Name of the dataset.
+
+        Returns
+        -------
+        dict
+            Feature statistics or None, if no statistics are stored.
+        """
+
+        try:
+            with numpy.load(self.get_path(p_name=p_name) + os.sep + self.C_FILE_STATS) as file:
+                stats = { key : file[key] if key in file else None for key in [ 'min', 'max', 'mean', 'std' ] }
+                num_labels = int(file['num_labels'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+        stats['num_labels'] = None if num_labels < 0 else num_labels
+        return stats
 
-        return Instance(feature_data, label_data)
\ No newline at end of file
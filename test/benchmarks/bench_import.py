@@ -0,0 +1,150 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : bench_import.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+Import-time benchmark for the cold start of short-lived processes. Each import statement is 
+executed in a fresh interpreter with option -X importtime. The cumulative import time of the 
+statement and the heaviest imported modules are reported. The minimum of several repetitions is 
+taken to reduce the noise of the file system cache.
+
+All results are written to a JSON file together with the versions of the involved packages, so 
+that releases can be compared. A previous results file can be passed for a comparison.
+
+Usage:
+
+    python test/benchmarks/bench_import.py [--output FILE] [--compare FILE] [--repeats N]
+
+"""
+
+
+import sys
+import json
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+
+from bench_wrappers import get_versions
+
+
+
+
+# Import statements of typical worker processes
+C_STATEMENTS = { 'package'          : 'import mlpro_int_sklearn',
+                 'streams'          : 'from mlpro_int_sklearn.wrappers.streams import WrStreamProviderSklearn',
+                 'streams (root)'   : 'from mlpro_int_sklearn import WrStreamProviderSklearn',
+                 'anomalydetectors' : 'from mlpro_int_sklearn import WrAnomalyDetectorSklearn2MLPro',
+                 'star'             : 'from mlpro_int_sklearn import *' }
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+def measure(p_statement : str) -> dict:
+    """
+    Executes an import statement in a fresh interpreter and parses the output of -X importtime.
+    Returns the total import time and the cumulative time per imported module in microseconds.
+    """
+
+    result = subprocess.run( [ sys.executable, '-X', 'importtime', '-c', p_statement ],
+                             capture_output=True,
+                             text=True,
+                             check=True )
+
+    modules = {}
+    total   = 0
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'): continue
+
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            # Header line
+            continue
+
+        # Only top-level imports without indentation contribute to the total import time
+        if not name.startswith('  '): total += cumulative_us
+        modules[name.strip()] = cumulative_us
+
+    return { 'total' : total, 'modules' : modules }
+
+
+## -------------------------------------------------------------------------------------------------
+def bench_imports(p_repeats : int, p_top : int) -> list:
+
+    results = []
+
+    for name, statement in C_STATEMENTS.items():
+        runs    = [ measure(statement) for r in range(p_repeats) ]
+        best    = min(runs, key=lambda run: run['total'])
+        heavy   = sorted(best['modules'].items(), key=lambda item: item[1], reverse=True)[0:p_top]
+
+        results.append( { 'group'     : 'import',
+                          'name'      : 'import/' + name,
+                          'statement' : statement,
+                          'duration'  : best['total'] / 1e6,
+                          'modules'   : len(best['modules']),
+                          'heaviest'  : heavy } )
+
+        print('{:<40} {:>10.3f} sec {:>6} modules'.format(results[-1]['name'], results[-1]['duration'], results[-1]['modules']))
+
+    return results
+
+
+## -------------------------------------------------------------------------------------------------
+def compare(p_results : list, p_filename : str):
+
+    with open(p_filename, 'r') as file:
+        reference = { r['name'] : r for r in json.load(file)['results'] }
+
+    print('\nComparison with', p_filename, '(import time ratio new/reference):')
+    for result in p_results:
+        try:
+            ratio = result['duration'] / reference[result['name']]['duration']
+        except KeyError:
+            continue
+
+        print('{:<40} {:>8.2f}'.format(result['name'], ratio))
+
+
+## -------------------------------------------------------------------------------------------------
+def main(p_args : list = None):
+
+    parser = argparse.ArgumentParser(description='Import-time benchmark for the MLPro scikit-learn wrappers')
+    parser.add_argument('--output', default='bench_import.json', help='Results file (JSON)')
+    parser.add_argument('--compare', default=None, help='Previous results file for comparison')
+    parser.add_argument('--repeats', type=int, default=5, help='Number of fresh interpreters per statement')
+    parser.add_argument('--top', type=int, default=10, help='Number of heaviest modules reported')
+    args = parser.parse_args(p_args)
+
+    results = bench_imports(p_repeats=args.repeats, p_top=args.top)
+
+    with open(args.output, 'w') as file:
+        json.dump( { 'created'  : datetime.now().isoformat(),
+                     'platform' : platform.platform(),
+                     'versions' : get_versions(),
+                     'results'  : results },
+                   file,
+                   indent=2 )
+
+    print('\nResults written to', args.output)
+
+    if args.compare is not None: compare(p_results=results, p_filename=args.compare)
+
+
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
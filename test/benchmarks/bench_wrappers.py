@@ -0,0 +1,258 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : bench_wrappers.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -- 2026-10-16  1.1.0     DA       Per-instance iteration with instance pool
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-16)
+
+Micro-benchmarks for the hot paths of the scikit-learn wrappers:
+
+- Iteration rate of WrStreamSklearn per dataset, per instance with and without instance pool 
+  (see method WrStreamSklearn.set_instance_pool()) and in batches.
+- Throughput of WrAnomalyDetectorSklearn2MLPro._detect() for the algorithms IF, LOF and EE across
+  engines, instance buffer sizes, detection step rates and dimensions.
+
+All results are written to a JSON file together with the versions of the involved packages, so
+that releases can be compared. A previous results file can be passed for a comparison.
+
+Usage:
+
+    python test/benchmarks/bench_wrappers.py [--output FILE] [--compare FILE] [--quick]
+
+"""
+
+
+import sys
+import json
+import time
+import argparse
+import platform
+import warnings
+from datetime import datetime
+from importlib import metadata
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sklearn.neighbors import LocalOutlierFactor
+from sklearn.covariance import EllipticEnvelope
+
+from mlpro.bf import Log
+from mlpro.bf.math import MSpace, Element
+from mlpro.bf.streams import Feature, Instance
+
+from mlpro_int_sklearn.wrappers.streams import WrStreamProviderSklearn
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+def get_versions() -> dict:
+
+    versions = { 'python' : platform.python_version() }
+
+    for package in [ 'numpy', 'scipy', 'scikit-learn', 'mlpro', 'mlpro-int-scikit-learn' ]:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    return versions
+
+
+## -------------------------------------------------------------------------------------------------
+def bench_streams(p_datasets : list, p_batch_size : int, p_repeats : int) -> list:
+
+    results  = []
+    provider = WrStreamProviderSklearn(p_logging=Log.C_LOG_NOTHING)
+
+    for name in p_datasets:
+        try:
+            stream = provider.get_stream(p_name=name, p_logging=Log.C_LOG_NOTHING)
+            stream.get_feature_space()
+        except Exception as e:
+            print('Dataset', name, 'skipped:', e)
+            continue
+
+        for mode in [ 'instance', 'instance-pooled', 'batch' ]:
+            durations = []
+            stream.set_instance_pool(p_size=1 if mode == 'instance-pooled' else 0)
+
+            for r in range(p_repeats):
+                num_inst = 0
+                tp_start = time.perf_counter()
+
+                if mode != 'batch':
+                    for inst in stream: num_inst += 1
+                else:
+                    for feature_batch, label_batch in stream.iter_batches(p_batch_size=p_batch_size):
+                        num_inst += feature_batch.get_values().shape[0]
+
+                durations.append(time.perf_counter() - tp_start)
+
+            duration = min(durations)
+            results.append( { 'group'     : 'stream',
+                              'name'      : 'WrStreamSklearn/' + name + '/' + mode,
+                              'params'    : { 'dataset' : name, 'mode' : mode, 'batch_size' : p_batch_size if mode == 'batch' else None },
+                              'instances' : num_inst,
+                              'duration'  : duration,
+                              'rate'      : num_inst / duration } )
+
+            print('{:<60} {:>14.0f} inst/sec'.format(results[-1]['name'], results[-1]['rate']))
+
+    return results
+
+
+## -------------------------------------------------------------------------------------------------
+def create_algo(p_algo : str, p_engine : str):
+
+    if p_algo == 'IF':
+        return IsolationForest(n_estimators=50, random_state=1)
+    elif p_algo == 'LOF':
+        return LocalOutlierFactor(n_neighbors=20, novelty=( p_engine == WrAnomalyDetectorSklearn2MLPro.C_ENGINE_NOVELTY ))
+    elif p_algo == 'EE':
+        return EllipticEnvelope(random_state=1)
+
+    raise ValueError('Unknown algorithm ' + p_algo)
+
+
+## -------------------------------------------------------------------------------------------------
+def create_instances(p_num_instances : int, p_num_dim : int) -> list:
+
+    rng           = np.random.default_rng(1)
+    data          = rng.normal(size=(p_num_instances, p_num_dim))
+    feature_space = MSpace()
+    instances     = []
+
+    for i in range(p_num_dim):
+        feature_space.add_dim(Feature(p_name_short='f' + str(i)))
+
+    for i, row in enumerate(data):
+        feature_data = Element(feature_space)
+        feature_data.set_values(row)
+        inst = Instance(feature_data)
+        inst.id = i
+        instances.append(inst)
+
+    return instances
+
+
+## -------------------------------------------------------------------------------------------------
+def bench_detectors( p_algos : list,
+                     p_engines : list,
+                     p_buffer_sizes : list,
+                     p_dims : list,
+                     p_buffer_factor : int ) -> list:
+
+    results = []
+
+    for num_dim in p_dims:
+        for buffer_size in p_buffer_sizes:
+            instances = create_instances(p_num_instances=buffer_size * p_buffer_factor, p_num_dim=num_dim)
+
+            for algo in p_algos:
+                for engine in p_engines:
+                    if engine == WrAnomalyDetectorSklearn2MLPro.C_ENGINE_NOVELTY:
+                        steprates = [ buffer_size ]
+                    else:
+                        steprates = sorted(set([ max(1, buffer_size // 10), buffer_size ]))
+
+                    for steprate in steprates:
+                        detector = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = create_algo(algo, engine),
+                                                                   p_instance_buffer_size = buffer_size,
+                                                                   p_detection_steprate = steprate,
+                                                                   p_refit_steprate = steprate,
+                                                                   p_engine = engine,
+                                                                   p_group_anomaly_det = False,
+                                                                   p_logging = Log.C_LOG_NOTHING )
+
+                        tp_start = time.perf_counter()
+                        for inst in instances: detector._detect(inst)
+                        duration = time.perf_counter() - tp_start
+
+                        results.append( { 'group'     : 'detector',
+                                          'name'      : 'WrAnomalyDetectorSklearn2MLPro/{}/{}/buf={}/step={}/dim={}'.format(algo, engine, buffer_size, steprate, num_dim),
+                                          'params'    : { 'algo' : algo,
+                                                          'engine' : engine,
+                                                          'buffer_size' : buffer_size,
+                                                          'steprate' : steprate,
+                                                          'dim' : num_dim },
+                                          'instances' : len(instances),
+                                          'duration'  : duration,
+                                          'rate'      : len(instances) / duration } )
+
+                        print('{:<60} {:>14.0f} inst/sec'.format(results[-1]['name'], results[-1]['rate']))
+
+    return results
+
+
+## -------------------------------------------------------------------------------------------------
+def compare(p_results : list, p_filename : str):
+
+    with open(p_filename, 'r') as file:
+        reference = { r['name'] : r for r in json.load(file)['results'] }
+
+    print('\nComparison with', p_filename, '(rate ratio new/reference):')
+    for result in p_results:
+        try:
+            ratio = result['rate'] / reference[result['name']]['rate']
+        except KeyError:
+            continue
+
+        print('{:<60} {:>8.2f}'.format(result['name'], ratio))
+
+
+## -------------------------------------------------------------------------------------------------
+def main(p_args : list = None):
+
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for the MLPro scikit-learn wrappers')
+    parser.add_argument('--output', default='bench_results.json', help='Results file (JSON)')
+    parser.add_argument('--compare', default=None, help='Previous results file for comparison')
+    parser.add_argument('--quick', action='store_true', help='Reduced set of configurations')
+    parser.add_argument('--datasets', nargs='*', default=[ 'iris', 'wine', 'breast_cancer', 'diabetes' ])
+    args = parser.parse_args(p_args)
+
+    warnings.filterwarnings('ignore')
+
+    if args.quick:
+        buffer_sizes = [ 50 ]
+        dims         = [ 2 ]
+        repeats      = 1
+    else:
+        buffer_sizes = [ 50, 200, 1000 ]
+        dims         = [ 2, 10 ]
+        repeats      = 3
+
+    results  = bench_streams( p_datasets = args.datasets, p_batch_size = 64, p_repeats = repeats )
+    results += bench_detectors( p_algos = [ 'IF', 'LOF', 'EE' ],
+                                p_engines = [ WrAnomalyDetectorSklearn2MLPro.C_ENGINE_FIT_PREDICT,
+                                              WrAnomalyDetectorSklearn2MLPro.C_ENGINE_NOVELTY ],
+                                p_buffer_sizes = buffer_sizes,
+                                p_dims = dims,
+                                p_buffer_factor = 3 )
+
+    with open(args.output, 'w') as file:
+        json.dump( { 'created'  : datetime.now().isoformat(),
+                     'platform' : platform.platform(),
+                     'versions' : get_versions(),
+                     'results'  : results },
+                   file,
+                   indent=2 )
+
+    print('\nResults written to', args.output)
+
+    if args.compare is not None: compare(p_results=results, p_filename=args.compare)
+
+
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_002_batch_access_to_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -- 2026-10-16  1.1.0     DA       Batch access to a projected and down-cast stream
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-16)
+
+This module demonstrates the batch access to scikit-learn datasets as streams in MLPro. Instead
+of creating an instance object per row, blocks of instances are provided as zero-copy views of
+the underlying data.
+
+You will learn:
+
+1) How to access datasets of the scikit-learn project.
+
+2) How to iterate the instances of a scikit-learn stream in batches.
+
+3) How to mix batch access and per-instance access.
+
+4) How to restrict a stream to a subset of features with a compact data type.
+
+"""
+
+
+from datetime import datetime
+
+import numpy
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    batch_size  = 32
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    batch_size  = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Get a specific stream from the stream provider
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging)
+feature_space = mystream.get_feature_space()
+sk_learn.log(mystream.C_LOG_TYPE_I,"Number of features in the stream:",feature_space.get_num_dim(),'\n\n')
+
+
+# 3 Iterate all instances in batches
+mystream.log(mystream.C_LOG_TYPE_W,'Fetching all instances in batches of', batch_size, 'instances...')
+tp_start = datetime.now()
+num_inst = 0
+
+for i, (feature_batch, label_batch) in enumerate(mystream.iter_batches(p_batch_size=batch_size)):
+    batch_data   = feature_batch.get_values()
+    batch_labels = label_batch.get_values()
+    num_inst    += batch_data.shape[0]
+    mystream.log(mystream.C_LOG_TYPE_I, 'Batch', str(i) + ': \n   Shape:', batch_data.shape, '\n   Labels:', batch_labels[0:14], '...')
+
+tp_end = datetime.now()
+duration = tp_end - tp_start
+duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+rate = num_inst / duration_sec
+mystream.log(Log.C_LOG_TYPE_W, 'Done in', round(duration_sec,3), ' seconds (throughput =', round(rate), 'instances/sec)')
+
+if num_inst != mystream.get_num_instances():
+    raise RuntimeError('Number of instances read in batches differs from the number of stream instances')
+
+
+# 4 Mixing per-instance and batch access
+myiterator    = iter(mystream)
+curr_instance = next(myiterator)
+feature_batch, label_batch = mystream.get_next_batch(p_batch_size=batch_size)
+curr_instance = next(myiterator)
+mystream.log(Log.C_LOG_TYPE_W, 'Id of the instance after one instance and one batch:', curr_instance.id)
+
+
+# 5 Projection to a feature subset with down-casting to float32
+mystream = sk_learn.get_stream( p_name='breast_cancer', 
+                                p_logging=logging, 
+                                p_features=['mean radius', 'mean texture', 'worst area'], 
+                                p_dtype=numpy.float32 )
+
+feature_batch, label_batch = next(mystream.iter_batches(p_batch_size=batch_size))
+mystream.log(Log.C_LOG_TYPE_W, 'Projected batch: shape', feature_batch.get_values().shape, ', dtype', feature_batch.get_values().dtype)
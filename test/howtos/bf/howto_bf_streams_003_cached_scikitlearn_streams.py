@@ -0,0 +1,69 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_003_cached_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the persistent dataset cache of the scikit-learn stream provider. On first
+access, a dataset is converted into a columnar .npy layout in the cache directory. Every further
+replay, even by other stream objects or processes, reads the data memory-mapped from there.
+
+You will learn:
+
+1) How to set up a scikit-learn stream provider with a dataset cache.
+
+2) How a cached dataset is replayed by a fresh stream object.
+
+"""
+
+
+import tempfile
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a temporary cache directory
+cache_dir = tempfile.TemporaryDirectory()
+
+
+for run in range(2):
+
+    # 2 Create a Wrapper for scikit-learn stream provider with a dataset cache
+    sk_learn = WrStreamProviderSklearn(p_cache_dir=cache_dir.name, p_logging=logging)
+    mystream = sk_learn.get_stream( p_name='wine', p_logging=logging)
+
+
+    # 3 Replay all instances of the stream
+    tp_start = datetime.now()
+    num_inst = 0
+
+    for curr_instance in mystream:
+        num_inst += 1
+
+    tp_end = datetime.now()
+    duration = tp_end - tp_start
+    duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+    mystream.log(Log.C_LOG_TYPE_W, 'Run', run, ': replay of', num_inst, 'instances done in', round(duration_sec,3), 'seconds')
+
+
+# 4 Clean up
+cache_dir.cleanup()
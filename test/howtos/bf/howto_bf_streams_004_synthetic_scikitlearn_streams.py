@@ -0,0 +1,78 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_004_synthetic_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates synthetic streams based on the generators sklearn.datasets.make_* of
+scikit-learn. Instances are generated chunk-wise with seeded random states, so that even very long 
+streams only need the memory of one chunk.
+
+You will learn:
+
+1) How to get a synthetic generator stream from the scikit-learn stream provider.
+
+2) How to parameterize the stream and its generator function.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_inst    = 1000000
+    chunk_size  = 10000
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_inst    = 2500
+    chunk_size  = 1000
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Get a synthetic stream of 4 Gaussian blobs in 3 dimensions
+mystream = sk_learn.get_stream( p_name='make_blobs', 
+                                p_logging=logging,
+                                p_num_instances=num_inst,
+                                p_chunk_size=chunk_size,
+                                p_seed=42,
+                                n_features=3,
+                                centers=4 )
+
+feature_space = mystream.get_feature_space()
+sk_learn.log(mystream.C_LOG_TYPE_I,"Number of features in the stream:",feature_space.get_num_dim(),'\n\n')
+
+
+# 3 Generate all instances of the stream
+tp_start = datetime.now()
+inst_count = 0
+
+for curr_instance in mystream:
+    inst_count += 1
+
+tp_end = datetime.now()
+duration = tp_end - tp_start
+duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+rate = inst_count / duration_sec
+mystream.log(Log.C_LOG_TYPE_W, 'Done in', round(duration_sec,3), ' seconds (throughput =', round(rate), 'instances/sec)')
+
+if inst_count != num_inst:
+    raise RuntimeError('Number of generated instances differs from the number of stream instances')
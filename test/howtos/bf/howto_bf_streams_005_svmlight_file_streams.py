@@ -0,0 +1,85 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_005_svmlight_file_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the out-of-core replay of local files in svmlight/libsvm format. The file
+is read in chunks of a fixed number of bytes, so that even files larger than the main memory can be
+streamed.
+
+You will learn:
+
+1) How to export a scikit-learn dataset to a svmlight file.
+
+2) How to replay a svmlight file chunk-wise as a stream with sparse or dense instances.
+
+"""
+
+
+import os
+import tempfile
+from datetime import datetime
+
+from sklearn.datasets import load_breast_cancer, dump_svmlight_file
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    chunk_bytes = 16384
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    chunk_bytes = 4096
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Export a dataset to a temporary svmlight file
+temp_dir = tempfile.TemporaryDirectory()
+path     = os.path.join(temp_dir.name, 'breast_cancer.svm')
+dataset  = load_breast_cancer()
+dump_svmlight_file(dataset.data, dataset.target, path)
+
+
+for dense in [ False, True ]:
+
+    # 2 Create a chunked stream of the svmlight file
+    mystream = WrStreamSvmlightSklearn( p_path=path, 
+                                        p_chunk_bytes=chunk_bytes, 
+                                        p_dense=dense, 
+                                        p_logging=logging )
+
+    metadata = mystream.get_metadata()
+    mystream.log(Log.C_LOG_TYPE_I, 'Shape of the data:', metadata['data_shape'], ', number of chunks:', metadata['num_chunks'])
+
+
+    # 3 Replay all instances of the stream
+    tp_start = datetime.now()
+    num_inst = 0
+
+    for curr_instance in mystream:
+        num_inst += 1
+
+    tp_end = datetime.now()
+    duration = tp_end - tp_start
+    duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+    mystream.log(Log.C_LOG_TYPE_W, 'Dense:', dense, ': replay of', num_inst, 'instances done in', round(duration_sec,3), 'seconds')
+
+    if num_inst != dataset.data.shape[0]:
+        raise RuntimeError('Number of replayed instances differs from the number of dataset instances')
+
+
+# 4 Clean up
+temp_dir.cleanup()
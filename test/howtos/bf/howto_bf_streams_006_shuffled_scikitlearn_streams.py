@@ -0,0 +1,87 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_006_shuffled_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -- 2026-10-16  1.1.0     DA       Shuffled batches of a text dataset
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-16)
+
+This module demonstrates the shuffled replay of scikit-learn datasets. Many datasets are sorted by
+their labels, which distorts online algorithms. In shuffled mode, the rows are read through a
+seeded permutation index, without rearranging the data. Each replay starts a new epoch with its 
+own reproducible permutation.
+
+You will learn:
+
+1) How to get a shuffled stream from the scikit-learn stream provider.
+
+2) How to shuffle block-wise for a local memory access.
+
+3) How to get shuffled batches of a dataset with raw texts, like 20newsgroups.
+
+"""
+
+
+from datetime import datetime
+
+import numpy
+from sklearn.utils import Bunch
+
+from mlpro_int_sklearn import *
+from mlpro_int_sklearn.wrappers.streams import WrStreamSklearn
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Get the iris dataset (sorted by label) as shuffled stream
+mystream = sk_learn.get_stream( p_name='iris', 
+                                p_logging=logging, 
+                                p_shuffle=True, 
+                                p_shuffle_seed=42 )
+
+
+# 3 Replay two epochs
+for epoch in range(2):
+    labels = [ int(inst.get_label_data().get_values()[0]) for inst in mystream ]
+    mystream.log(Log.C_LOG_TYPE_W, 'Epoch', epoch, ': first labels', labels[0:20], '...')
+
+
+# 4 Block-wise shuffling in blocks of 10 instances
+mystream.set_shuffle(p_shuffle=True, p_seed=42, p_block_size=10)
+labels = [ int(inst.get_label_data().get_values()[0]) for inst in mystream ]
+mystream.log(Log.C_LOG_TYPE_W, 'Block-wise: first labels', labels[0:20], '...')
+
+
+# 5 Shuffled batches of raw texts, provided as list like by sklearn.datasets.fetch_20newsgroups()
+texts    = Bunch( data=[ 'Text number ' + str(i) for i in range(100) ],
+                  target=numpy.arange(100) % 4,
+                  DESCR='Raw texts' )
+
+mystream = WrStreamSklearn( p_id='texts', 
+                            p_name='texts', 
+                            p_dataset=texts, 
+                            p_shuffle=True, 
+                            p_shuffle_seed=42, 
+                            p_logging=logging )
+
+feature_batch, label_batch = next(mystream.iter_batches(p_batch_size=8))
+mystream.log(Log.C_LOG_TYPE_W, 'Shuffled texts:', list(feature_batch.get_values()[0:4]), '...')
@@ -0,0 +1,77 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_007_rate_controlled_replay.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -- 2026-10-17  1.1.0     DA       Check of the emission times of the first epoch
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the rate-controlled replay of scikit-learn datasets in real operation
+mode. Instead of emitting instances as fast as possible, the stream follows a replay clock with a
+target rate. The precomputed emission times are assigned as time stamps to the instances.
+
+You will learn:
+
+1) How to set up a replay clock for a scikit-learn stream.
+
+2) How precisely the target rate is met.
+
+"""
+
+
+import time
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log, Mode
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    rate        = 100
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    rate        = 2000
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Get a stream in real operation mode and set up the replay clock
+mystream = sk_learn.get_stream( p_name='wine', p_mode=Mode.C_MODE_REAL, p_logging=logging)
+mystream.set_replay_clock(p_rate=rate)
+
+
+# 3 Replay all instances of the stream
+tp_start = datetime.now()
+num_inst = 0
+tp_emit  = []
+
+for curr_instance in mystream:
+    num_inst += 1
+    tp_emit.append(time.perf_counter())
+
+tp_end = datetime.now()
+duration = tp_end - tp_start
+duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+mystream.log(Log.C_LOG_TYPE_W, 'Replay of', num_inst, 'instances done in', round(duration_sec,3), 'seconds (target rate =', rate, ', actual rate =', round(num_inst / duration_sec), ')')
+mystream.log(Log.C_LOG_TYPE_W, 'Time stamp of the last instance:', curr_instance.tstamp)
+
+
+# 4 The replay clock starts after loading the dataset, so that the first instances of the first
+#   epoch are not emitted at once
+num_check = min(20, num_inst)
+duration_min = ( num_check - 1 ) / rate
+if ( tp_emit[num_check - 1] - tp_emit[0] ) < 0.9 * duration_min:
+    raise RuntimeError('First epoch: instances emitted ahead of the replay clock')
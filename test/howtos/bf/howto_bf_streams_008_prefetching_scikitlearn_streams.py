@@ -0,0 +1,78 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_008_prefetching_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the background prefetching of scikit-learn streams. A producer thread
+creates the next instances in advance and puts them into a bounded queue, while the consumer 
+processes the current ones.
+
+You will learn:
+
+1) How to turn on the prefetching of instances and batches.
+
+2) How prefetching overlaps with the processing of instances.
+
+"""
+
+
+import time
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    depth       = 64
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    depth       = 16
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging)
+
+
+for prefetch_depth in [ 0, depth ]:
+
+    # 2 Turn prefetching on or off
+    mystream.set_prefetch(p_depth=prefetch_depth)
+
+
+    # 3 Replay all instances with a simulated processing time that releases the GIL
+    tp_start = datetime.now()
+    num_inst = 0
+
+    for curr_instance in mystream:
+        time.sleep(0.0001)
+        num_inst += 1
+
+    tp_end = datetime.now()
+    duration = tp_end - tp_start
+    duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+    mystream.log(Log.C_LOG_TYPE_W, 'Prefetch depth', prefetch_depth, ': replay of', num_inst, 'instances done in', round(duration_sec,3), 'seconds')
+
+
+# 4 Prefetching of batches
+mystream.set_prefetch(p_depth=4, p_batch_size=100)
+num_inst = 0
+
+for feature_batch, label_batch in mystream.iter_batches(p_batch_size=100):
+    num_inst += feature_batch.get_values().shape[0]
+
+mystream.log(Log.C_LOG_TYPE_W, 'Prefetched batches with', num_inst, 'instances in total')
@@ -0,0 +1,69 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_009_sharded_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the partitioning of scikit-learn datasets into disjoint shards, e.g. for
+several worker processes consuming the same dataset. Each shard is an index set on the same data.
+
+You will learn:
+
+1) How to get a shard of a dataset from the scikit-learn stream provider.
+
+2) How the partitioning modes 'range', 'stride' and 'hash' distribute the instances.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_shards  = 4
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_shards  = 3
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+for shard_mode in [ 'range', 'stride', 'hash' ]:
+    num_inst = 0
+
+    for shard in range(num_shards):
+
+        # 2 Get one shard of the dataset
+        mystream = sk_learn.get_stream( p_name='wine', 
+                                        p_logging=logging, 
+                                        p_shard=shard, 
+                                        p_num_shards=num_shards,
+                                        p_shard_mode=shard_mode )
+
+        # 3 Replay the instances of the shard
+        shard_inst = 0
+        for curr_instance in mystream:
+            shard_inst += 1
+
+        mystream.log(Log.C_LOG_TYPE_W, 'Mode', shard_mode, ', shard', shard, ':', shard_inst, 'instances')
+        num_inst += shard_inst
+
+    if num_inst != mystream.get_metadata()['num_instances']:
+        raise RuntimeError('The shards do not cover the dataset')
@@ -0,0 +1,76 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_010_export_of_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the bulk export of scikit-learn streams to pandas DataFrames and Arrow 
+record batches. Replay windows can be handed over to analytics code this way without a per-instance
+conversion. The Arrow export requires the optional package pyarrow.
+
+You will learn:
+
+1) How to export a window of a stream to a pandas DataFrame.
+
+2) How to iterate a stream in DataFrames or Arrow record batches.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    batch_size  = 50
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    batch_size  = 100
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+mystream = sk_learn.get_stream( p_name='wine', p_logging=logging)
+
+
+# 2 Export of a replay window to a pandas DataFrame
+frame = mystream.to_dataframe(p_start=10, p_stop=20)
+mystream.log(Log.C_LOG_TYPE_W, 'Window [10,20) as DataFrame:\n', frame.iloc[:, 0:4])
+
+
+# 3 Iteration in DataFrames
+num_inst = 0
+for frame in mystream.iter_dataframes(p_batch_size=batch_size):
+    num_inst += len(frame)
+
+mystream.log(Log.C_LOG_TYPE_W, 'Instances exported in DataFrames:', num_inst)
+
+
+# 4 Iteration in Arrow record batches (optional)
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+if pyarrow is not None:
+    num_inst = 0
+    for record_batch in mystream.iter_record_batches(p_batch_size=batch_size):
+        num_inst += record_batch.num_rows
+
+    mystream.log(Log.C_LOG_TYPE_W, 'Instances exported in Arrow record batches:', num_inst)
+else:
+    mystream.log(Log.C_LOG_TYPE_W, 'Package pyarrow not installed, Arrow export skipped')
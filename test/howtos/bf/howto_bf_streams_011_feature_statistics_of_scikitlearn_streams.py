@@ -0,0 +1,57 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_011_feature_statistics_of_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the feature statistics of scikit-learn streams. Minimum, maximum, mean and
+standard deviation of each feature are computed once when the dataset is loaded. The value ranges
+are set as boundaries of the features, so that they are known before the first instance is read.
+
+You will learn:
+
+1) How to get the feature statistics and the label cardinality of a scikit-learn stream.
+
+2) How to get the value ranges from the boundaries of the feature space.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+mystream = sk_learn.get_stream( p_name='wine', p_logging=logging)
+
+
+# 2 Feature statistics computed at load time
+stats = mystream.get_feature_statistics()
+mystream.log(Log.C_LOG_TYPE_W, 'Number of labels:', stats['num_labels'])
+mystream.log(Log.C_LOG_TYPE_W, 'Mean values of the features:', stats['mean'].round(2))
+mystream.log(Log.C_LOG_TYPE_W, 'Standard deviations of the features:', stats['std'].round(2))
+
+
+# 3 Boundaries of the features
+for feature in mystream.get_feature_space().get_dims():
+    mystream.log(Log.C_LOG_TYPE_I, 'Boundaries of feature', feature.get_name_short() + ':', feature.get_boundaries())
@@ -0,0 +1,86 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_012_resuming_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates random access to scikit-learn streams and the resumption of an 
+interrupted replay. A stream can be moved to any position in constant time. Its replay position
+can be stored as a cursor in a JSON file and restored by a new stream object later, also for 
+shuffled replays.
+
+You will learn:
+
+1) How to move a scikit-learn stream to a specific position.
+
+2) How to store the replay position of a shuffled stream as a cursor.
+
+3) How to resume the replay from a stored cursor.
+
+"""
+
+
+import os
+import json
+import tempfile
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_inst    = 10
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_inst    = 5
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Random access to an instance
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging)
+mystream.seek(p_index=500)
+mystream.log(Log.C_LOG_TYPE_W, 'Id of the instance after seeking position 500:', next(mystream).id)
+
+
+# 3 Replay of a shuffled stream, interrupted after some instances
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging, p_shuffle=True)
+myiterator = iter(mystream)
+for i in range(num_inst): next(myiterator)
+
+cursor_file = os.path.join(tempfile.gettempdir(), 'mlpro_int_sklearn_cursor.json')
+with open(cursor_file, 'w') as file:
+    json.dump(mystream.get_cursor(), file)
+
+mystream.log(Log.C_LOG_TYPE_W, 'Cursor stored:', mystream.get_cursor())
+values_expected = next(myiterator).get_feature_data().get_values()
+
+
+# 4 Resumption of the replay by a new stream object
+with open(cursor_file, 'r') as file:
+    cursor = json.load(file)
+
+os.remove(cursor_file)
+
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging, p_shuffle=True)
+mystream.set_cursor(p_cursor=cursor)
+instance = next(mystream)
+mystream.log(Log.C_LOG_TYPE_W, 'Id of the first instance after resumption:', instance.id)
+
+if ( instance.get_feature_data().get_values() != values_expected ).any():
+    raise RuntimeError('Resumed replay differs from the interrupted replay')
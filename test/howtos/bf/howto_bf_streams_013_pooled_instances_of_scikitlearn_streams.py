@@ -0,0 +1,79 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_013_pooled_instances_of_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the reuse of pre-allocated instances by scikit-learn streams. Instead of 
+creating new instance and element objects for each row, the stream overwrites the instances of a
+pool. In ring mode, an instance is overwritten after a fixed number of further instances. In 
+explicit release mode, the consumer returns the instances to the pool when they are no longer 
+needed.
+
+You will learn:
+
+1) How to iterate a scikit-learn stream with an instance pool in ring mode.
+
+2) How to return instances to the pool in explicit release mode.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_rep     = 100
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_rep     = 2
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging)
+
+
+# 2 Iteration with and without instance pool in ring mode
+for pool_size in [ 0, 1 ]:
+    mystream.set_instance_pool(p_size=pool_size)
+    tp_start = datetime.now()
+    num_inst = 0
+
+    for rep in range(num_rep):
+        for instance in mystream: num_inst += 1
+
+    duration     = datetime.now() - tp_start
+    duration_sec = ( duration.seconds * 1000000 + duration.microseconds + 1 ) / 1000000
+    mystream.log(Log.C_LOG_TYPE_W, 'Pool size', pool_size, ': throughput =', round(num_inst / duration_sec), 'instances/sec')
+
+
+# 3 Explicit release of instances, while the previous instance is kept by the consumer
+mystream.set_instance_pool(p_size=2, p_explicit_release=True)
+inst_prev = None
+
+for instance in mystream:
+    if inst_prev is not None:
+        if instance is inst_prev: 
+            raise RuntimeError('Instance reused before its release')
+
+        mystream.release_instance(p_instance=inst_prev)
+
+    inst_prev = instance
+
+mystream.log(Log.C_LOG_TYPE_W, 'Last instance:', inst_prev.id)
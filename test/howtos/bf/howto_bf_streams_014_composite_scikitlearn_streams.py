@@ -0,0 +1,81 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_014_composite_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates composite streams that mix several scikit-learn streams, e.g. to test 
+anomaly or drift detectors against mixtures of datasets. The source streams are concatenated or
+interleaved on a common feature space.
+
+You will learn:
+
+1) How to concatenate two scikit-learn datasets to one stream.
+
+2) How to interleave a dataset with a synthetic stream at different rates.
+
+3) How to determine the source stream of each instance.
+
+"""
+
+
+from datetime import datetime
+
+import numpy
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+wine     = sk_learn.get_stream( p_name='wine', p_logging=logging)
+cancer   = sk_learn.get_stream( p_name='breast_cancer', p_logging=logging)
+blobs    = sk_learn.get_stream( p_name='make_blobs', p_logging=logging, p_num_instances=200, n_features=4)
+
+
+# 2 Concatenation of wine and breast_cancer on their first four features
+mystream = WrStreamCompositeSklearn( p_streams=[ wine, cancer ],
+                                     p_mix=WrStreamCompositeSklearn.C_MIX_CONCAT,
+                                     p_features=[ 0, 1, 2, 3 ],
+                                     p_logging=logging )
+
+num_inst = len(list(mystream))
+mystream.log(Log.C_LOG_TYPE_W, 'Concatenated instances:', num_inst)
+
+for feature in mystream.get_feature_space().get_dims():
+    mystream.log(Log.C_LOG_TYPE_I, 'Boundaries of feature', feature.get_name_short() + ':', feature.get_boundaries())
+
+
+# 3 Weighted interleaving of wine with a synthetic stream
+mystream = WrStreamCompositeSklearn( p_streams=[ wine, blobs ],
+                                     p_mix=WrStreamCompositeSklearn.C_MIX_WEIGHTED,
+                                     p_weights=[ 1, 3 ],
+                                     p_seed=1,
+                                     p_features=[ 0, 1, 2, 3 ],
+                                     p_logging=logging )
+
+for instance in mystream: pass
+
+
+# 4 Source stream of each instance
+schedule = mystream.get_schedule()
+mystream.log(Log.C_LOG_TYPE_W, 'Source streams of the first 20 instances:', schedule[0:20])
+mystream.log(Log.C_LOG_TYPE_W, 'Number of instances per source stream:', numpy.bincount(schedule))
@@ -0,0 +1,69 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_015_prefetching_scikitlearn_datasets.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the concurrent loading of several scikit-learn datasets by the stream 
+provider. Instead of loading each dataset on the first access of its stream, all datasets are 
+loaded at once in a thread pool. The streams provided afterwards use the loaded data.
+
+You will learn:
+
+1) How to prefetch several datasets concurrently.
+
+2) How to evaluate the timings and failures of the prefetching.
+
+3) How to use the prefetched datasets as streams.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 2 Concurrent loading of several datasets
+report = sk_learn.prefetch( p_names=[ 'iris', 'wine', 'breast_cancer', 'diabetes' ], p_max_workers=4 )
+
+for name, entry in report.items():
+    if entry['error'] is None:
+        sk_learn.log(Log.C_LOG_TYPE_W, 'Dataset', name, 'loaded from', entry['load_source'], 'in', round(entry['duration'], 3), 'seconds')
+    else:
+        sk_learn.log(Log.C_LOG_TYPE_E, 'Dataset', name, 'failed:', entry['error'])
+
+
+# 3 Streams of the prefetched datasets
+for name in report.keys():
+    mystream = sk_learn.get_stream( p_name=name, p_logging=logging)
+    num_inst = 0
+    for instance in mystream: num_inst += 1
+    mystream.log(Log.C_LOG_TYPE_W, 'Instances:', num_inst)
+
+
+# 4 Shard of a prefetched dataset, sharing the loaded data
+mystream = sk_learn.get_stream( p_name='wine', p_logging=logging, p_shard=0, p_num_shards=2 )
+mystream.log(Log.C_LOG_TYPE_W, 'Shard loaded from', mystream.get_metadata()['load_source'], 'with', len(list(mystream)), 'instances')
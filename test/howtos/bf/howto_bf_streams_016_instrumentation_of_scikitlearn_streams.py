@@ -0,0 +1,79 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_016_instrumentation_of_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the instrumentation of scikit-learn streams. While it is turned on, the
+stream counts the emitted instances and bytes and measures the time spent in loading, resetting 
+and fetching instances. This shows where the replay time goes.
+
+You will learn:
+
+1) How to turn on the instrumentation of a scikit-learn stream.
+
+2) How to read a snapshot of the recorded values.
+
+3) How to reset and turn off the instrumentation.
+
+"""
+
+
+from datetime import datetime
+
+from mlpro_int_sklearn import *
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_rep     = 10
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_rep     = 2
+    logging     = Log.C_LOG_NOTHING
+
+
+# 1 Create a Wrapper for scikit-learn stream provider and an instrumented stream
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+mystream = sk_learn.get_stream( p_name='breast_cancer', p_instrumentation=True, p_logging=logging)
+
+
+# 2 Replay per instance and in batches
+for rep in range(num_rep):
+    for instance in mystream: pass
+
+for feature_batch, label_batch in mystream.iter_batches(p_batch_size=64): pass
+
+
+# 3 Snapshot of the recorded values
+instr = mystream.get_instrumentation()
+
+for key, value in instr.items():
+    mystream.log(Log.C_LOG_TYPE_W, key, ':', value)
+
+if instr['instances'] != ( num_rep + 1 ) * mystream.get_num_instances():
+    raise RuntimeError('Number of counted instances differs from the number of replayed instances')
+
+mystream.log( Log.C_LOG_TYPE_W, 
+              'Mean time per instance:', 
+              round(instr['_get_next_duration'] / instr['_get_next_calls'] * 1e6, 2), 
+              'microseconds' )
+
+
+# 4 Reset and turn off the instrumentation
+mystream.reset_instrumentation()
+mystream.log(Log.C_LOG_TYPE_W, 'Instances after reset:', mystream.get_instrumentation()['instances'])
+
+mystream.set_instrumentation(p_enabled=False)
+mystream.log(Log.C_LOG_TYPE_W, 'Instrumentation turned off:', mystream.get_instrumentation() is None)
@@ -0,0 +1,104 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_017_sparse_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the streaming of sparse datasets, like rcv1 or 20newsgroups_vectorized of
+scikit-learn. Rows of a CSR matrix are provided as index/value pairs of their non-zero entries 
+without densifying, the dimensions of the feature space are created on first demand, and sparse 
+multi-label targets are provided as dense indicator vectors. To run without a download, a small 
+sparse dataset with the same structure is built locally and handed over to the stream.
+
+You will learn:
+
+1) How to stream a sparse dataset per instance without densifying its rows.
+
+2) How to access a sparse dataset in batches.
+
+3) How to combine sparse streaming with an instance pool and background prefetching.
+
+"""
+
+
+from datetime import datetime
+
+import numpy
+from scipy import sparse
+from sklearn.utils import Bunch
+
+from mlpro_int_sklearn import *
+from mlpro_int_sklearn.wrappers.streams import WrStreamSklearn
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    num_instances = 10000
+    num_features  = 50000
+    logging       = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    num_instances = 500
+    num_features  = 5000
+    logging       = Log.C_LOG_NOTHING
+
+
+# 1 Local sparse dataset with multi-label targets, structured like rcv1
+data    = sparse.random(num_instances, num_features, density=0.002, format='csr', random_state=1)
+target  = sparse.random(num_instances, 10, density=0.2, format='csr', random_state=2)
+target.data[:] = 1
+dataset = Bunch( data=data, target=target, DESCR='Sparse dataset' )
+
+mystream = WrStreamSklearn( p_id='sparse', p_name='sparse', p_dataset=dataset, p_logging=logging )
+mystream.log( Log.C_LOG_TYPE_W, 
+              'Feature space of type', type(mystream.get_feature_space()).__name__, 
+              'with', mystream.get_feature_space().get_num_dim(), 'dimensions' )
+
+
+# 2 Per-instance access to the non-zero entries
+num_nonzero = 0
+
+for instance in mystream:
+    indices, values = instance.get_feature_data().get_nonzero()
+    num_nonzero    += len(indices)
+
+labels = instance.get_label_data().get_values()
+mystream.log(Log.C_LOG_TYPE_W, 'Non-zero entries:', num_nonzero, ', labels of the last instance:', labels)
+
+if num_nonzero != data.nnz:
+    raise RuntimeError('Number of streamed non-zero entries differs from the dataset')
+
+
+# 3 Batch access
+num_inst = 0
+
+for feature_batch, label_batch in mystream.iter_batches(p_batch_size=64):
+    num_inst += feature_batch.get_values().shape[0]
+
+mystream.log(Log.C_LOG_TYPE_W, 'Instances in batches:', num_inst, ', batch of type', type(feature_batch.get_values()).__name__)
+
+
+# 4 Instance pool and background prefetching
+mystream.set_instance_pool(p_size=1)
+mystream.set_prefetch(p_depth=8)
+num_nonzero_pooled = 0
+
+for instance in mystream:
+    indices, values     = instance.get_feature_data().get_nonzero()
+    num_nonzero_pooled += len(indices)
+
+mystream.set_prefetch(p_depth=0)
+mystream.log(Log.C_LOG_TYPE_W, 'Non-zero entries with instance pool and prefetching:', num_nonzero_pooled)
+
+if num_nonzero_pooled != num_nonzero:
+    raise RuntimeError('Pooled and prefetched replay differs from the plain replay')
@@ -0,0 +1,76 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_bf_streams_018_lazy_import_of_scikitlearn_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-17  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module demonstrates the lazy import of the scikit-learn wrappers. Public names of the package
+are resolved on first access, which imports only the submodule providing them. Scikit-learn itself
+is imported on first use of a dataset or generator, so that listing the available streams stays 
+fast.
+
+You will learn:
+
+1) Which modules are imported when listing the streams of the scikit-learn stream provider.
+
+2) How the public names of the package are related to its submodules.
+
+"""
+
+
+import importlib
+import subprocess
+import sys
+from datetime import datetime
+
+import mlpro_int_sklearn
+from mlpro_int_sklearn import wrappers, WrStreamProviderSklearn
+from mlpro.bf import Log
+
+
+
+
+## 0 Prepare Demo/Unit test mode
+if __name__ == '__main__':
+    logging     = Log.C_LOG_ALL
+else:
+    print('\n', datetime.now(), __file__)
+    logging     = Log.C_LOG_NOTHING
+
+sk_learn = WrStreamProviderSklearn(p_logging=logging)
+
+
+# 1 List the streams of the provider in a fresh interpreter and determine the imported modules
+#   of scikit-learn
+code = ( 'import sys\n'
+         'from mlpro.bf import Log\n'
+         'from mlpro_int_sklearn import WrStreamProviderSklearn\n'
+         'provider = WrStreamProviderSklearn(p_logging=Log.C_LOG_NOTHING)\n'
+         'streams  = provider.get_stream_list(p_logging=Log.C_LOG_NOTHING)\n'
+         'print(len(streams), "sklearn.datasets" in sys.modules)\n' )
+
+result = subprocess.run( [ sys.executable, '-c', code ], capture_output=True, text=True, check=True )
+num_streams, datasets_imported = result.stdout.split()[-2:]
+sk_learn.log(Log.C_LOG_TYPE_W, 'Streams listed:', num_streams, '/ sklearn.datasets imported:', datasets_imported)
+
+if datasets_imported != 'False':
+    raise RuntimeError('Listing the streams imports sklearn.datasets')
+
+
+# 2 Each public name of the package is provided by exactly the submodule it is assigned to
+for submodule, names in wrappers._exports.items():
+    module = importlib.import_module(wrappers.__name__ + '.' + submodule)
+    sk_learn.log(Log.C_LOG_TYPE_W, 'Submodule', module.__name__, 'provides', module.__all__)
+
+    if set(names) != set(module.__all__):
+        raise RuntimeError('Public names of submodule "' + submodule + '" differ from the package exports')
+
+if set(mlpro_int_sklearn.__all__) != set(wrappers.__all__):
+    raise RuntimeError('Public names of the package differ from the sub-package wrappers')
@@ -0,0 +1,208 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_oa_ad_031_lof_novelty_pa_1d.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -- 2026-10-17  1.1.0     DA       Check of detections against a detector fitted on buffer copies
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the use of anomaly detector based on local outlier factor algorithm with
+MLPro, using the novelty engine of the wrapper. Instead of a complete retraining at each detection
+step, the detector is refitted periodically on the instance buffer and scores each incoming
+instance in between. To this regard, a stream of a stream provider is combined with a stream
+workflow to a stream scenario. The workflow consists of a standard task 'Anomaly Detector'.
+
+You will learn:
+
+1) How to set up a stream workflow based on stream tasks.
+
+2) How to set up a stream scenario based on a stream and a processing stream workflow.
+
+3) How to add a task anomalydetector.
+
+4) How to reuse an anomaly detector algorithm from scikitlearn (https://scikit-learn.org/) in
+novelty mode, specifically Local Outlier Factor
+
+"""
+
+from sklearn.neighbors import LocalOutlierFactor as LOF
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.streams.streams import StreamMLProPOutliers
+from mlpro.oa.streams import OAStreamScenario, OAStreamWorkflow
+
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ADScenarioLOFNovelty (OAStreamScenario):
+
+    C_NAME = 'Scikit-learn Local Outlier Factor (novelty)'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup( self,
+                p_mode,
+                p_ada: bool,
+                p_visualize: bool,
+                p_logging,
+                p_n_neighbors: int = 20,
+                p_contamination: float = 0.01,
+                p_anomaly_buffer_size: int = 100,
+                p_instance_buffer_size: int = 50,
+                p_refit_steprate: int = 50 ):
+
+        # 1 Get the native stream from MLPro stream provider
+        mystream = StreamMLProPOutliers( p_functions = ['sin' ],
+                                         p_outlier_rate=0.02,
+                                         p_seed = 1,
+                                         p_logging=p_logging )
+
+        # 2 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='wf1',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+        # 3 Instantiation of Scikit-learn 'Local Outlier Factor' anomaly detector in novelty mode
+        scikit_learn_lof = LOF( n_neighbors= p_n_neighbors,
+                                contamination= p_contamination,
+                                novelty= True )
+
+        # 4 Wrapping of the Scikit-learn algorithm and integration into the stream workflow
+        self.anomalydetector = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = scikit_learn_lof,
+                                                               p_anomaly_buffer_size = p_anomaly_buffer_size,
+                                                               p_instance_buffer_size = p_instance_buffer_size,
+                                                               p_group_anomaly_det = False,
+                                                               p_engine = WrAnomalyDetectorSklearn2MLPro.C_ENGINE_NOVELTY,
+                                                               p_refit_steprate = p_refit_steprate,
+                                                               p_visualize = p_visualize,
+                                                               p_logging = p_logging )
+
+        workflow.add_task( p_task=self.anomalydetector )
+
+        # 5 Return stream and workflow
+        return mystream, workflow
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit             = 500
+    logging                 = Log.C_LOG_ALL
+    step_rate               = 1
+    n_neighbours            = 20
+    contamination           = 0.01
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 50
+    refit_steprate          = 50
+
+    cycle_limit             = int(input(f'\nCycle limit (press ENTER for {cycle_limit}): ') or cycle_limit)
+    visualize               = input('Visualization Y/N (press ENTER for Y): ').upper() != 'N'
+    if visualize:
+        i = input(f'Visualization step rate (press ENTER for {step_rate}): ')
+        if i != '': step_rate = int(i)
+
+        i = input('Log level: "A"=All, "W"=Warnings only, "N"=Nothing (press ENTER for "W"): ').upper()
+        if i == 'A': logging = Log.C_LOG_ALL
+        elif i == 'N': logging = Log.C_LOG_NOTHING
+
+    n_neighbours            = int(input(f'Algo LOF: Number of neighbours (press ENTER for {n_neighbours}): ') or n_neighbours)
+    contamination           = float(input(f'Algo LOF: Contamination (press ENTER for {contamination}): ') or contamination)
+    anomaly_buffer_size     = int(input(f'MLPro Wrapper: Anomaly buffer size (press ENTER for {anomaly_buffer_size}): ') or anomaly_buffer_size)
+    instance_buffer_size    = int(input(f'MLPro Wrapper: Instance buffer size (press ENTER for {instance_buffer_size}): ') or instance_buffer_size)
+    refit_steprate          = int(input(f'MLPro Wrapper: Refit steprate (press ENTER for {refit_steprate}): ') or refit_steprate)
+
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit             = 40
+    logging                 = Log.C_LOG_NOTHING
+    visualize               = False
+    step_rate               = 1
+    n_neighbours            = 5
+    contamination           = 0.01
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 10
+    refit_steprate          = 10
+
+
+# 2 Instantiate the stream scenario
+myscenario = ADScenarioLOFNovelty( p_mode = Mode.C_MODE_REAL,
+                                   p_cycle_limit = cycle_limit,
+                                   p_visualize = visualize,
+                                   p_logging = logging,
+                                   p_n_neighbors = n_neighbours,
+                                   p_contamination = contamination,
+                                   p_anomaly_buffer_size = anomaly_buffer_size,
+                                   p_instance_buffer_size = instance_buffer_size,
+                                   p_refit_steprate = refit_steprate )
+
+if visualize:
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_view_autoselect = True,
+                                                        p_step_rate = step_rate ) )
+
+
+# 3 Reset and run own stream scenario
+myscenario.reset()
+
+if __name__ == '__main__':
+    input('Press ENTER to start stream processing...')
+
+myscenario.run()
+
+
+# 4 Replay of the novelty engine with a detector fitted on copies of the instance buffer. Since the
+#   fitted detector keeps its training data, later updates of the buffer must not affect it.
+stream = StreamMLProPOutliers( p_functions = ['sin' ], 
+                               p_outlier_rate=0.02, 
+                               p_seed = 1, 
+                               p_logging=Log.C_LOG_NOTHING )
+reference_lof = LOF( n_neighbors= n_neighbours, contamination= contamination, novelty= True )
+buffer        = None
+fitted        = False
+counter       = 0
+reference_ids = []
+
+for cycle, instance in enumerate(stream):
+    if cycle == cycle_limit: break
+
+    values = np.asarray(instance.get_feature_data().get_values(), dtype=np.float64)
+    if buffer is None: buffer = np.empty((instance_buffer_size, values.size))
+    buffer[cycle % instance_buffer_size] = values
+
+    if fitted and ( reference_lof.decision_function(values.reshape(1,-1))[0] < 0 ):
+        reference_ids.append(instance.id)
+
+    if cycle + 1 < instance_buffer_size: continue
+    if fitted:
+        counter = ( counter + 1 ) % refit_steprate
+        if counter != 0: continue
+
+    reference_lof.fit(buffer.copy())
+    fitted = True
+
+detected_ids = sorted( anomaly.instances[0].id for anomaly in myscenario.anomalydetector.anomalies.values() )
+myscenario.log( Log.C_LOG_TYPE_W, 'Anomalies detected:', len(detected_ids), '/ reference:', len(reference_ids) )
+
+if detected_ids != sorted(reference_ids):
+    raise RuntimeError('Detections differ from a detector fitted on copies of the instance buffer')
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')
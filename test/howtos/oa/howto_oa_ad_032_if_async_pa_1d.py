@@ -0,0 +1,182 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_oa_ad_032_if_async_pa_1d.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the asynchronous execution of an anomaly detector based on the isolation
+forest algorithm with MLPro. At each detection step, a snapshot of the instance buffer is fitted 
+and scored in a thread pool, while the stream processing continues. The related anomalies are 
+raised in submission order as soon as the results are available. To this regard, a stream of a 
+stream provider is combined with a stream workflow to a stream scenario. The workflow consists of
+a standard task 'Anomaly Detector'.
+
+You will learn:
+
+1) How to set up a stream scenario with an anomaly detector of scikit-learn.
+
+2) How to execute the detections of the anomaly detector asynchronously in a thread pool.
+
+3) How to wait for the pending detections at the end of the stream.
+
+"""
+
+from sklearn.ensemble import IsolationForest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.streams.streams import StreamMLProPOutliers
+from mlpro.oa.streams import OAStreamScenario, OAStreamWorkflow
+
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ADScenarioIFAsync (OAStreamScenario):
+
+    C_NAME = 'Scikit-learn Isolation Forest (asynchronous)'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup( self,
+                p_mode,
+                p_ada: bool,
+                p_visualize: bool,
+                p_logging,
+                p_detection_range = WrAnomalyDetectorSklearn2MLPro.C_RANGE_THREAD,
+                p_max_pending: int = 2,
+                p_anomaly_buffer_size: int = 100,
+                p_instance_buffer_size: int = 50,
+                p_detection_steprate: int = 10 ):
+
+        # 1 Get the native stream from MLPro stream provider
+        mystream = StreamMLProPOutliers( p_functions = ['sin' ],
+                                         p_outlier_rate=0.02,
+                                         p_seed = 1,
+                                         p_logging=p_logging )
+
+        # 2 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='wf1',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+        # 3 Wrapping of the Scikit-learn 'Isolation Forest' with asynchronous detection
+        self.anomalydetector = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = IsolationForest(contamination=0.05, random_state=1),
+                                                               p_anomaly_buffer_size = p_anomaly_buffer_size,
+                                                               p_instance_buffer_size = p_instance_buffer_size,
+                                                               p_detection_steprate = p_detection_steprate,
+                                                               p_group_anomaly_det = False,
+                                                               p_detection_range = p_detection_range,
+                                                               p_max_pending = p_max_pending,
+                                                               p_visualize = p_visualize,
+                                                               p_logging = p_logging )
+
+        workflow.add_task( p_task=self.anomalydetector )
+
+        # 4 Return stream and workflow
+        return mystream, workflow
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit             = 500
+    logging                 = Log.C_LOG_ALL
+    step_rate               = 1
+    max_pending             = 2
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 50
+    detection_steprate      = 10
+
+    cycle_limit             = int(input(f'\nCycle limit (press ENTER for {cycle_limit}): ') or cycle_limit)
+    visualize               = input('Visualization Y/N (press ENTER for Y): ').upper() != 'N'
+    if visualize:
+        i = input(f'Visualization step rate (press ENTER for {step_rate}): ')
+        if i != '': step_rate = int(i)
+
+        i = input('Log level: "A"=All, "W"=Warnings only, "N"=Nothing (press ENTER for "W"): ').upper()
+        if i == 'A': logging = Log.C_LOG_ALL
+        elif i == 'N': logging = Log.C_LOG_NOTHING
+
+    max_pending             = int(input(f'MLPro Wrapper: Maximum number of pending detections (press ENTER for {max_pending}): ') or max_pending)
+    anomaly_buffer_size     = int(input(f'MLPro Wrapper: Anomaly buffer size (press ENTER for {anomaly_buffer_size}): ') or anomaly_buffer_size)
+    instance_buffer_size    = int(input(f'MLPro Wrapper: Instance buffer size (press ENTER for {instance_buffer_size}): ') or instance_buffer_size)
+    detection_steprate      = int(input(f'MLPro Wrapper: Detection steprate (press ENTER for {detection_steprate}): ') or detection_steprate)
+
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit             = 60
+    logging                 = Log.C_LOG_NOTHING
+    visualize               = False
+    step_rate               = 1
+    max_pending             = 2
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 20
+    detection_steprate      = 5
+
+
+# 2 Instantiate the stream scenarios with asynchronous and synchronous detection
+scenarios = {}
+
+for detection_range in [ WrAnomalyDetectorSklearn2MLPro.C_RANGE_THREAD, WrAnomalyDetectorSklearn2MLPro.C_RANGE_NONE ]:
+    scenarios[detection_range] = ADScenarioIFAsync( p_mode = Mode.C_MODE_REAL,
+                                                    p_cycle_limit = cycle_limit,
+                                                    p_visualize = visualize and ( detection_range != WrAnomalyDetectorSklearn2MLPro.C_RANGE_NONE ),
+                                                    p_logging = logging,
+                                                    p_detection_range = detection_range,
+                                                    p_max_pending = max_pending,
+                                                    p_anomaly_buffer_size = anomaly_buffer_size,
+                                                    p_instance_buffer_size = instance_buffer_size,
+                                                    p_detection_steprate = detection_steprate )
+
+myscenario = scenarios[WrAnomalyDetectorSklearn2MLPro.C_RANGE_THREAD]
+
+if visualize:
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_view_autoselect = True,
+                                                        p_step_rate = step_rate ) )
+
+
+# 3 Reset and run the stream scenario with asynchronous detection
+myscenario.reset()
+
+if __name__ == '__main__':
+    input('Press ENTER to start stream processing...')
+
+myscenario.run()
+
+
+# 4 Wait for the pending detections at the end of the stream and shut down the thread pool
+myscenario.anomalydetector.flush_detections()
+
+
+# 5 The asynchronous detection raises the same anomalies as the synchronous one
+scenarios[WrAnomalyDetectorSklearn2MLPro.C_RANGE_NONE].reset()
+scenarios[WrAnomalyDetectorSklearn2MLPro.C_RANGE_NONE].run()
+
+anomalies = { detection_range : sorted([ anomaly.instances[0].id for anomaly in scenario.anomalydetector.anomalies.values() ])
+              for detection_range, scenario in scenarios.items() }
+
+myscenario.log(Log.C_LOG_TYPE_W, 'Anomalous instances:', anomalies[WrAnomalyDetectorSklearn2MLPro.C_RANGE_THREAD])
+
+if anomalies[WrAnomalyDetectorSklearn2MLPro.C_RANGE_THREAD] != anomalies[WrAnomalyDetectorSklearn2MLPro.C_RANGE_NONE]:
+    raise RuntimeError('Asynchronous and synchronous detection differ')
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')
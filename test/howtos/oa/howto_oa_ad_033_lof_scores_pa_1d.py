@@ -0,0 +1,158 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro_int_scikit_learn
+## -- Module  : howto_oa_ad_033_lof_scores_pa_1d.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation and first release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the anomaly scores of an anomaly detector based on the local outlier 
+factor algorithm with MLPro. Each raised point anomaly carries the score determined in the same
+fit as the label. Optionally, anomalies are determined by a threshold on the scores, which allows
+to tune the sensitivity without refitting. To this regard, a stream of a stream provider is 
+combined with a stream workflow to a stream scenario. The workflow consists of a standard task 
+'Anomaly Detector'.
+
+You will learn:
+
+1) How to read the anomaly score of a raised point anomaly.
+
+2) How to determine anomalies by a threshold on the anomaly scores.
+
+3) That threshold 0 is equivalent to the labels of the scikit-learn detector.
+
+"""
+
+from sklearn.neighbors import LocalOutlierFactor as LOF
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams.streams import StreamMLProPOutliers
+from mlpro.oa.streams import OAStreamScenario, OAStreamWorkflow
+
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ADScenarioLOFScores (OAStreamScenario):
+
+    C_NAME = 'Scikit-learn Local Outlier Factor (scores)'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup( self,
+                p_mode,
+                p_ada: bool,
+                p_visualize: bool,
+                p_logging,
+                p_score_threshold: float = None,
+                p_n_neighbors: int = 20,
+                p_anomaly_buffer_size: int = 100,
+                p_instance_buffer_size: int = 50,
+                p_detection_steprate: int = 50 ):
+
+        # 1 Get the native stream from MLPro stream provider
+        mystream = StreamMLProPOutliers( p_functions = ['sin' ],
+                                         p_outlier_rate=0.02,
+                                         p_seed = 1,
+                                         p_logging=p_logging )
+
+        # 2 Creation of a workflow
+        workflow = OAStreamWorkflow( p_name='wf1',
+                                     p_range_max=OAStreamWorkflow.C_RANGE_NONE,
+                                     p_ada=p_ada,
+                                     p_visualize=p_visualize,
+                                     p_logging=p_logging )
+
+        # 3 Wrapping of the Scikit-learn 'Local Outlier Factor' with an optional score threshold
+        self.anomalydetector = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = LOF(n_neighbors=p_n_neighbors),
+                                                               p_anomaly_buffer_size = p_anomaly_buffer_size,
+                                                               p_instance_buffer_size = p_instance_buffer_size,
+                                                               p_detection_steprate = p_detection_steprate,
+                                                               p_group_anomaly_det = False,
+                                                               p_score_threshold = p_score_threshold,
+                                                               p_visualize = p_visualize,
+                                                               p_logging = p_logging )
+
+        workflow.add_task( p_task=self.anomalydetector )
+
+        # 4 Return stream and workflow
+        return mystream, workflow
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit             = 500
+    logging                 = Log.C_LOG_WE
+    n_neighbours            = 20
+    score_threshold         = -0.5
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 50
+    detection_steprate      = 50
+
+    cycle_limit             = int(input(f'\nCycle limit (press ENTER for {cycle_limit}): ') or cycle_limit)
+    n_neighbours            = int(input(f'Algo LOF: Number of neighbours (press ENTER for {n_neighbours}): ') or n_neighbours)
+    score_threshold         = float(input(f'MLPro Wrapper: Score threshold (press ENTER for {score_threshold}): ') or score_threshold)
+
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit             = 100
+    logging                 = Log.C_LOG_NOTHING
+    n_neighbours            = 5
+    score_threshold         = -0.5
+    anomaly_buffer_size     = 100
+    instance_buffer_size    = 20
+    detection_steprate      = 20
+
+
+# 2 Run the stream scenario with the labels of the detector, threshold 0 and a custom threshold
+anomalies = {}
+
+for threshold in [ None, 0.0, score_threshold ]:
+    myscenario = ADScenarioLOFScores( p_mode = Mode.C_MODE_REAL,
+                                      p_cycle_limit = cycle_limit,
+                                      p_visualize = False,
+                                      p_logging = logging,
+                                      p_score_threshold = threshold,
+                                      p_n_neighbors = n_neighbours,
+                                      p_anomaly_buffer_size = anomaly_buffer_size,
+                                      p_instance_buffer_size = instance_buffer_size,
+                                      p_detection_steprate = detection_steprate )
+    myscenario.reset()
+    myscenario.run()
+
+    # 2.1 Each raised anomaly carries its score
+    anomalies[threshold] = { anomaly.instances[0].id : anomaly.kwargs['p_score'] for anomaly in myscenario.anomalydetector.anomalies.values() }
+
+    myscenario.log( Log.C_LOG_TYPE_W, 
+                    'Threshold', threshold, ':', len(anomalies[threshold]), 'anomalies with scores', 
+                    [ round(float(score), 3) for score in anomalies[threshold].values() ] )
+
+
+# 3 Threshold 0 leaves the labels unchanged, a lower threshold raises a subset of the anomalies
+if any(score >= 0 for score in anomalies[None].values()):
+    raise RuntimeError('Labels of the detector inconsistent with the scores')
+
+if sorted(anomalies[None].items()) != sorted(anomalies[0.0].items()):
+    raise RuntimeError('Threshold 0 differs from the labels of the detector')
+
+if not set(anomalies[score_threshold]).issubset(anomalies[None]):
+    raise RuntimeError('Lower threshold raises additional anomalies')
+
+if any(score >= score_threshold for score in anomalies[score_threshold].values()):
+    raise RuntimeError('Anomaly raised with a score above the threshold')
+
+if __name__ == '__main__':
+    input('Press ENTER to exit...')